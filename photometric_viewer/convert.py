@@ -0,0 +1,133 @@
+import argparse
+import functools
+import io
+import sys
+from pathlib import Path
+from typing import Dict, Tuple, FrozenSet
+
+from photometric_viewer.formats import binary, csv, format_json, ies, ldt
+from photometric_viewer.formats.common import import_from_string
+from photometric_viewer.model.luminaire import Luminaire
+from photometric_viewer.utils.batch import BatchItem, find_photometric_files, run_batch, format_summary
+from photometric_viewer.utils.ioutil import decode_contents
+from photometric_viewer.utils.project import export_tool_keywords
+from photometric_viewer.utils.resampling import resample_to_steps
+
+FILE_EXTENSIONS = {
+    "ldt": ".ldt",
+    "ies": ".ies",
+    "json": ".json",
+    "csv": ".csv",
+    "pvb": binary.FILE_EXTENSION,
+}
+
+
+def export_luminaire(luminaire: Luminaire, file_format: str, ies_keywords: Dict[str, str]) -> str | bytes:
+    match file_format:
+        case "ldt":
+            with io.StringIO() as f:
+                ldt.export_to_file(f, luminaire)
+                return f.getvalue()
+        case "ies":
+            with io.StringIO() as f:
+                ies.export_to_file(f, luminaire, ies_keywords)
+                return f.getvalue()
+        case "json":
+            return format_json.export_photometry(luminaire)
+        case "csv":
+            return csv.export_photometry(luminaire)
+        case "pvb":
+            return binary.export_photometry(luminaire)
+        case _:
+            raise ValueError(f"Unsupported file format: {file_format}")
+
+
+def target_path(item: BatchItem, output_dir: Path | None, file_format: str) -> Path:
+    if output_dir is None:
+        return item.path.with_suffix(FILE_EXTENSIONS[file_format])
+    return (output_dir / item.relative_path).with_suffix(FILE_EXTENSIONS[file_format])
+
+
+def convert_file(
+        item: BatchItem,
+        file_format: str,
+        output_dir: Path | None,
+        ies_keywords: Dict[str, str],
+        grid: Tuple[float, float] | None = None,
+        preserve_flux: bool = False,
+        input_paths: FrozenSet[Path] = frozenset(),
+        overwrite: bool = False
+) -> bool:
+    """
+    Converts a single file. Files whose target is the source itself or another input of the batch
+    (given as resolved input_paths) are skipped unless overwrite is set
+    """
+    target = target_path(item, output_dir, file_format)
+    if not overwrite and (target.resolve() == item.path.resolve() or target.resolve() in input_paths):
+        return False
+
+    luminaire = import_from_string(decode_contents(item.path.read_bytes()))
+    if grid is not None:
+        luminaire = resample_to_steps(luminaire, grid, preserve_flux)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    data = export_luminaire(luminaire, file_format, ies_keywords)
+    if isinstance(data, bytes):
+        target.write_bytes(data)
+    else:
+        target.write_text(data, encoding="utf-8", newline="")
+    return True
+
+
+def _grid(value: str) -> Tuple[float, float]:
+    try:
+        c_step, gamma_step = (float(step) for step in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected steps of C and gamma angles, e.g. 15x5, got: {value}")
+    if c_step <= 0 or gamma_step <= 0:
+        raise argparse.ArgumentTypeError(f"Angle steps must be greater than 0, got: {value}")
+    return c_step, gamma_step
+
+
+def _parse_args(args):
+    parser = argparse.ArgumentParser(
+        prog="photometric-viewer-convert",
+        description="Convert IES and LDT photometric files"
+    )
+    parser.add_argument("paths", nargs="+", help="Photometric files, directories or glob patterns")
+    parser.add_argument("-t", "--to", dest="file_format", required=True, choices=FILE_EXTENSIONS.keys(),
+                        help="Target file format")
+    parser.add_argument("-o", "--output-dir", type=Path,
+                        help="Directory for converted files. By default files are written next to their sources")
+    parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes. Defaults to the number of CPUs")
+    parser.add_argument("-g", "--grid", type=_grid,
+                        help="Resample intensities to steps of C and gamma angles in degrees, e.g. 15x5 or 1x1")
+    parser.add_argument("--preserve-flux", action="store_true",
+                        help="Rescale resampled intensities to the luminous flux of the original ones")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="Write converted files even if they replace source files of the conversion")
+    return parser.parse_args(args)
+
+
+def run(args=None):
+    arguments = _parse_args(args if args is not None else sys.argv[1:])
+    items = find_photometric_files(arguments.paths)
+
+    task = functools.partial(
+        convert_file,
+        file_format=arguments.file_format,
+        output_dir=arguments.output_dir,
+        ies_keywords=export_tool_keywords(),
+        grid=arguments.grid,
+        preserve_flux=arguments.preserve_flux,
+        input_paths=frozenset(item.path.resolve() for item in items),
+        overwrite=arguments.overwrite
+    )
+    summary = run_batch(task, items, jobs=arguments.jobs)
+
+    print(format_summary(summary, "Converted"))
+    sys.exit(1 if summary.failures else 0)
+
+
+if __name__ == "__main__":
+    run()
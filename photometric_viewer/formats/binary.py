@@ -0,0 +1,192 @@
+"""
+Compact binary container for luminaires.
+
+A file consists of a fixed header, metadata encoded as UTF-8 JSON and the angle axes and intensity grid
+as little-endian float64 arrays. Arrays are aligned to 8 bytes, so they can be used directly from a
+memory-mapped file without copying or parsing:
+
+    header       magic, format version, lengths of c_planes, gamma_angles, grid C and gamma axes, metadata
+    metadata     JSON, padded to a multiple of 8 bytes
+    c_planes     float64[n_c_planes]
+    gamma_angles float64[n_gamma_angles]
+    grid_c       float64[n_grid_c]
+    grid_gamma   float64[n_grid_gamma]
+    values       float64[n_grid_c * n_grid_gamma], row by row, NaN where values are missing
+"""
+import dataclasses
+import json
+import mmap
+import struct
+import sys
+from array import array
+from enum import Enum
+from os import PathLike
+from typing import Any, Dict
+
+from photometric_viewer.formats.exceptions import InvalidPhotometricFileFormatException
+from photometric_viewer.model.intensities import IntensityGrid
+from photometric_viewer.model.luminaire import Luminaire, LuminousOpeningGeometry, LuminaireGeometry, Lamps, \
+    PhotometryMetadata, LuminairePhotometricProperties, Calculable, LuminousOpeningShape, Shape, LuminaireType, \
+    Symmetry, FileFormat
+from photometric_viewer.model.units import LengthUnits
+
+MAGIC = b"PVLUMBIN"
+FORMAT_VERSION = 1
+FILE_EXTENSION = ".pvb"
+
+_HEADER = struct.Struct("<8sHHIIIII")
+_ALIGNMENT = 8
+
+
+def is_binary(contents: bytes) -> bool:
+    return contents[:len(MAGIC)] == MAGIC
+
+
+def _padding(length: int) -> int:
+    return -length % _ALIGNMENT
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.name
+    if dataclasses.is_dataclass(value):
+        return {f.name: _encode(getattr(value, f.name)) for f in dataclasses.fields(value) if f.init}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _enum(enum_type, name: str | None):
+    return enum_type[name] if name is not None else None
+
+
+def _encode_metadata(luminaire: Luminaire) -> bytes:
+    metadata = _encode(dataclasses.replace(luminaire.metadata, file_source=None))
+    # JSON objects only have string keys
+    metadata["direct_ratios_for_room_indices"] = list(luminaire.metadata.direct_ratios_for_room_indices.items())
+
+    data = {
+        "luminous_opening_geometry": _encode(luminaire.luminous_opening_geometry),
+        "geometry": _encode(luminaire.geometry),
+        "lamps": _encode(luminaire.lamps),
+        "metadata": metadata,
+        "photometry": _encode(luminaire.photometry),
+    }
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_metadata(data: Dict[str, Any]) -> Dict[str, Any]:
+    opening = data["luminous_opening_geometry"]
+    geometry = data["geometry"]
+    metadata = data["metadata"]
+    photometry = data["photometry"]
+
+    return dict(
+        luminous_opening_geometry=LuminousOpeningGeometry(
+            **opening | {"shape": _enum(LuminousOpeningShape, opening["shape"])}
+        ) if opening else None,
+        geometry=LuminaireGeometry(**geometry | {"shape": _enum(Shape, geometry["shape"])}) if geometry else None,
+        lamps=[Lamps(**lamps) for lamps in data["lamps"]],
+        metadata=PhotometryMetadata(**metadata | {
+            "file_units": LengthUnits[metadata["file_units"]],
+            "luminaire_type": _enum(LuminaireType, metadata["luminaire_type"]),
+            "symmetry": Symmetry[metadata["symmetry"]],
+            "file_format": _enum(FileFormat, metadata["file_format"]),
+            "direct_ratios_for_room_indices": dict(metadata["direct_ratios_for_room_indices"]),
+        }),
+        photometry=LuminairePhotometricProperties(
+            is_absolute=photometry["is_absolute"],
+            luminous_flux=Calculable(**photometry["luminous_flux"]),
+            efficacy=Calculable(**photometry["efficacy"]),
+            lor=Calculable(**photometry["lor"]),
+            dff=Calculable(**photometry["dff"]),
+        )
+    )
+
+
+def _float_array(values) -> bytes:
+    data = array("d", values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def export_photometry(luminaire: Luminaire) -> bytes:
+    grid = luminaire.intensity_values
+    metadata = _encode_metadata(luminaire)
+
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        len(luminaire.c_planes),
+        len(luminaire.gamma_angles),
+        len(grid.c_angles),
+        len(grid.gamma_angles),
+        len(metadata)
+    )
+    return b"".join([
+        header,
+        b"\0" * _padding(len(header)),
+        metadata,
+        b"\0" * _padding(len(metadata)),
+        _float_array(luminaire.c_planes),
+        _float_array(luminaire.gamma_angles),
+        _float_array(grid.c_angles),
+        _float_array(grid.gamma_angles),
+        _float_array(grid.dense_values()),
+    ])
+
+
+def _doubles(buffer: memoryview, offset: int, count: int) -> memoryview | array:
+    data = buffer[offset:offset + count * 8]
+    if sys.byteorder == "little":
+        return data.cast("d")
+    values = array("d", data.tobytes())
+    values.byteswap()
+    return values
+
+
+def import_from_bytes(contents: bytes | bytearray | mmap.mmap | memoryview) -> Luminaire:
+    """
+    Reads a luminaire from binary content.
+    Intensity values are not copied and keep the given buffer alive as long as the luminaire is used.
+    """
+    buffer = memoryview(contents)
+    if len(buffer) < _HEADER.size or not is_binary(buffer):
+        raise InvalidPhotometricFileFormatException("Not a binary photometric file")
+
+    magic, version, _, n_c_planes, n_gamma_angles, n_grid_c, n_grid_gamma, metadata_length = _HEADER.unpack_from(buffer)
+    if version > FORMAT_VERSION:
+        raise InvalidPhotometricFileFormatException(f"Unsupported version of binary photometric file: {version}")
+
+    offset = _HEADER.size + _padding(_HEADER.size)
+    metadata = json.loads(bytes(buffer[offset:offset + metadata_length]).decode("utf-8"))
+    offset += metadata_length + _padding(metadata_length)
+
+    expected_length = offset + 8 * (n_c_planes + n_gamma_angles + n_grid_c + n_grid_gamma + n_grid_c * n_grid_gamma)
+    if len(buffer) < expected_length:
+        raise InvalidPhotometricFileFormatException("Binary photometric file is truncated")
+
+    axes = []
+    for count in [n_c_planes, n_gamma_angles, n_grid_c, n_grid_gamma]:
+        axes.append(_doubles(buffer, offset, count))
+        offset += count * 8
+    c_planes, gamma_angles, grid_c, grid_gamma = axes
+    values = _doubles(buffer, offset, n_grid_c * n_grid_gamma)
+
+    return Luminaire(
+        c_planes=list(c_planes),
+        gamma_angles=list(gamma_angles),
+        intensity_values=IntensityGrid(grid_c, grid_gamma, values),
+        **_decode_metadata(metadata)
+    )
+
+
+def import_from_file(path: str | PathLike) -> Luminaire:
+    """
+    Memory-maps the file, so that opening it does not depend on the number of intensity values
+    """
+    with open(path, "rb") as f:
+        contents = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return import_from_bytes(contents)
@@ -1,31 +1,106 @@
+import io
+from os import PathLike
 from typing import IO
 
+from photometric_viewer.formats import binary, ldt
+from photometric_viewer.model.luminaire import Luminaire, LuminaireSummary
 from photometric_viewer.photometry.ies02 import converter as ies02_converter
 from photometric_viewer.photometry.ies02 import extractor as ies02_extractor
 from photometric_viewer.photometry.ies95 import converter as ies95_converter
 from photometric_viewer.photometry.ies95 import extractor as ies95_extractor
 from photometric_viewer.photometry.ldt import converter as ldt_converter
 from photometric_viewer.photometry.ldt import extractor as ldt_extractor
-from photometric_viewer.utils.ioutil import first_non_empty_line
+from photometric_viewer.utils import calc
+from photometric_viewer.utils.cache import LuminaireCache, cache_key
+from photometric_viewer.utils.ioutil import first_non_empty_line, open_text_file, decode_contents
+from photometric_viewer.utils.symmetry import apply_symmetry
 
+# Increase whenever changes to extractors or converters alter the parsed luminaires, invalidates cached results
+PARSER_VERSION = 2
 
-def import_from_file(f: IO):
+
+def import_from_file(f: IO, cache: LuminaireCache | None = None) -> Luminaire:
+    return import_from_string(f.read(), cache)
+
+
+def import_from_string(source: str, cache: LuminaireCache | None = None) -> Luminaire:
+    """
+    Parses the content of a photometric file.
+    The returned luminaire keeps the given string as its file source, without copying it.
+    When a cache is given, previously parsed content is loaded from it instead of being parsed again.
+    """
+    if cache is None:
+        return _parse(source)
+
+    key = cache_key(source, PARSER_VERSION)
+    photometry = cache.get(key)
+    if photometry is None:
+        photometry = _parse(source)
+        calc.cached_photometry(photometry)
+        cache.put(key, photometry)
+
+    photometry.metadata.file_source = source
+    return photometry
+
+
+def import_from_bytes(contents: bytes, cache: LuminaireCache | None = None) -> Luminaire:
+    """
+    Parses the raw content of a photometric file in any supported format, including binary files
+    """
+    if binary.is_binary(contents):
+        return binary.import_from_bytes(contents)
+    return import_from_string(decode_contents(contents), cache)
+
+
+def is_imported(luminaire: Luminaire) -> bool:
+    """
+    True for luminaires without a text source, e.g. read from binary files.
+    Their source cannot be edited, so saving must not overwrite the file they were read from
+    """
+    return luminaire.metadata.file_source is None
+
+
+def editable_source(luminaire: Luminaire) -> str:
+    """
+    Text of the luminaire shown in the source editor, imported luminaires are shown in EULUMDAT format
+    """
+    if not is_imported(luminaire):
+        return luminaire.metadata.file_source
+    with io.StringIO() as f:
+        ldt.export_to_file(f, luminaire)
+        return f.getvalue()
+
+
+def scan_from_file(f: IO) -> LuminaireSummary:
+    """
+    Reads only the header of a photometric file, stopping before angles and intensity values
+    """
+    extractor, converter = _detect_format(f)
+    return converter.convert_summary(extractor.extract_header(f))
+
+
+def scan_file(path: str | PathLike) -> LuminaireSummary:
+    with open_text_file(path) as f:
+        return scan_from_file(f)
+
+
+def _detect_format(f: IO):
     possible_ies_header = first_non_empty_line(f)
     f.seek(0)
 
     if possible_ies_header == "IESNA:LM-63-2002":
-        content = ies02_extractor.extract_content(f)
-        photometry = ies02_converter.convert_content(content)
-        f.seek(0)
-        photometry.metadata.file_source = f.read()
+        return ies02_extractor, ies02_converter
     elif possible_ies_header and possible_ies_header.upper().startswith("IESNA"):
-        content = ies95_extractor.extract_content(f)
-        photometry = ies95_converter.convert_content(content)
-        f.seek(0)
-        photometry.metadata.file_source = f.read()
+        return ies95_extractor, ies95_converter
     else:
-        content = ldt_extractor.extract_content(f)
-        photometry = ldt_converter.convert_content(content)
-        f.seek(0)
-        photometry.metadata.file_source = f.read()
+        return ldt_extractor, ldt_converter
+
+
+def _parse(source: str) -> Luminaire:
+    f = io.StringIO(source)
+    extractor, converter = _detect_format(f)
+    photometry = converter.convert_content(extractor.extract_content(f))
+    apply_symmetry(photometry)
+
+    photometry.metadata.file_source = source
     return photometry
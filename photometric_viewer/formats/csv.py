@@ -2,6 +2,7 @@ import csv
 import io
 
 from photometric_viewer.model.luminaire import Luminaire
+from photometric_viewer.utils.conversion import compact_number
 
 
 def export_photometry(luminaire: Luminaire):
@@ -13,7 +14,7 @@ def export_photometry(luminaire: Luminaire):
 
     for gamma_angle in luminaire.gamma_angles:
         row = {"Gamma": gamma_angle} | {
-            f"C{c_plane:.0f}": luminaire.intensity_values[(c_plane, gamma_angle)]
+            f"C{c_plane:.0f}": compact_number(luminaire.intensity_values[(c_plane, gamma_angle)])
             for c_plane in luminaire.c_planes
         }
         writer.writerow(row)
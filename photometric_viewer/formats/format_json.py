@@ -1,9 +1,10 @@
 import json
 
 from photometric_viewer.model.luminaire import Luminaire
+from photometric_viewer.utils import calc
 
 
-def export_photometry(luminaire: Luminaire):
+def export_photometry(luminaire: Luminaire, beam_angles_per_plane: bool = False):
     luminaire_geometry = {
         "width": luminaire.geometry.width,
         "height": luminaire.geometry.height,
@@ -11,6 +12,8 @@ def export_photometry(luminaire: Luminaire):
         "shape": luminaire.geometry.shape.name
     } if luminaire.geometry else None
 
+    beam_angles = calc.beam_angles(luminaire, None) if beam_angles_per_plane else calc.cached_beam_angles(luminaire)
+
     data = {
         "geometry": {
             "luminous_opening": {
@@ -44,6 +47,14 @@ def export_photometry(luminaire: Luminaire):
             "is_absolute": luminaire.photometry.is_absolute,
             "c_planes": luminaire.c_planes,
             "gamma_angles": luminaire.gamma_angles,
+            "beam_angles": [
+                {
+                    "c": angles.c_angle,
+                    "beam_angle": angles.beam_angle,
+                    "field_angle": angles.field_angle
+                }
+                for angles in beam_angles
+            ],
             "values": [
                 {
                     "c": coord[0],
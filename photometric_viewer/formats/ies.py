@@ -2,6 +2,7 @@ from typing import IO, Dict
 
 from photometric_viewer.model.luminaire import Luminaire, LuminousOpeningGeometry, LuminousOpeningShape
 from photometric_viewer.model.units import LengthUnits
+from photometric_viewer.utils.conversion import compact_number
 
 _LUMEN_PER_LAMPS_ABSOLUTE = -1
 _LUMEN_PER_LAMPS_1000 = 1000
@@ -119,7 +120,7 @@ def export_to_file(f: IO, luminaire: Luminaire, additional_keywords: Dict[str, s
             elif first_lamp_set.lumens_per_lamp and first_lamp_set.lumens_per_lamp > 0:
                 intensity *= first_lamp_set.number_of_lamps * first_lamp_set.lumens_per_lamp / 1000
 
-            f.write(f"{intensity} ")
+            f.write(f"{compact_number(intensity)} ")
             if (i+1) % _VALUES_PER_LINE == 0:
                 f.write("\r\n")
             i += 1
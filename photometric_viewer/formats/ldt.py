@@ -3,6 +3,8 @@ from enum import Enum
 from typing import IO, List, Callable
 
 from photometric_viewer.model.luminaire import Luminaire, Shape, LuminousOpeningShape, Symmetry
+from photometric_viewer.utils import calc
+from photometric_viewer.utils.conversion import compact_number
 
 
 def _write_line(f: IO, value: str, max_len: int = 0):
@@ -44,6 +46,10 @@ def _write_numbers(f: IO, values: List[float] | List[int] | None, default: List[
         for value in default:
             f.write(str(value) + "\r\n")
 
+def _write_intensity(f: IO, value: float):
+    f.write(str(compact_number(round(value, ndigits=3))) + "\r\n")
+
+
 def _write_gamma_values(f: IO, luminaire: Luminaire, c_plane_predicate: Callable[[float], bool]):
     for c_plane in luminaire.c_planes:
         if not c_plane_predicate(c_plane):
@@ -53,11 +59,11 @@ def _write_gamma_values(f: IO, luminaire: Luminaire, c_plane_predicate: Callable
             if luminaire.photometry.is_absolute:
                 lamp = luminaire.lamps[0]
                 if lamp.lumens_per_lamp:
-                    _write_number(f, intensity / (lamp.lumens_per_lamp * lamp.number_of_lamps) * 1000)
+                    _write_intensity(f, intensity / (lamp.lumens_per_lamp * lamp.number_of_lamps) * 1000)
                 else:
-                    _write_number(f, intensity)
+                    _write_intensity(f, intensity)
             else:
-                _write_number(f, intensity)
+                _write_intensity(f, intensity)
 
 
 def export_to_file(f: IO, luminaire: Luminaire):
@@ -135,10 +141,11 @@ def export_to_file(f: IO, luminaire: Luminaire):
         _write_number(f, lamp.wattage)
 
     ratios_for_room_indices = [0 for _ in range(10)]
-    if luminaire.metadata.direct_ratios_for_room_indices:
+    direct_ratios = calc.cached_direct_ratios(luminaire).value
+    if direct_ratios:
         ratios_for_room_indices = [
-            luminaire.metadata.direct_ratios_for_room_indices.get(index, "")
-            for index in [0.6, 0.8, 1, 1.25, 1.5, 2, 2.5, 3, 4, 5]
+            direct_ratios.get(index, "")
+            for index in calc.STANDARD_ROOM_INDICES
         ]
 
     for ratio in ratios_for_room_indices:
@@ -158,6 +165,7 @@ def export_to_file(f: IO, luminaire: Luminaire):
         case Symmetry.TO_C0_C180:
             _write_gamma_values(f, luminaire, lambda c: c <= 180)
         case Symmetry.TO_C90_C270:
-            _write_gamma_values(f, luminaire, lambda c: 90 <= c <= 270)
+            _write_gamma_values(f, luminaire, lambda c: 270 <= c < 360)
+            _write_gamma_values(f, luminaire, lambda c: c <= 90)
         case Symmetry.TO_C0_C180_C90_C270:
             _write_gamma_values(f, luminaire, lambda c: c <= 90)
\ No newline at end of file
@@ -38,6 +38,17 @@ class ExportFileChooser(FileChooserNative):
 
         return chooser
 
+    @staticmethod
+    def for_binary(**kwargs):
+        chooser = ExportFileChooser(**kwargs)
+
+        binary_filter = FileFilter(name=_("Binary luminaire archives"))
+        binary_filter.add_pattern("*.pvb")
+        chooser.add_filter(binary_filter)
+        chooser._add_all_files_filter()
+
+        return chooser
+
     @staticmethod
     def for_ldc(**kwargs):
         chooser = ExportFileChooser(**kwargs)
@@ -62,6 +73,7 @@ class FileChooser(FileChooserNative):
         photometric_filter = FileFilter(name=_("All photometric files"))
         photometric_filter.add_pattern("*.ies")
         photometric_filter.add_pattern("*.ldt")
+        photometric_filter.add_pattern("*.pvb")
 
         ies_filter = FileFilter(name=_("IESNA (*.ies)"))
         ies_filter.add_pattern("*.ies")
@@ -69,10 +81,14 @@ class FileChooser(FileChooserNative):
         ldt_filter = FileFilter(name=_("EULUMDAT (*.ldt)"))
         ldt_filter.add_pattern("*.ldt")
 
+        binary_filter = FileFilter(name=_("Binary luminaire archive (*.pvb)"))
+        binary_filter.add_pattern("*.pvb")
+
         all_files_filter = FileFilter(name=_("All Files"))
         all_files_filter.add_pattern("*")
 
         self.add_filter(photometric_filter)
         self.add_filter(ies_filter)
         self.add_filter(ldt_filter)
+        self.add_filter(binary_filter)
         self.add_filter(all_files_filter)
@@ -0,0 +1,186 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, List
+
+from gi.repository import Adw, Gtk, Gio, GLib
+from gi.repository.Gtk import Orientation, ScrolledWindow, PolicyType, ListBox, SelectionMode
+
+from photometric_viewer.config.appearance import CLAMP_MAX_WIDTH
+from photometric_viewer.gui.pages.base import BasePage
+from photometric_viewer.utils.catalog import Catalog, CatalogQuery, CatalogEntry, RefreshSummary, \
+    default_catalog_path
+from photometric_viewer.utils.conversion import safe_float, safe_int
+from photometric_viewer.utils.gi.GSettings import SettingsManager
+
+
+def _refresh_catalog(directories: List[str]) -> RefreshSummary:
+    with Catalog(default_catalog_path()) as catalog:
+        return catalog.refresh(directories)
+
+
+class CatalogPage(BasePage):
+    def __init__(self, on_open_file: Callable[[Gio.File], None], transient_for=None, **kwargs):
+        self.add_directory_button = Gtk.Button(icon_name="folder-new-symbolic", tooltip_text=_("Add directory"))
+        self.refresh_button = Gtk.Button(icon_name="view-refresh-symbolic", tooltip_text=_("Refresh catalog"))
+
+        headerbar = Adw.HeaderBar(css_classes=["flat"])
+        headerbar.pack_end(self.refresh_button)
+        headerbar.pack_end(self.add_directory_button)
+
+        super().__init__(_("Luminaire catalog"), headerbar=headerbar, **kwargs)
+
+        self.on_open_file = on_open_file
+        self.settings_manager = SettingsManager()
+        self.catalog: Catalog | None = None
+        self.refresh_executor = ThreadPoolExecutor(max_workers=1)
+        self.pending_refresh: Future | None = None
+
+        self.add_directory_button.connect("clicked", self.on_add_directory)
+        self.refresh_button.connect("clicked", lambda *args: self.refresh())
+
+        self.directory_chooser = Gtk.FileChooserNative(
+            transient_for=transient_for,
+            action=Gtk.FileChooserAction.SELECT_FOLDER,
+            modal=True
+        )
+        self.directory_chooser.connect("response", self.on_directory_chooser_response)
+
+        box = Gtk.Box(
+            orientation=Orientation.VERTICAL,
+            spacing=16,
+            margin_top=16,
+            margin_bottom=16,
+            margin_start=16,
+            margin_end=16
+        )
+
+        self.search_entry = Gtk.SearchEntry(placeholder_text=_("Manufacturer, luminaire or catalog number"))
+        self.search_entry.connect("search-changed", lambda *args: self.search())
+        box.append(self.search_entry)
+
+        filters = ListBox(css_classes=["boxed-list"], selection_mode=SelectionMode.NONE)
+        self.min_flux_row = self._filter_row(_("Minimal luminous flux (lm)"))
+        self.min_efficacy_row = self._filter_row(_("Minimal efficacy (lm/W)"))
+        self.color_temperature_row = self._filter_row(_("Color temperature (K)"))
+        for row in [self.min_flux_row, self.min_efficacy_row, self.color_temperature_row]:
+            filters.append(row)
+        box.append(filters)
+
+        self.status_label = Gtk.Label(xalign=0, css_classes=["dim-label"], wrap=True)
+        box.append(self.status_label)
+
+        self.results = ListBox(css_classes=["boxed-list"], selection_mode=SelectionMode.NONE)
+        self.results.connect("row-activated", self.on_result_activated)
+        box.append(self.results)
+
+        clamp = Adw.Clamp(maximum_size=CLAMP_MAX_WIDTH)
+        clamp.set_child(box)
+
+        scrolled_window = ScrolledWindow()
+        scrolled_window.set_child(clamp)
+        scrolled_window.set_vexpand(True)
+        scrolled_window.set_policy(PolicyType.NEVER, PolicyType.AUTOMATIC)
+        self.set_content(scrolled_window)
+
+    def _filter_row(self, title: str) -> Adw.EntryRow:
+        row = Adw.EntryRow(title=title, input_purpose=Gtk.InputPurpose.NUMBER)
+        row.connect("notify::text", lambda *args: self.search())
+        return row
+
+    def show(self):
+        if self.catalog is None:
+            self.catalog = Catalog(default_catalog_path())
+        self.search()
+        self.refresh()
+
+    def on_add_directory(self, *args):
+        self.directory_chooser.show()
+
+    def on_directory_chooser_response(self, dialog: Gtk.FileChooserNative, response):
+        if response != Gtk.ResponseType.ACCEPT:
+            return
+
+        path = dialog.get_file().get_path()
+        settings = self.settings_manager.settings
+        if path and path not in settings.catalog_directories:
+            settings.catalog_directories = settings.catalog_directories + [path]
+            self.settings_manager.update()
+        self.refresh()
+
+    def refresh(self):
+        directories = self.settings_manager.settings.catalog_directories
+        if not directories:
+            self.status_label.set_label(_("Add a directory with photometric files to build the catalog"))
+            return
+
+        if self.pending_refresh and not self.pending_refresh.done():
+            return
+
+        self.refresh_button.set_sensitive(False)
+        self.status_label.set_label(_("Updating catalog…"))
+        self.pending_refresh = self.refresh_executor.submit(_refresh_catalog, list(directories))
+        self.pending_refresh.add_done_callback(lambda f: GLib.idle_add(self.on_refreshed, f))
+
+    def on_refreshed(self, future: Future):
+        self.refresh_button.set_sensitive(True)
+        try:
+            summary = future.result()
+        except Exception:
+            logging.exception("Could not update catalog")
+            self.status_label.set_label(_("Could not update catalog"))
+            return GLib.SOURCE_REMOVE
+
+        self.search()
+        if summary.failures:
+            self.status_label.set_label(
+                _("{} files could not be read").format(len(summary.failures)) + "\n" + self.status_label.get_label()
+            )
+        return GLib.SOURCE_REMOVE
+
+    def _query(self) -> CatalogQuery:
+        color_temperature = safe_int(self.color_temperature_row.get_text())
+        return CatalogQuery(
+            text=self.search_entry.get_text().strip() or None,
+            min_luminous_flux=safe_float(self.min_flux_row.get_text()),
+            min_efficacy=safe_float(self.min_efficacy_row.get_text()),
+            min_color_temperature=color_temperature,
+            max_color_temperature=color_temperature
+        )
+
+    def search(self):
+        if self.catalog is None:
+            return
+
+        query = self._query()
+        entries = self.catalog.search(query)
+
+        self.results.remove_all()
+        for entry in entries:
+            self.results.append(self._result_row(entry))
+
+        if len(entries) == query.limit:
+            self.status_label.set_label(_("Showing first {} luminaires").format(len(entries)))
+        else:
+            self.status_label.set_label(_("{} luminaires found").format(len(entries)))
+
+    def _result_row(self, entry: CatalogEntry) -> Adw.ActionRow:
+        details = [
+            entry.manufacturer,
+            entry.catalog_number,
+            f"{entry.luminous_flux:.0f} lm" if entry.luminous_flux else None,
+            f"{entry.efficacy:.0f} lm/W" if entry.efficacy else None,
+            f"{entry.color_temperature} K" if entry.color_temperature else None,
+            f"{entry.beam_angle:.0f}°" if entry.beam_angle else None,
+        ]
+        row = Adw.ActionRow(
+            title=GLib.markup_escape_text((entry.luminaire or GLib.path_get_basename(entry.path)).partition("\n")[0]),
+            subtitle=GLib.markup_escape_text(" · ".join(detail for detail in details if detail)),
+            tooltip_text=entry.path,
+            activatable=True
+        )
+        row.path = entry.path
+        row.add_suffix(Gtk.Image(icon_name="go-next-symbolic"))
+        return row
+
+    def on_result_activated(self, list_box: ListBox, row: Adw.ActionRow):
+        self.on_open_file(Gio.File.new_for_path(row.path))
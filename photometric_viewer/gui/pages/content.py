@@ -3,6 +3,7 @@ from gi.repository.Gtk import Orientation, PolicyType, ScrolledWindow
 
 from photometric_viewer.config.appearance import CLAMP_MAX_WIDTH
 from photometric_viewer.gui.pages.base import BasePage
+from photometric_viewer.gui.widgets.content.bug_rating import BugRatingBox
 from photometric_viewer.gui.widgets.content.header import LuminaireHeader
 from photometric_viewer.gui.widgets.content.lamps import LampAndBallast
 from photometric_viewer.gui.widgets.content.photometry import LuminairePhotometricProperties
@@ -16,6 +17,7 @@ class PhotometryContentPage(BasePage):
         super().__init__(_("Photometry"), headerbar=default_headerbar(), **kwargs)
         self.header = LuminaireHeader()
         self.photometric_properties = LuminairePhotometricProperties()
+        self.bug_rating = BugRatingBox()
         self.lamps_and_ballast = LampAndBallast()
         self.properties = LuminaireProperties()
 
@@ -30,6 +32,7 @@ class PhotometryContentPage(BasePage):
 
         box.append(self.header)
         box.append(self.photometric_properties)
+        box.append(self.bug_rating)
         box.append(self.lamps_and_ballast)
         box.append(self.properties)
 
@@ -45,5 +48,6 @@ class PhotometryContentPage(BasePage):
     def set_photometry(self, luminaire: Luminaire):
         self.header.set_photometry(luminaire)
         self.photometric_properties.set_photometry(luminaire)
+        self.bug_rating.set_photometry(luminaire)
         self.lamps_and_ballast.set_photometry(luminaire)
         self.properties.set_photometry(luminaire)
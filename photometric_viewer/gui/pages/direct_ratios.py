@@ -4,8 +4,10 @@ from gi.repository.Gtk import ScrolledWindow, PolicyType, Orientation
 
 from photometric_viewer.config.appearance import CLAMP_MAX_WIDTH
 from photometric_viewer.gui.pages.base import BasePage
+from photometric_viewer.gui.widgets.common import badges
 from photometric_viewer.gui.widgets.common.property_list import PropertyList
 from photometric_viewer.model.luminaire import Luminaire
+from photometric_viewer.utils import calc
 
 
 class DirectRatiosPage(BasePage):
@@ -39,7 +41,8 @@ class DirectRatiosPage(BasePage):
         self.luminaire = luminaire
         self.property_list.clear()
 
-        for room_index, ratio in luminaire.metadata.direct_ratios_for_room_indices.items():
+        direct_ratios = calc.cached_direct_ratios(luminaire)
+        for room_index, ratio in (direct_ratios.value or {}).items():
             row = ActionRow(
                 title=_("Room index: {:.2f}").format(room_index),
                 subtitle=f"{ratio:.3f}",
@@ -47,4 +50,6 @@ class DirectRatiosPage(BasePage):
                 subtitle_selectable=True
 
             )
+            if direct_ratios.is_calculated:
+                row.add_suffix(badges.calculated())
             self.property_list.append(row)
@@ -1,5 +1,3 @@
-import re
-
 from gi.repository import Adw, Gtk
 from gi.repository.Gtk import ScrolledWindow, PolicyType, Orientation
 
@@ -12,6 +10,7 @@ from photometric_viewer.gui.widgets.content.temperature import ColorTemperatureG
 from photometric_viewer.gui.widgets.content.wattage import WattageBox
 from photometric_viewer.model.luminaire import Lamps, Luminaire
 from photometric_viewer.model.settings import Settings
+from photometric_viewer.utils.conversion import color_temperature
 
 
 class LampSetPage(BasePage):
@@ -76,16 +75,9 @@ class LampSetPage(BasePage):
         if not lamp_set.color:
             return
 
-        color_temp_regex = re.compile("^(\\d\\d\\d\\d\\d?)\\s*K?$")
-        color_temp_match = color_temp_regex.match(lamp_set.color)
-
-        cri_temp_regex = re.compile("^(\\d)(\\d\\d)$")
-        cri_temp_match = cri_temp_regex.match(lamp_set.color)
-
-        if color_temp_match:
-            self.property_list.append(ColorTemperatureGauge(int(color_temp_match.groups()[0])))
-        elif cri_temp_match:
-            self.property_list.append(ColorTemperatureGauge(int(cri_temp_match.groups()[1]) * 100))
+        temperature = color_temperature(lamp_set.color)
+        if temperature:
+            self.property_list.append(ColorTemperatureGauge(temperature))
         else:
             self.property_list.add(
                 _("Color"),
@@ -1,4 +1,7 @@
-from gi.repository import Gtk, Adw
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+
+from gi.repository import Gtk, Adw, GLib
 from gi.repository.Gtk import Orientation, ScrolledWindow, PolicyType
 
 from photometric_viewer.config.appearance import CLAMP_MAX_WIDTH
@@ -9,12 +12,20 @@ from photometric_viewer.model.luminaire import Luminaire
 from photometric_viewer.model.zones import ZoneProperties
 from photometric_viewer.utils import calc
 from photometric_viewer.utils.calc import illuminance
+from photometric_viewer.utils.illuminance import calculate_illuminance, layout_for_count, grid_layout
 
 
 class NumberOfLuminairesCalculationPage(BasePage):
+    # Number of calculation points along each side of the zone
+    CALCULATION_POINTS = 40
+
     def __init__(self, **kwargs):
         super().__init__(_("Required number of luminaires"), **kwargs)
         self.luminaire: Luminaire | None = None
+        self.illuminance_executor = ThreadPoolExecutor(max_workers=1)
+        self.pending_calculation: Future | None = None
+        # Incremented on every recalculation, so that results of outdated calculations are dropped
+        self.calculation_revision = 0
 
         box = Gtk.Box(
             orientation=Orientation.VERTICAL,
@@ -48,22 +59,26 @@ class NumberOfLuminairesCalculationPage(BasePage):
             width=1.5,
             length=1.5,
             target_illuminance=500,
-            maintenance_factor=0.8
+            maintenance_factor=0.8,
+            mounting_height=2
         )
 
     def on_update_room_properties(self):
         self.recalculate()
 
     def recalculate(self):
+        self.calculation_revision += 1
         if not self.luminaire:
             self.luminaire_count_box.set_count(None)
             self.luminaire_count_box.set_achieved_illuminance(None)
+            self.luminaire_count_box.set_illuminance_grid(None, None)
             return
 
-        photometric_properties = calc.calculate_photometry(self.luminaire)
+        photometric_properties = calc.cached_photometry(self.luminaire)
         if not photometric_properties.luminous_flux.value:
             self.luminaire_count_box.set_count(None)
             self.luminaire_count_box.set_achieved_illuminance(None)
+            self.luminaire_count_box.set_illuminance_grid(None, None)
             return
 
         try:
@@ -79,11 +94,55 @@ class NumberOfLuminairesCalculationPage(BasePage):
                 mf=self.zone_properties.maintenance_factor,
                 area=self.zone_properties.width * self.zone_properties.length
             )
+            # Luminaires are arranged in a full grid, which may hold more of them than required
+            columns, rows = layout_for_count(self.zone_properties.width, self.zone_properties.length, count)
+            count = columns * rows
             self.luminaire_count_box.set_count(count)
             self.luminaire_count_box.set_achieved_illuminance(illuminance * count)
+            self.update_illuminance_grid(columns, rows)
         except ZeroDivisionError:
             self.luminaire_count_box.set_count(None)
             self.luminaire_count_box.set_achieved_illuminance(None)
+            self.luminaire_count_box.set_illuminance_grid(None, None)
+
+    def update_illuminance_grid(self, columns: int, rows: int):
+        zone = self.zone_properties
+        if columns * rows <= 0 or zone.width <= 0 or zone.length <= 0 or zone.mounting_height <= 0:
+            self.luminaire_count_box.set_illuminance_grid(None, None)
+            return
+
+        self.luminaire_count_box.set_illuminance_grid((columns, rows), None)
+        if self.pending_calculation:
+            self.pending_calculation.cancel()
+
+        revision = self.calculation_revision
+        self.pending_calculation = self.illuminance_executor.submit(
+            calculate_illuminance,
+            luminaire=self.luminaire,
+            positions=grid_layout(zone.width, zone.length, columns, rows),
+            mounting_height=zone.mounting_height,
+            width=zone.width,
+            length=zone.length,
+            points_x=self.CALCULATION_POINTS,
+            points_y=self.CALCULATION_POINTS,
+            mf=zone.maintenance_factor
+        )
+        self.pending_calculation.add_done_callback(
+            lambda f: GLib.idle_add(self.on_illuminance_calculated, revision, (columns, rows), f)
+        )
+
+    def on_illuminance_calculated(self, revision: int, layout: tuple[int, int], future: Future):
+        if revision != self.calculation_revision or future.cancelled():
+            return GLib.SOURCE_REMOVE
+
+        try:
+            grid = future.result()
+        except ValueError:
+            logging.debug("Could not calculate illuminance", exc_info=True)
+            grid = None
+
+        self.luminaire_count_box.set_illuminance_grid(layout, grid)
+        return GLib.SOURCE_REMOVE
 
     def set_photometry(self, luminaire: Luminaire):
         self.luminaire = luminaire
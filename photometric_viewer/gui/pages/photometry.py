@@ -1,11 +1,12 @@
 from gi.repository import Adw, Gtk
-from gi.repository.Gtk import ScrolledWindow, PolicyType, Orientation
+from gi.repository.Gtk import ScrolledWindow, PolicyType, Orientation, Label
 
 from photometric_viewer.config.appearance import CLAMP_MAX_WIDTH
 from photometric_viewer.gui.pages.base import BasePage
 from photometric_viewer.gui.widgets.common.gauge import Gauge
 from photometric_viewer.gui.widgets.common.property_list import PropertyList
 from photometric_viewer.model.luminaire import Luminaire
+from photometric_viewer.model.zonal import ZonalLumenSummary, ZonalLumens
 from photometric_viewer.utils import calc
 
 
@@ -27,6 +28,15 @@ class PhotometryPage(BasePage):
 
         box.append(self.property_list)
 
+        self.zonal_lumens_label = Label(label=_("Zonal lumen summary"), xalign=0, css_classes=["heading"])
+        box.append(self.zonal_lumens_label)
+
+        self.zonal_lumens_table = Gtk.Grid(column_spacing=12, row_spacing=6, margin_top=12, margin_bottom=12)
+        self.zonal_lumens_window = ScrolledWindow(css_classes=["card"])
+        self.zonal_lumens_window.set_child(self.zonal_lumens_table)
+        self.zonal_lumens_window.set_policy(PolicyType.AUTOMATIC, PolicyType.NEVER)
+        box.append(self.zonal_lumens_window)
+
         clamp = Adw.Clamp(maximum_size=CLAMP_MAX_WIDTH)
         clamp.set_child(box)
 
@@ -36,9 +46,36 @@ class PhotometryPage(BasePage):
         scrolled_window.set_policy(PolicyType.NEVER, PolicyType.AUTOMATIC)
         self.set_content(scrolled_window)
 
+    def _attach(self, text: str, column: int, row: int, css_classes=None):
+        label = Label(label=text, xalign=1, css_classes=css_classes or [], margin_start=6, margin_end=6)
+        self.zonal_lumens_table.attach(label, column, row, 1, 1)
+
+    def _attach_zone(self, zone: ZonalLumens, row: int):
+        self._attach(f"{zone.lower:.0f}-{zone.upper:.0f}°", 0, row, ["heading"])
+        self._attach(f"{zone.lumens:.0f}", 1, row, ["numeric"])
+        self._attach(f"{zone.lamp_fraction:.1%}" if zone.lamp_fraction is not None else "-", 2, row, ["numeric"])
+        self._attach(f"{zone.luminaire_fraction:.1%}", 3, row, ["numeric"])
+
+    def _set_zonal_lumen_summary(self, summary: ZonalLumenSummary | None):
+        while child := self.zonal_lumens_table.get_first_child():
+            self.zonal_lumens_table.remove(child)
+
+        self.zonal_lumens_label.set_visible(summary is not None)
+        self.zonal_lumens_window.set_visible(summary is not None)
+        if summary is None:
+            return
+
+        self._attach(_("Zone"), 0, 0, ["heading"])
+        self._attach(_("Lumens"), 1, 0, ["heading"])
+        self._attach(_("% Lamp"), 2, 0, ["heading"])
+        self._attach(_("% Luminaire"), 3, 0, ["heading"])
+        for row, zone in enumerate(summary.zones + summary.bands, start=1):
+            self._attach_zone(zone, row)
+
     def set_photometry(self, luminaire: Luminaire):
         self.property_list.clear()
-        photometric_properties = calc.calculate_photometry(luminaire)
+        self._set_zonal_lumen_summary(calc.cached_zonal_lumen_summary(luminaire))
+        photometric_properties = calc.cached_photometry(luminaire)
 
         if photometric_properties.luminous_flux.value:
             self.property_list.add(
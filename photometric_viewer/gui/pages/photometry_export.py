@@ -1,5 +1,4 @@
 import io
-from datetime import datetime
 
 from gi.repository import Adw, Gio, Gtk
 from gi.repository.Gtk import Box, Orientation, Label, PolicyType, ScrolledWindow, FileFilter, FileChooserDialog, \
@@ -11,10 +10,11 @@ from photometric_viewer.formats import svg, png, ldt, ies
 from photometric_viewer.gui.dialogs.file_chooser import ExportFileChooser
 from photometric_viewer.gui.pages.base import BasePage
 from photometric_viewer.gui.widgets.photomery_export.photometry_export_list import PhotometryExportList, \
-    LdtExportProperties
+    LdtExportProperties, IesExportProperties
 from photometric_viewer.model.luminaire import Luminaire
 from photometric_viewer.utils.gi.gio import write_bytes, write_string
-from photometric_viewer.utils.project import PROJECT
+from photometric_viewer.utils.project import export_tool_keywords
+from photometric_viewer.utils.resampling import resample_to_steps
 
 
 class PhotometryExportPage(BasePage):
@@ -117,22 +117,19 @@ class PhotometryExportPage(BasePage):
 
         self.on_exported(file.get_basename())
 
+    def _exported_luminaire(self, export_properties: LdtExportProperties | IesExportProperties) -> Luminaire:
+        if export_properties.grid is None:
+            return self.luminaire
+        return resample_to_steps(self.luminaire, export_properties.grid, export_properties.preserve_flux)
+
     def export_ldt(self, file: Gio.File, export_properties: LdtExportProperties):
         with io.StringIO() as f:
-            ldt.export_to_file(f, self.luminaire)
+            ldt.export_to_file(f, self._exported_luminaire(export_properties))
             write_string(file, f.getvalue())
 
-    def export_ies(self, file: Gio.File, export_properties: LdtExportProperties):
-        export_keywords = {
-            "_EXPORT_TOOL": PROJECT.name,
-            "_EXPORT_TOOL_VERSION": PROJECT.version,
-            "_EXPORT_TOOL_HOMEPAGE": PROJECT.urls.homepage,
-            "_EXPORT_TOOL_ISSUE_TRACKER": PROJECT.urls.bug_tracker,
-            "_EXPORT_TIMESTAMP": datetime.now().isoformat()
-        }
-
+    def export_ies(self, file: Gio.File, export_properties: IesExportProperties):
         with io.StringIO() as f:
-            ies.export_to_file(f, self.luminaire, export_keywords)
+            ies.export_to_file(f, self._exported_luminaire(export_properties), export_tool_keywords())
             write_string(file, f.getvalue())
 
 
@@ -22,6 +22,7 @@ class SourceViewPage(BasePage):
         
         self.adw_style_manager: Adw.StyleManager = Adw.StyleManager.get_default()
         self.settings_manager = SettingsManager()
+        self.opening = False
 
         self.source_text_view = View(
             editable=True,
@@ -61,9 +62,12 @@ class SourceViewPage(BasePage):
             self.activate_action("win.autosave")
 
     def open_stream(self, f: typing.IO):
+        self.set_source(f.read())
+
+    def set_source(self, source: str):
         try:
             self.opening = True
-            self.source_text_view.get_buffer().set_text(f.read())
+            self.source_text_view.get_buffer().set_text(source)
             self.source_text_view.get_buffer().set_modified(False)
         finally:
             self.opening = False
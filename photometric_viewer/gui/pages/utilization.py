@@ -0,0 +1,79 @@
+from gi.repository import Adw, Gtk
+from gi.repository.Gtk import ScrolledWindow, PolicyType, Orientation, Label
+
+from photometric_viewer.config.appearance import CLAMP_MAX_WIDTH
+from photometric_viewer.gui.pages.base import BasePage
+from photometric_viewer.model.luminaire import Luminaire
+from photometric_viewer.model.utilization import CoefficientsOfUtilization
+from photometric_viewer.utils import calc
+
+
+def _percent(value: float) -> str:
+    return f"{value * 100:.0f}"
+
+
+class CoefficientsOfUtilizationPage(BasePage):
+    def __init__(self, **kwargs):
+        super().__init__(_("Coefficients of utilization"), **kwargs)
+        self.luminaire = None
+
+        box = Gtk.Box(
+            orientation=Orientation.VERTICAL,
+            spacing=16,
+            margin_top=16,
+            margin_bottom=16,
+            margin_start=16,
+            margin_end=16
+        )
+
+        self.description_label = Label(xalign=0, wrap=True, css_classes=["dim-label"])
+        box.append(self.description_label)
+
+        self.table = Gtk.Grid(column_spacing=12, row_spacing=6, margin_top=12, margin_bottom=12)
+        table_window = ScrolledWindow(css_classes=["card"])
+        table_window.set_child(self.table)
+        table_window.set_policy(PolicyType.AUTOMATIC, PolicyType.NEVER)
+        box.append(table_window)
+
+        clamp = Adw.Clamp(maximum_size=CLAMP_MAX_WIDTH)
+        clamp.set_child(box)
+
+        scrolled_window = ScrolledWindow()
+        scrolled_window.set_child(clamp)
+        scrolled_window.set_vexpand(True)
+        scrolled_window.set_policy(PolicyType.NEVER, PolicyType.AUTOMATIC)
+        self.set_content(scrolled_window)
+
+    def _clear(self):
+        while child := self.table.get_first_child():
+            self.table.remove(child)
+
+    def _attach(self, text: str, column: int, row: int, css_classes=None):
+        label = Label(label=text, xalign=1, css_classes=css_classes or [], margin_start=6, margin_end=6)
+        self.table.attach(label, column, row, 1, 1)
+
+    def set_photometry(self, luminaire: Luminaire):
+        self.luminaire = luminaire
+        self._clear()
+
+        table: CoefficientsOfUtilization | None = calc.cached_coefficients_of_utilization(luminaire)
+        if table is None:
+            self.description_label.set_label(_("Coefficients of utilization cannot be calculated for this luminaire"))
+            return
+
+        self.description_label.set_label(
+            _("Percent of lamp flux reaching the workplane, calculated with the zonal cavity method. "
+              "Floor cavity reflectance: {}%").format(_percent(table.reflectances[0].floor))
+        )
+
+        self._attach(_("Ceiling"), 0, 0, ["heading"])
+        self._attach(_("Walls"), 0, 1, ["heading"])
+        self._attach(_("RCR"), 0, 2, ["heading"])
+        for column, reflectances in enumerate(table.reflectances, start=1):
+            self._attach(_percent(reflectances.ceiling), column, 0, ["heading"])
+            self._attach(_percent(reflectances.walls), column, 1, ["dim-label"])
+
+        for row, (room_cavity_ratio, values) in enumerate(zip(table.room_cavity_ratios, table.values), start=3):
+            self._attach(f"{room_cavity_ratio:g}", 0, row, ["heading"])
+            for column, value in enumerate(values, start=1):
+                self._attach(_percent(value), column, row, ["numeric"])
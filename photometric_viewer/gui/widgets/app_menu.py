@@ -13,6 +13,10 @@ class ApplicationMenuButton(Gtk.MenuButton):
                     <attribute name='label' translatable='yes'>New Window</attribute>
                     <attribute name='action'>app.new_window</attribute>
                 </item>
+                <item>
+                    <attribute name='label' translatable='yes'>Luminaire Catalog</attribute>
+                    <attribute name='action'>win.show_catalog</attribute>
+                </item>
             </section>
             <section>
                 <item>
@@ -42,6 +46,10 @@ class ApplicationMenuButton(Gtk.MenuButton):
                                 <attribute name='label' translatable='yes'>Luminaire data</attribute>
                                 <attribute name='action'>win.export_luminaire_as_json</attribute>
                             </item>
+                            <item>
+                                <attribute name='label' translatable='yes'>Binary luminaire archive</attribute>
+                                <attribute name='action'>win.export_luminaire_as_binary</attribute>
+                            </item>
                         </section>
                     </submenu>
             </section>
@@ -0,0 +1,53 @@
+from gi.repository import Gtk, Adw
+from gi.repository.Adw import ActionRow
+from gi.repository.Gtk import Label
+
+from photometric_viewer.gui.widgets.common.header import Header
+from photometric_viewer.gui.widgets.common.property_list import PropertyList
+from photometric_viewer.model.luminaire import Luminaire
+from photometric_viewer.utils.bug_rating import cached_bug_rating
+
+
+class BugRatingBox(Gtk.Box):
+    ZONES = [
+        ("FL", _("Forward low (0°-30°)")),
+        ("FM", _("Forward medium (30°-60°)")),
+        ("FH", _("Forward high (60°-80°)")),
+        ("FVH", _("Forward very high (80°-90°)")),
+        ("BL", _("Back low (0°-30°)")),
+        ("BM", _("Back medium (30°-60°)")),
+        ("BH", _("Back high (60°-80°)")),
+        ("BVH", _("Back very high (80°-90°)")),
+        ("UL", _("Uplight low (90°-100°)")),
+        ("UH", _("Uplight high (100°-180°)")),
+    ]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs, orientation=Gtk.Orientation.VERTICAL, spacing=16)
+
+        self.property_list = PropertyList()
+        self.append(Header(label=_("Outdoor lighting"), xalign=0))
+        self.append(self.property_list)
+        self.set_visible(False)
+
+    def set_photometry(self, luminaire: Luminaire):
+        self.property_list.clear()
+        self.set_visible(False)
+
+        rating = cached_bug_rating(luminaire)
+        if rating is None:
+            return
+
+        expander_row = Adw.ExpanderRow(
+            title=_("BUG rating"),
+            subtitle=_("Backlight, uplight and glare rating according to IES TM-15")
+        )
+        expander_row.add_suffix(Label(label=str(rating), css_classes=["heading"], selectable=True))
+
+        for zone, description in self.ZONES:
+            row = ActionRow(title=zone, subtitle=description)
+            row.add_suffix(Label(label=f"{rating.zone_flux[zone]:.0f} lm", selectable=True))
+            expander_row.add_row(row)
+
+        self.property_list.append(expander_row)
+        self.set_visible(True)
@@ -1,4 +1,4 @@
-from gi.repository import Gtk
+from gi.repository import Gtk, Adw
 from gi.repository.Adw import ActionRow
 from gi.repository.Gtk import Box, Orientation, Label
 
@@ -13,6 +13,10 @@ def _value_with_unit(value, unit):
     return f"{value}{unit}"
 
 
+def _angle(value: float | None) -> str:
+    return f"{value:.0f}°" if value is not None else "-"
+
+
 class LuminairePhotometricProperties(Box):
     def __init__(self):
         super().__init__(
@@ -27,7 +31,7 @@ class LuminairePhotometricProperties(Box):
         self.property_list.clear()
         self.set_visible(False)
 
-        photometric_properties = calc.calculate_photometry(luminaire)
+        photometric_properties = calc.cached_photometry(luminaire)
 
         if any((
             photometric_properties.luminous_flux.value,
@@ -51,7 +55,29 @@ class LuminairePhotometricProperties(Box):
             self.property_list.append(row)
             self.set_visible(True)
 
-        if luminaire.metadata.direct_ratios_for_room_indices:
+        angles = calc.cached_beam_angles(luminaire)
+        if any(a.beam_angle is not None or a.field_angle is not None for a in angles):
+            expander_row = Adw.ExpanderRow(
+                title=_("Beam angle"),
+                subtitle=_("Angles within which intensity stays above 50% (beam) and 10% (field) of the peak")
+            )
+            expander_row.add_suffix(Label(label=_angle(angles[0].beam_angle), selectable=True))
+
+            for plane_angles in angles:
+                row = ActionRow(title=f"C{plane_angles.c_angle:.0f}-C{plane_angles.c_angle + 180:.0f}")
+                row.add_suffix(Label(
+                    label=_("Beam: {} Field: {}").format(
+                        _angle(plane_angles.beam_angle),
+                        _angle(plane_angles.field_angle)
+                    ),
+                    selectable=True
+                ))
+                expander_row.add_row(row)
+
+            self.property_list.append(expander_row)
+            self.set_visible(True)
+
+        if calc.cached_direct_ratios(luminaire).value:
             icon = Gtk.Image(icon_name="go-next-symbolic")
             row = ActionRow(
                 title=_("Direct ratios for room indices"),
@@ -64,6 +90,19 @@ class LuminairePhotometricProperties(Box):
             self.property_list.append(row)
             self.set_visible(True)
 
+        if calc.cached_coefficients_of_utilization(luminaire):
+            icon = Gtk.Image(icon_name="go-next-symbolic")
+            row = ActionRow(
+                title=_("Coefficients of utilization"),
+                action_name="win.show_coefficients_of_utilization",
+                activatable_widget=icon,
+
+            )
+            row.add_prefix(Gtk.Image(icon_name="direct-ratios-symbolic"))
+            row.add_suffix(icon)
+            self.property_list.append(row)
+            self.set_visible(True)
+
         if luminaire.intensity_values:
             icon = Gtk.Image(icon_name="go-next-symbolic")
             row = ActionRow(
@@ -1,6 +1,8 @@
 from gi.repository.Adw import ActionRow
 from gi.repository.Gtk import ListBox, SelectionMode, Label
 
+from photometric_viewer.utils.illuminance import IlluminanceGrid
+
 
 class LuminaireCountListBox(ListBox):
     def __init__(self):
@@ -19,8 +21,34 @@ class LuminaireCountListBox(ListBox):
         achieved_illuminance_row.add_suffix(self.achieved_illuminance_label)
         self.append(achieved_illuminance_row)
 
+        self.layout_label = Label()
+        layout_row = ActionRow(title=_("Luminaire layout"))
+        layout_row.add_suffix(self.layout_label)
+        self.append(layout_row)
+
+        self.min_illuminance_label = Label()
+        min_illuminance_row = ActionRow(title=_("Minimal illuminance"), subtitle="lx")
+        min_illuminance_row.add_suffix(self.min_illuminance_label)
+        self.append(min_illuminance_row)
+
+        self.avg_illuminance_label = Label()
+        avg_illuminance_row = ActionRow(title=_("Average illuminance"), subtitle="lx")
+        avg_illuminance_row.add_suffix(self.avg_illuminance_label)
+        self.append(avg_illuminance_row)
+
+        self.max_illuminance_label = Label()
+        max_illuminance_row = ActionRow(title=_("Maximal illuminance"), subtitle="lx")
+        max_illuminance_row.add_suffix(self.max_illuminance_label)
+        self.append(max_illuminance_row)
+
+        self.uniformity_label = Label()
+        uniformity_row = ActionRow(title=_("Uniformity"), subtitle="Emin / Eavg")
+        uniformity_row.add_suffix(self.uniformity_label)
+        self.append(uniformity_row)
+
         self.set_count(None)
         self.set_achieved_illuminance(None)
+        self.set_illuminance_grid(None, None)
 
     def set_count(self, count: int | None):
         if count is not None:
@@ -34,3 +62,25 @@ class LuminaireCountListBox(ListBox):
         else:
             self.achieved_illuminance_label.set_label(_("Unknown"))
 
+
+    def set_illuminance_grid(self, layout: tuple[int, int] | None, grid: IlluminanceGrid | None):
+        if layout is not None:
+            self.layout_label.set_label(f"{layout[0]} × {layout[1]}")
+        else:
+            self.layout_label.set_label(_("Unknown"))
+
+        if grid is None:
+            for label in [
+                self.min_illuminance_label,
+                self.avg_illuminance_label,
+                self.max_illuminance_label,
+                self.uniformity_label
+            ]:
+                label.set_label(_("Unknown"))
+            return
+
+        self.min_illuminance_label.set_label(f"{grid.e_min:.1f}")
+        self.avg_illuminance_label.set_label(f"{grid.e_avg:.1f}")
+        self.max_illuminance_label.set_label(f"{grid.e_max:.1f}")
+        uniformity = grid.uniformity
+        self.uniformity_label.set_label(f"{uniformity:.2f}" if uniformity is not None else _("Unknown"))
@@ -95,6 +95,10 @@ class ZonePropertiesListBox(ListBox):
         self.zone_length_row.connect("notify::value", self.on_update)
         self.append(self.zone_length_row)
 
+        self.mounting_height_row = SpinRow(title=_("Mounting height"), value=2)
+        self.mounting_height_row.connect("notify::value", self.on_update)
+        self.append(self.mounting_height_row)
+
         self.target_illuminance = SpinRow(
             title=_("Required illuminance"),
             subtitle="lx",
@@ -144,11 +148,16 @@ class ZonePropertiesListBox(ListBox):
         self.zone_length_row.set_subtitle(_(spin_row_properties.subtitle))
         self.zone_length_row.set_adjustment(spin_row_properties.to_adjustment())
 
+        self.mounting_height_row.set_digits(spin_row_properties.digits)
+        self.mounting_height_row.set_subtitle(_(spin_row_properties.subtitle))
+        self.mounting_height_row.set_adjustment(spin_row_properties.to_adjustment())
+
     def apply_values(self):
         f = length_factor(self.settings.length_units)
 
         self.zone_width_row.set_value(self.zone_properties.width * f)
         self.zone_length_row.set_value(self.zone_properties.length * f)
+        self.mounting_height_row.set_value(self.zone_properties.mounting_height * f)
         self.target_illuminance.set_value(self.zone_properties.target_illuminance)
         self.maintenance_factor.set_value(self.zone_properties.maintenance_factor)
 
@@ -160,11 +169,13 @@ class ZonePropertiesListBox(ListBox):
 
         zone_w = self.zone_width_row.get_value() / f
         zone_l = self.zone_length_row.get_value() / f
+        mounting_height = self.mounting_height_row.get_value() / f
         illuminance = self.target_illuminance.get_value()
         mf = self.maintenance_factor.get_value()
 
         self.zone_properties.width = zone_w
         self.zone_properties.length = zone_l
+        self.zone_properties.mounting_height = mounting_height
         self.zone_properties.target_illuminance = illuminance
         self.zone_properties.maintenance_factor = mf
 
@@ -1,16 +1,24 @@
 import dataclasses
+from typing import Tuple
 
 from gi.repository import Adw, Gtk
+from gi.repository.Adw import SwitchRow
 from gi.repository.Gtk import SelectionMode
 
+from photometric_viewer.utils.resampling import CATALOG_GRID, SIMULATION_GRID
+
 
 @dataclasses.dataclass
 class LdtExportProperties:
-    pass
+    # Steps of C and gamma angles of the exported grid, None keeps the measured angles
+    grid: Tuple[float, float] | None = None
+    preserve_flux: bool = False
 
 @dataclasses.dataclass
 class IesExportProperties:
-    pass
+    # Steps of C and gamma angles of the exported grid, None keeps the measured angles
+    grid: Tuple[float, float] | None = None
+    preserve_flux: bool = False
 
 class PhotometryExportList(Gtk.ListBox):
     def __init__(self):
@@ -30,8 +38,35 @@ class PhotometryExportList(Gtk.ListBox):
         )
         self.append(self.format_selection_row)
 
+        self.grids = [None, CATALOG_GRID, SIMULATION_GRID]
+        self.grid_selection_row = Adw.ComboRow(
+            title=_("Angle grid"),
+            model=Gtk.StringList.new(
+                [
+                    _("Measured angles"),
+                    _("Catalog ({}° × {}°)").format(*CATALOG_GRID),
+                    _("Simulation ({}° × {}°)").format(*SIMULATION_GRID)
+                ]
+            )
+        )
+        self.grid_selection_row.connect("notify::selected", self.on_grid_selected)
+        self.append(self.grid_selection_row)
+
+        self.preserve_flux_row = SwitchRow(
+            title=_("Preserve luminous flux"),
+            subtitle=_("Rescale resampled intensities to the luminous flux of the measured ones"),
+            active=True,
+            sensitive=False
+        )
+        self.append(self.preserve_flux_row)
+
+    def on_grid_selected(self, *args):
+        self.preserve_flux_row.set_sensitive(self.grids[self.grid_selection_row.get_selected()] is not None)
+
     def get_current_properties(self):
+        grid = self.grids[self.grid_selection_row.get_selected()]
+        preserve_flux = self.preserve_flux_row.get_active()
         if self.format_selection_row.get_selected() == 0:
-            return LdtExportProperties()
+            return LdtExportProperties(grid=grid, preserve_flux=preserve_flux)
         else:
-            return IesExportProperties()
\ No newline at end of file
+            return IesExportProperties(grid=grid, preserve_flux=preserve_flux)
\ No newline at end of file
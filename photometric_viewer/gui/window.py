@@ -1,5 +1,7 @@
 import io
 import logging
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, Future
 from datetime import datetime
 from typing import Optional, IO
 
@@ -10,16 +12,19 @@ import photometric_viewer.formats.csv
 import photometric_viewer.formats.format_json
 import photometric_viewer.formats.png
 import photometric_viewer.formats.svg
-from photometric_viewer.formats import ldt, ies
-from photometric_viewer.formats.common import import_from_file
+from photometric_viewer.formats import ldt, ies, binary
+from photometric_viewer.formats.common import import_from_file, import_from_string, import_from_bytes, \
+    editable_source, is_imported
 from photometric_viewer.formats.exceptions import InvalidPhotometricFileFormatException
 from photometric_viewer.gui.dialogs.about import AboutWindow
 from photometric_viewer.gui.dialogs.file_chooser import ExportFileChooser, FileChooser
 from photometric_viewer.gui.dialogs.preferences import PreferencesWindow
 from photometric_viewer.gui.pages.ballast_set import BallastPage
+from photometric_viewer.gui.pages.catalog import CatalogPage
 from photometric_viewer.gui.pages.base import BasePage
 from photometric_viewer.gui.pages.content import PhotometryContentPage
 from photometric_viewer.gui.pages.direct_ratios import DirectRatiosPage
+from photometric_viewer.gui.pages.utilization import CoefficientsOfUtilizationPage
 from photometric_viewer.gui.pages.empty import EmptyContentPage
 from photometric_viewer.gui.pages.geometry import GeometryPage
 from photometric_viewer.gui.pages.lamp_set import LampSetPage
@@ -32,10 +37,14 @@ from photometric_viewer.gui.pages.source import SourceViewPage
 from photometric_viewer.gui.pages.values import IntensityValuesPage
 from photometric_viewer.gui.widgets.common.split_view import SplitView
 from photometric_viewer.model.luminaire import Luminaire
+from photometric_viewer.utils.cache import LuminaireCache
 from photometric_viewer.utils.gi.GSettings import SettingsManager
-from photometric_viewer.utils.gi.gio import gio_file_stream, write_string
+from photometric_viewer.utils.gi.gio import write_string, write_bytes
 from photometric_viewer.utils.project import PROJECT
 
+# Edits of the source arriving within this time are parsed together
+SOURCE_UPDATE_DELAY_MS = 300
+
 
 class MainWindow(Adw.ApplicationWindow):
     def __init__(self, **kwargs):
@@ -50,6 +59,16 @@ class MainWindow(Adw.ApplicationWindow):
         self.is_dirty = False
         self.is_empty = True
 
+        self.source_revision = 0
+        self.source_update_timeout_id: int | None = None
+        self.source_parser = ThreadPoolExecutor(max_workers=1)
+        self.luminaire_cache = LuminaireCache()
+        self.pending_source_parse: Future | None = None
+
+        self.open_revision = 0
+        self.open_cancellable: Gio.Cancellable | None = None
+        self.open_progress_toast: Adw.Toast | None = None
+
         self.set_default_size(1000, 700)
         self.install_actions()
 
@@ -67,6 +86,7 @@ class MainWindow(Adw.ApplicationWindow):
         self.ldc_export_page = LdcExportPage(on_exported=self.on_export_response, transient_for=self)
         self.photometry_export_page = PhotometryExportPage(on_exported=self.on_export_response, transient_for=self)
         self.direct_ratios_page = DirectRatiosPage()
+        self.utilization_page = CoefficientsOfUtilizationPage()
         self.photometry_page = PhotometryPage()
         self.geometry_page = GeometryPage()
         self.lamp_set_page = LampSetPage()
@@ -74,6 +94,7 @@ class MainWindow(Adw.ApplicationWindow):
         self.ldc_zoom_page = LdcZoomPage()
 
         self.number_of_luminaires_calculation_page = NumberOfLuminairesCalculationPage()
+        self.catalog_page = CatalogPage(on_open_file=self.open_file, transient_for=self)
 
         self.navigation_view.replace([self.empty_page])
         self.on_new()
@@ -101,6 +122,9 @@ class MainWindow(Adw.ApplicationWindow):
         self.csv_export_file_chooser = ExportFileChooser.for_csv(transient_for=self)
         self.csv_export_file_chooser.connect("response", self.on_export_csv_response)
 
+        self.binary_export_file_chooser = ExportFileChooser.for_binary(transient_for=self)
+        self.binary_export_file_chooser.connect("response", self.on_export_binary_response)
+
         self.set_content(self.toast_overlay)
 
         self.drop_target = DropTarget(
@@ -130,7 +154,8 @@ class MainWindow(Adw.ApplicationWindow):
                 ("open", self.on_open),
                 ("new", self.on_new),
                 ("show_ldc_zoom", self.on_show_ldc_zoom),
-                ("toggle_sidebar", self.on_toggle_sidebar)
+                ("toggle_sidebar", self.on_toggle_sidebar),
+                ("show_catalog", self.show_catalog)
             ]
         )
 
@@ -146,6 +171,7 @@ class MainWindow(Adw.ApplicationWindow):
         self.values_table_page.set_photometry(luminaire)
         self.ldc_export_page.set_photometry(luminaire)
         self.direct_ratios_page.set_photometry(luminaire)
+        self.utilization_page.set_photometry(luminaire)
         self.photometry_page.set_photometry(luminaire)
         self.geometry_page.set_photometry(luminaire)
         self.ldc_zoom_page.set_photometry(luminaire)
@@ -235,6 +261,18 @@ class MainWindow(Adw.ApplicationWindow):
         write_string(file, data)
         self.show_banner(_("Exported as {}").format(file.get_basename()))
 
+    def on_export_binary_response(self, dialog: FileChooserDialog, response):
+        if not self.opened_photometry:
+            return
+
+        if response != Gtk.ResponseType.ACCEPT:
+            return
+
+        file: Gio.File = dialog.get_file()
+        data = binary.export_photometry(self.opened_photometry)
+        write_bytes(file, data)
+        self.show_banner(_("Exported as {}").format(file.get_basename()))
+
     def on_export_response(self, filename):
         self.show_start_page()
         self.show_banner(_("Exported as {}").format(filename))
@@ -267,62 +305,117 @@ class MainWindow(Adw.ApplicationWindow):
 
         try:
             self.is_opening = True
-            photometry = import_from_file(f)
-
-            self.display_photometry_content(photometry)
-
-            self.add_action_entries(
-                [
-                    ("show_intensity_values", self.show_intensity_values),
-                    ("show_source", self.show_source),
-                    ("show_direct_ratios", self.show_direct_ratios),
-                    ("show_photometry", self.show_photometry),
-                    ("show_geometry", self.show_geometry),
-                    ("show_lamp_set", self.show_lamp_set, "i"),
-                    ("show_ballast", self.show_ballast, "i"),
-                    ("export_luminaire_as_json", self.show_json_export_file_chooser),
-                    ("export_intensities_as_csv", self.show_csv_export_file_chooser),
-                    ("export_ldc_as_image", self.show_ldc_export_page),
-                    ("export_photometry", self.show_photometry_export_page),
-                    ("calculate_luminaire_count", self.show_number_of_luminaires_calculation_page),
-                    ("save", self.on_save),
-                    ("autosave", self.on_autosave),
-                    ("save_as", self.on_save_as),
-                    ("open_url", self.on_open_url, "s")
-                ]
-            )
+            photometry = import_from_file(f, self.luminaire_cache)
+            self.show_photometry_content(photometry)
         finally:
             self.is_opening = False
 
+    def show_photometry_content(self, photometry: Luminaire):
+        self.display_photometry_content(photometry)
 
-    def update_file(self, file: Gio.File):
-        self.opened_file = file
+        self.add_action_entries(
+            [
+                ("show_intensity_values", self.show_intensity_values),
+                ("show_source", self.show_source),
+                ("show_direct_ratios", self.show_direct_ratios),
+                ("show_coefficients_of_utilization", self.show_coefficients_of_utilization),
+                ("show_photometry", self.show_photometry),
+                ("show_geometry", self.show_geometry),
+                ("show_lamp_set", self.show_lamp_set, "i"),
+                ("show_ballast", self.show_ballast, "i"),
+                ("export_luminaire_as_json", self.show_json_export_file_chooser),
+                ("export_intensities_as_csv", self.show_csv_export_file_chooser),
+                ("export_luminaire_as_binary", self.show_binary_export_file_chooser),
+                ("export_ldc_as_image", self.show_ldc_export_page),
+                ("export_photometry", self.show_photometry_export_page),
+                ("calculate_luminaire_count", self.show_number_of_luminaires_calculation_page),
+                ("save", self.on_save),
+                ("autosave", self.on_autosave),
+                ("save_as", self.on_save_as),
+                ("open_url", self.on_open_url, "s")
+            ]
+        )
+
+
+    def update_file(self, file: Gio.File, is_import: bool = False):
+        # Imported files are not saved back, their content is saved as a new EULUMDAT file
+        self.opened_file = None if is_import else file
         filename = file.get_basename()
         self.set_title(title=filename)
         self.window_title.set_subtitle(filename)
-        self.save_as_file_chooser.set_file(file)
+        if is_import:
+            self.save_as_file_chooser.set_current_name(f"{Path(filename).stem}.ldt")
+        else:
+            self.save_as_file_chooser.set_file(file)
         self.json_export_file_chooser.set_current_name(f"{filename}.json")
         self.csv_export_file_chooser.set_current_name(f"{filename}.csv")
+        self.binary_export_file_chooser.set_current_name(f"{filename}{binary.FILE_EXTENSION}")
         self.photometry_export_page.set_current_name(f"{filename}_exported")
 
     def open_file(self, file: Gio.File):
-        try:
-            with (gio_file_stream(file) as f):
-                self.open_stream(f)
-                f.seek(0)
-                self.source_view_page.open_stream(f)
-                self.update_file(file)
-                self.show_start_page()
+        if self.open_cancellable:
+            self.open_cancellable.cancel()
+
+        self.open_revision += 1
+        self.open_cancellable = Gio.Cancellable()
+        self.show_open_progress(file)
+
+        revision = self.open_revision
+        file.load_contents_async(
+            self.open_cancellable,
+            lambda source, result: self.on_file_loaded(file, revision, result)
+        )
+
+    def on_file_loaded(self, file: Gio.File, revision: int, result: Gio.AsyncResult):
+        if revision != self.open_revision:
+            return
 
+        try:
+            _, contents, _ = file.load_contents_finish(result)
         except GLib.GError as e:
+            self.hide_open_progress()
+            if e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                return
             logging.exception("Could not open photometric file")
             self.show_banner(e.message)
+            return
+
+        future = self.source_parser.submit(import_from_bytes, contents, self.luminaire_cache)
+        future.add_done_callback(lambda f: GLib.idle_add(self.on_file_parsed, file, revision, f))
+
+    def on_file_parsed(self, file: Gio.File, revision: int, future: Future):
+        if revision != self.open_revision:
+            return GLib.SOURCE_REMOVE
+
+        self.hide_open_progress()
+        self.open_cancellable = None
+
+        try:
+            photometry = future.result()
         except InvalidPhotometricFileFormatException as e:
             logging.exception("Could not open photometric file")
             self.show_banner(_("Invalid content of photometric file {}").format(file.get_path()), str(e))
+            return GLib.SOURCE_REMOVE
         except Exception:
             logging.exception("Could not open photometric file")
             self.show_banner(_("Could not open {}").format(file.get_path()))
+            return GLib.SOURCE_REMOVE
+
+        self.show_photometry_content(photometry)
+        self.source_view_page.set_source(editable_source(photometry))
+        self.update_file(file, is_import=is_imported(photometry))
+        self.show_start_page()
+        return GLib.SOURCE_REMOVE
+
+    def show_open_progress(self, file: Gio.File):
+        self.hide_open_progress()
+        self.open_progress_toast = Adw.Toast(title=_("Opening {}…").format(file.get_basename()), timeout=0)
+        self.toast_overlay.add_toast(self.open_progress_toast)
+
+    def hide_open_progress(self):
+        if self.open_progress_toast:
+            self.open_progress_toast.dismiss()
+            self.open_progress_toast = None
 
     def show_preferences(self, *args):
         window = PreferencesWindow()
@@ -338,6 +431,9 @@ class MainWindow(Adw.ApplicationWindow):
     def show_direct_ratios(self, *args):
         self.navigation_view.push(self.direct_ratios_page)
 
+    def show_coefficients_of_utilization(self, *args):
+        self.navigation_view.push(self.utilization_page)
+
     def show_photometry(self, *args):
         self.navigation_view.push(self.photometry_page)
 
@@ -347,6 +443,10 @@ class MainWindow(Adw.ApplicationWindow):
     def show_number_of_luminaires_calculation_page(self, *args):
         self.navigation_view.push(self.number_of_luminaires_calculation_page)
 
+    def show_catalog(self, *args):
+        self.catalog_page.show()
+        self.navigation_view.push(self.catalog_page)
+
     def show_lamp_set(self, action, params: GLib.Variant, *args):
         if self.opened_photometry is None:
             return
@@ -382,6 +482,9 @@ class MainWindow(Adw.ApplicationWindow):
     def show_csv_export_file_chooser(self, *args):
         self.csv_export_file_chooser.show()
 
+    def show_binary_export_file_chooser(self, *args):
+        self.binary_export_file_chooser.show()
+
     def show_photometry_export_page(self, *args):
         self.navigation_view.push(self.photometry_export_page)
 
@@ -390,15 +493,51 @@ class MainWindow(Adw.ApplicationWindow):
 
     def on_update_source(self, buffer: Gtk.TextBuffer):
         self.is_dirty = True
+        self.source_revision += 1
+
+        if self.pending_source_parse:
+            self.pending_source_parse.cancel()
+
+        if self.source_update_timeout_id is not None:
+            GLib.source_remove(self.source_update_timeout_id)
+            self.source_update_timeout_id = None
+
+        # Content loaded into the editor by open_file has already been parsed
+        if self.source_view_page.opening:
+            self.toggle_empty_page(has_content=buffer.get_char_count() > 0)
+            return
+
+        self.source_update_timeout_id = GLib.timeout_add(SOURCE_UPDATE_DELAY_MS, self.on_source_update_timeout)
+
+    def on_source_update_timeout(self):
+        self.source_update_timeout_id = None
+
+        buffer = self.source_view_page.source_text_view.get_buffer()
         start = buffer.get_start_iter()
         end = buffer.get_end_iter()
 
         content = buffer.get_text(start, end, True)
-        self.toggle_empty_page(content)
+        self.toggle_empty_page(has_content=bool(content))
 
-        self.open_stream(
-            io.StringIO(content)
+        revision = self.source_revision
+        self.pending_source_parse = self.source_parser.submit(import_from_string, content)
+        self.pending_source_parse.add_done_callback(
+            lambda future: GLib.idle_add(self.on_source_parsed, revision, future)
         )
+        return GLib.SOURCE_REMOVE
+
+    def on_source_parsed(self, revision: int, future: Future):
+        if revision != self.source_revision or future.cancelled():
+            return GLib.SOURCE_REMOVE
+
+        try:
+            photometry = future.result()
+        except Exception:
+            logging.debug("Could not parse edited source", exc_info=True)
+            return GLib.SOURCE_REMOVE
+
+        self.show_photometry_content(photometry)
+        return GLib.SOURCE_REMOVE
 
     def show_banner(self, message: str, details: str | None = None):
         toast = Adw.Toast()
@@ -409,11 +548,11 @@ class MainWindow(Adw.ApplicationWindow):
             toast.set_title(message)
         self.toast_overlay.add_toast(toast)
 
-    def toggle_empty_page(self, content: str):
-        if content and self.is_empty:
+    def toggle_empty_page(self, has_content: bool):
+        if has_content and self.is_empty:
             self.navigation_view.replace([self.luminaire_content_page])
             self.is_empty = False
-        elif not content and not self.is_empty:
+        elif not has_content and not self.is_empty:
             self.navigation_view.replace([self.empty_page])
             self.is_empty = True
 
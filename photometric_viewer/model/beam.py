@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BeamAngles:
+    # C angle of the plane, measured together with the opposite plane c_angle + 180
+    c_angle: float
+    # Full angles in degrees within which intensity stays above 50% (beam) and 10% (field) of the peak intensity
+    beam_angle: float | None
+    field_angle: float | None
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass
+class BugRating:
+    backlight: int
+    uplight: int
+    glare: int
+    # Luminous flux in lm of zones FL, FM, FH, FVH, BL, BM, BH, BVH, UL and UH
+    zone_flux: Dict[str, float]
+
+    def __str__(self):
+        return f"B{self.backlight} U{self.uplight} G{self.glare}"
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import List
+
+from photometric_viewer.model.utilization import CavityReflectances
+
+
+@dataclass
+class UgrRoom:
+    # Room dimensions across (x) and along (y) the line of sight, in multiples of the height H
+    # of luminaires above the eye of the observer
+    x: float
+    y: float
+
+
+@dataclass
+class UgrTable:
+    rooms: List[UgrRoom]
+    reflectances: List[CavityReflectances]
+    # Spacing of luminaires in multiples of H
+    spacing: float
+    # One row per room and one value per combination of reflectances. Luminaires are seen crosswise
+    # when their C0-C180 plane is across the line of sight, and endwise when it is along the line of sight
+    crosswise: List[List[float | None]]
+    endwise: List[List[float | None]]
@@ -0,0 +1,162 @@
+import math
+from array import array
+from collections.abc import Mapping
+from typing import Iterable, Iterator, Tuple
+
+_MISSING = math.nan
+
+
+def _is_missing(value: float) -> bool:
+    return value != value
+
+
+class IntensityGrid(Mapping):
+    """
+    Dense C x gamma table of intensity values.
+
+    Angles are kept in sorted axes and values are stored row by row (one row per C plane)
+    in a contiguous array of doubles. Combinations that are not present in the photometric
+    file are stored as NaN and are hidden from the mapping interface, so the grid can be used
+    wherever a Dict[Tuple[float, float], float] keyed by (c, gamma) was expected.
+
+    Values given as a memoryview of doubles, e.g. over a memory-mapped file, are used without copying.
+
+    C planes mirrored by the symmetry of the luminaire can share a single stored row. row_sources gives
+    the index of the stored row of every C plane, without it every C plane has a row of its own.
+    """
+
+    def __init__(
+            self,
+            c_angles: Iterable[float] = (),
+            gamma_angles: Iterable[float] = (),
+            values: Iterable[float] | memoryview | None = None,
+            row_sources: Iterable[int] | None = None
+    ):
+        self.c_angles: Tuple[float, ...] = tuple(c_angles)
+        self.gamma_angles: Tuple[float, ...] = tuple(gamma_angles)
+        self._c_index = {c: i for i, c in enumerate(self.c_angles)}
+        self._gamma_index = {gamma: i for i, gamma in enumerate(self.gamma_angles)}
+
+        if row_sources is None:
+            self.row_sources: Tuple[int, ...] = tuple(range(len(self.c_angles)))
+            n_rows = len(self.c_angles)
+        else:
+            self.row_sources = tuple(row_sources)
+            if len(self.row_sources) != len(self.c_angles):
+                raise ValueError(f"Expected {len(self.c_angles)} row sources, got {len(self.row_sources)}")
+            n_rows = max(self.row_sources) + 1 if self.row_sources else 0
+        self._is_compact = n_rows < len(self.c_angles)
+
+        size = n_rows * len(self.gamma_angles)
+        if values is None:
+            self.values = array("d", [_MISSING]) * size
+        elif isinstance(values, memoryview) and values.format == "d":
+            self.values = values
+        else:
+            self.values = array("d", values)
+
+        if len(self.values) != size:
+            raise ValueError(f"Expected {size} intensity values, got {len(self.values)}")
+
+        # Counted on first use, so that wrapping a memory-mapped buffer does not read all values
+        self._length: int | None = None
+
+    @classmethod
+    def from_mapping(cls, values: Mapping) -> "IntensityGrid":
+        if isinstance(values, IntensityGrid):
+            return values
+
+        items = [
+            (angles, value) for angles, value in values.items()
+            if angles[0] is not None and angles[1] is not None and value is not None
+        ]
+
+        grid = cls(
+            c_angles=sorted({angles[0] for angles, _ in items}),
+            gamma_angles=sorted({angles[1] for angles, _ in items})
+        )
+
+        n_gamma = len(grid.gamma_angles)
+        for (c, gamma), value in items:
+            grid.values[grid._c_index[c] * n_gamma + grid._gamma_index[gamma]] = value
+
+        return grid
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.c_angles), len(self.gamma_angles)
+
+    @property
+    def is_compact(self) -> bool:
+        """
+        True when some C planes share their stored rows
+        """
+        return self._is_compact
+
+    def _offset(self, c_index: int) -> int:
+        return self.row_sources[c_index] * len(self.gamma_angles)
+
+    def dense_values(self) -> array | memoryview:
+        """
+        Returns values of all C planes row by row, with rows shared by mirrored C planes repeated
+        """
+        if not self.is_compact:
+            return self.values
+        values = array("d")
+        for i in range(len(self.c_angles)):
+            values.extend(self.values[self._offset(i):self._offset(i) + len(self.gamma_angles)])
+        return values
+
+    def c_index(self, c_angle: float) -> int | None:
+        return self._c_index.get(c_angle)
+
+    def gamma_index(self, gamma_angle: float) -> int | None:
+        return self._gamma_index.get(gamma_angle)
+
+    def row(self, c_angle: float) -> array:
+        """
+        Returns intensities of a single C plane ordered by gamma_angles, NaN where values are missing
+        """
+        i = self._c_index.get(c_angle)
+        if i is None:
+            return array("d")
+        offset = self._offset(i)
+        return self.values[offset:offset + len(self.gamma_angles)]
+
+    def max(self) -> float | None:
+        present = [v for v in self.values if not _is_missing(v)]
+        return max(present) if present else None
+
+    def __getitem__(self, key: Tuple[float, float]) -> float:
+        c, gamma = key
+        i = self._c_index.get(c)
+        j = self._gamma_index.get(gamma)
+        if i is None or j is None:
+            raise KeyError(key)
+
+        value = self.values[self._offset(i) + j]
+        if _is_missing(value):
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        for i, c in enumerate(self.c_angles):
+            offset = self._offset(i)
+            for j, gamma in enumerate(self.gamma_angles):
+                if not _is_missing(self.values[offset + j]):
+                    yield c, gamma
+
+    def __len__(self) -> int:
+        if self._length is None:
+            values = self.dense_values()
+            self._length = sum(1 for v in values if not _is_missing(v))
+        return self._length
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if isinstance(self.values, memoryview):
+            state["values"] = array("d", self.values)
+        return state
+
+    def __repr__(self):
+        return f"IntensityGrid({dict(self.items())!r})"
@@ -1,9 +1,14 @@
+import itertools
+import math
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Tuple, List, Any
+from typing import Dict, Tuple, List, Any, Mapping, Callable
 
+from photometric_viewer.model.intensities import IntensityGrid
 from photometric_viewer.model.units import LengthUnits
 
+_revisions = itertools.count()
+
 
 class LuminaireType(Enum):
     POINT_SOURCE_WITH_VERTICAL_SYMMETRY = 1
@@ -120,19 +125,88 @@ class LuminairePhotometricProperties:
     def get(self):
         return self.luminous_flux
 
+
+@dataclass
+class LuminaireSummary:
+    """
+    Properties of a luminaire which can be read from the header of a photometric file, without intensity values
+    """
+    metadata: PhotometryMetadata
+    lamps: List[Lamps] = field(default_factory=list)
+    number_of_c_planes: int = 0
+    number_of_gamma_angles: int = 0
+
+
 @dataclass
 class Luminaire:
     gamma_angles: List[float] = field(default_factory=list)
-    c_planes: List[float] = field(default_factory=list)
+    c_planes: List[float]
     # Values in Candela for absolute photometry, cd/klm otherwise
-    intensity_values: Dict[Tuple[float, float], float] = field(default_factory=dict)
+    intensity_values: IntensityGrid
     luminous_opening_geometry: LuminousOpeningGeometry | None = None
     geometry: LuminaireGeometry | None = None
-    lamps: List[Lamps] = field(default_factory=list)
-    metadata: PhotometryMetadata = field(default_factory=PhotometryMetadata)
+    lamps: List[Lamps]
+    metadata: PhotometryMetadata
 
     photometry: LuminairePhotometricProperties
     _photometry: LuminairePhotometricProperties = field(init=False, repr=False)
+    _intensity_values: IntensityGrid = field(init=False, repr=False)
+    _c_planes: List[float] = field(init=False, repr=False)
+    _lamps: List[Lamps] = field(init=False, repr=False)
+    _metadata: PhotometryMetadata = field(init=False, repr=False)
+    # Changes whenever c_planes, intensity_values, lamps, metadata or photometry are replaced
+    _revision: int = field(init=False, repr=False, compare=False)
+    # Values of C planes already looked up by get_values_for_c_angle, with mirrored planes resolved
+    _c_plane_index: Dict[float, Dict[float, float]] = field(init=False, repr=False, compare=False, default_factory=dict)
+    # Values calculated by get_derived_value, together with the revision they were calculated for
+    _derived_values: Dict[str, Tuple[int, Any]] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+    def _invalidate(self):
+        self._revision = next(_revisions)
+        self._c_plane_index = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_c_plane_index"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Revisions are only unique within a process, so restored derived values are moved to a fresh one
+        revision = state["_revision"]
+        self._revision = next(_revisions)
+        self._derived_values = {
+            key: (self._revision, value)
+            for key, (value_revision, value) in state["_derived_values"].items()
+            if value_revision == revision
+        }
+
+    @property
+    def c_planes(self) -> List[float]:
+        return self._c_planes
+
+    @c_planes.setter
+    def c_planes(self, value: List[float]):
+        # Without an explicit value, dataclass passes the property itself as the default
+        if isinstance(value, property):
+            value = []
+        self._c_planes = value
+        self._invalidate()
+
+    @property
+    def intensity_values(self) -> IntensityGrid:
+        return self._intensity_values
+
+    @intensity_values.setter
+    def intensity_values(self, value: Mapping[Tuple[float, float], float]):
+        if isinstance(value, property):
+            value = {}
+        self._intensity_values = IntensityGrid.from_mapping(value)
+        self._invalidate()
 
     @property
     def photometry(self) -> LuminairePhotometricProperties:
@@ -141,8 +215,50 @@ class Luminaire:
     @photometry.setter
     def photometry(self, value: LuminairePhotometricProperties):
         self._photometry = value
+        self._invalidate()
+
+    @property
+    def lamps(self) -> List[Lamps]:
+        return self._lamps
+
+    @lamps.setter
+    def lamps(self, value: List[Lamps]):
+        if isinstance(value, property):
+            value = []
+        self._lamps = value
+        self._invalidate()
+
+    @property
+    def metadata(self) -> PhotometryMetadata:
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: PhotometryMetadata):
+        if isinstance(value, property):
+            value = PhotometryMetadata()
+        self._metadata = value
+        self._invalidate()
+
+    def get_derived_value(self, key: str, calculate: Callable[["Luminaire"], Any]) -> Any:
+        """
+        Returns the result of calculate(self), calculating it only once per revision of the luminaire.
+        The revision changes when attributes of the luminaire are assigned, not when objects they hold are
+        modified in place, so lamps or metadata have to be replaced to invalidate derived values
+        """
+        revision, value = self._derived_values.get(key, (None, None))
+        if revision != self._revision:
+            value = calculate(self)
+            self._derived_values[key] = (self._revision, value)
+        return value
 
     def get_values_for_c_angle(self, angle) -> Dict[float, float]:
+        values = self._c_plane_index.get(angle)
+        if values is None:
+            values = self._resolve_values_for_c_angle(angle)
+            self._c_plane_index[angle] = values
+        return values
+
+    def _resolve_values_for_c_angle(self, angle) -> Dict[float, float]:
         if angle in self.c_planes:
             return self._values_for_angle(angle)
         elif angle < 180 and angle + 180 in self.c_planes:
@@ -154,7 +270,7 @@ class Luminaire:
 
     def _values_for_angle(self, angle):
         return {
-            angles[1]: candelas
-            for (angles, candelas) in self.intensity_values.items()
-            if angles[0] == angle
+            gamma: candelas
+            for gamma, candelas in zip(self.intensity_values.gamma_angles, self.intensity_values.row(angle))
+            if not math.isnan(candelas)
         }
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import List
 
 from photometric_viewer.model.units import LengthUnits
 
@@ -32,3 +33,4 @@ class Settings:
     editor_grid: bool = False
     editor_highlight_current_line: bool = True
     editor_show_line_numbers: bool = True
+    catalog_directories: List[str] = field(default_factory=list)
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class CavityReflectances:
+    ceiling: float
+    walls: float
+    floor: float
+
+
+@dataclass
+class CoefficientsOfUtilization:
+    room_cavity_ratios: List[float]
+    reflectances: List[CavityReflectances]
+    # Fraction of the rated lamp flux reaching the workplane, one row per room cavity ratio
+    # and one value per combination of reflectances
+    values: List[List[float]]
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class ZonalLumens:
+    # Gamma angles limiting the zone
+    lower: float
+    upper: float
+    lumens: float
+    # Fraction of the rated flux of lamps, None when unknown
+    lamp_fraction: float | None
+    # Fraction of the flux of the luminaire
+    luminaire_fraction: float
+
+
+@dataclass
+class ZonalLumenSummary:
+    # Zones of the summary: 0-30°, 0-40°, 0-60°, 0-90°, 90-180° and 0-180°
+    zones: List[ZonalLumens]
+    # Zones 0-10°, 10-20°, ..., 170-180°
+    bands: List[ZonalLumens]
@@ -7,3 +7,5 @@ class ZoneProperties:
     length: float
     target_illuminance: float
     maintenance_factor: float
+    # Height of luminaires above the workplane
+    mounting_height: float = 2.0
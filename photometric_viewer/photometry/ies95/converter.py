@@ -1,8 +1,8 @@
-from typing import Dict, Tuple
+from typing import Dict, Tuple, List
 
 from photometric_viewer.model.luminaire import LuminousOpeningGeometry
 from photometric_viewer.model.luminaire import Luminaire, PhotometryMetadata, FileFormat, Lamps, \
-    LuminairePhotometricProperties, Calculable, LuminousOpeningShape
+    LuminairePhotometricProperties, Calculable, LuminousOpeningShape, LuminaireSummary
 from photometric_viewer.model.units import LengthUnits
 from photometric_viewer.photometry.ies95.model import IesContent
 from photometric_viewer.utils.conversion import safe_float
@@ -12,6 +12,7 @@ def convert_content(content: IesContent) -> Luminaire:
     metadata = _convert_metadata(content)
     candela_values = _convert_candela_values(content)
     is_absolute = _get_is_absolute(content)
+    lamps = _convert_lamps(content, metadata, is_absolute)
 
     return Luminaire(
         gamma_angles=content.v_angles,
@@ -26,28 +27,51 @@ def convert_content(content: IesContent) -> Luminaire:
             dff=Calculable(None),
             efficacy=Calculable(None)
         ),
-        lamps=[Lamps(
-            number_of_lamps=content.inline_attributes.number_of_lamps,
-            lumens_per_lamp=content.inline_attributes.lumens_per_lamp if not is_absolute else None,
-            description=metadata.pop("LAMP", None),
-            catalog_number=metadata.pop("LAMPCAT", None),
-            position=metadata.pop("LAMPPOSITION", None),
-            ballast_catalog_number=metadata.pop("BALLASTCAT", None),
-            ballast_description=metadata.pop("BALLAST", None),
-            wattage=content.lamp_attributes.input_watts,
-            color=metadata.pop("COLORTEMP", None),
-            cri=metadata.pop("CRI", None),
-        )],
-        metadata=PhotometryMetadata(
-            catalog_number=metadata.pop("LUMCAT", None),
-            luminaire=metadata.pop("LUMINAIRE", None),
-            manufacturer=metadata.pop("MANUFAC", None),
-            date_and_user=metadata.pop("DATE", None),
-            additional_properties=metadata,
-            file_source="",
-            file_format=FileFormat.IES,
-            file_units=_convert_file_units(content)
-        )
+        lamps=lamps,
+        metadata=_convert_photometry_metadata(content, metadata)
+    )
+
+
+def convert_summary(content: IesContent) -> LuminaireSummary:
+    metadata = _convert_metadata(content)
+    lamps = _convert_lamps(content, metadata, _get_is_absolute(content))
+
+    return LuminaireSummary(
+        metadata=_convert_photometry_metadata(content, metadata),
+        lamps=lamps,
+        number_of_c_planes=content.inline_attributes.n_h_angles or 0,
+        number_of_gamma_angles=content.inline_attributes.n_v_angles or 0
+    )
+
+
+def _convert_lamps(content: IesContent, metadata: Dict[str, str], is_absolute: bool) -> List[Lamps]:
+    return [Lamps(
+        number_of_lamps=content.inline_attributes.number_of_lamps,
+        lumens_per_lamp=content.inline_attributes.lumens_per_lamp if not is_absolute else None,
+        description=metadata.pop("LAMP", None),
+        catalog_number=metadata.pop("LAMPCAT", None),
+        position=metadata.pop("LAMPPOSITION", None),
+        ballast_catalog_number=metadata.pop("BALLASTCAT", None),
+        ballast_description=metadata.pop("BALLAST", None),
+        wattage=content.lamp_attributes.input_watts,
+        color=metadata.pop("COLORTEMP", None),
+        cri=metadata.pop("CRI", None),
+    )]
+
+
+def _convert_photometry_metadata(content: IesContent, metadata: Dict[str, str]) -> PhotometryMetadata:
+    """
+    Takes the luminaire properties out of metadata. Remaining entries become additional properties.
+    """
+    return PhotometryMetadata(
+        catalog_number=metadata.pop("LUMCAT", None),
+        luminaire=metadata.pop("LUMINAIRE", None),
+        manufacturer=metadata.pop("MANUFAC", None),
+        date_and_user=metadata.pop("DATE", None),
+        additional_properties=metadata,
+        file_source="",
+        file_format=FileFormat.IES,
+        file_units=_convert_file_units(content)
     )
 
 
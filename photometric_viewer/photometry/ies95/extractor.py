@@ -2,26 +2,31 @@ from typing import IO, List
 
 from photometric_viewer.photometry.ies95.model import MetadataTuple, InlineAttributes, LampAttributes, IesContent
 from photometric_viewer.utils.conversion import safe_int, safe_float
-from photometric_viewer.utils.ioutil import first_non_empty_line, get_n_values, read_till_end
+from photometric_viewer.utils.ioutil import first_non_empty_line, get_n_values, read_floats_till_end
 
 
 def extract_content(f: IO) -> IesContent:
+    content = extract_header(f)
+    content.v_angles = _extract_v_angles(f, content.inline_attributes)
+    content.h_angles = _extract_h_angles(f, content.inline_attributes)
+    content.intensities = _extract_intensities(f)
+    return content
+
+
+def extract_header(f: IO) -> IesContent:
+    """
+    Reads the content up to the angle tables, leaving angles and intensities empty
+    """
     header = _extract_header(f)
     metadata = _extract_metadata(f)
     inline_attributes = _extract_inline_attributes(f)
     lamp_attributes = _extract_lamp_attributes(f)
-    v_angles = _extract_v_angles(f, inline_attributes)
-    h_angles = _extract_h_angles(f, inline_attributes)
-    intensities = _extract_intensities(f)
 
     return IesContent(
         header=header,
         metadata=metadata,
         inline_attributes=inline_attributes,
-        lamp_attributes=lamp_attributes,
-        v_angles=v_angles,
-        h_angles=h_angles,
-        intensities=intensities
+        lamp_attributes=lamp_attributes
     )
 
 
@@ -89,7 +94,4 @@ def _extract_h_angles(f: IO, attributes: InlineAttributes) -> List[float]:
 
 
 def _extract_intensities(f: IO) -> List[float]:
-    return [
-        safe_float(v)
-        for v in read_till_end(f)
-    ]
+    return read_floats_till_end(f)
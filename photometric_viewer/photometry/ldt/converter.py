@@ -2,13 +2,22 @@ from typing import List
 
 from photometric_viewer.model.luminaire import Luminaire, LuminaireGeometry, Shape, LuminousOpeningGeometry, \
     LuminousOpeningShape, \
-    LuminairePhotometricProperties, Calculable, Lamps, PhotometryMetadata, FileFormat, Symmetry, LuminaireType
+    LuminairePhotometricProperties, Calculable, Lamps, PhotometryMetadata, FileFormat, Symmetry, LuminaireType, \
+    LuminaireSummary
 from photometric_viewer.model.units import LengthUnits
 from photometric_viewer.photometry.ldt.model import LdtContent, LampSet
 
 
-def _extract_intensity(intensities: List[float]) -> float | None:
-    return intensities.pop(0) if intensities else None
+def _split_into_planes(intensities: List[float], n_planes: int, n_gamma: int) -> List[List[float | None]]:
+    """
+    Splits the flat block of intensities into consecutive C planes.
+    Planes not fully covered by the block are padded with None.
+    """
+    planes = []
+    for i in range(n_planes):
+        plane = intensities[i * n_gamma:(i + 1) * n_gamma]
+        planes.append(plane + [None] * (n_gamma - len(plane)))
+    return planes
 
 
 def _is_absolute(content: LdtContent):
@@ -32,54 +41,46 @@ def _extract_candela_values(content: LdtContent) -> dict[tuple[float, float], fl
         factor = 1
     converted_intensities = [(v or 0) * factor for v in content.intensities]
 
-    values = {}
+    n_gamma = len(gamma_angles)
+    planes = {}
 
     if symmetry == Symmetry.NONE:
-        for c in c_angles:
-            for gamma in gamma_angles:
-                values[(c, gamma)] = _extract_intensity(converted_intensities)
+        for c, plane in zip(c_angles, _split_into_planes(converted_intensities, len(c_angles), n_gamma)):
+            planes[c] = plane
     elif symmetry == Symmetry.TO_VERTICAL_AXIS:
-        for gamma in gamma_angles:
-            value = _extract_intensity(converted_intensities)
-            for c in c_angles:
-                values[(c, gamma)] = value
-    elif symmetry == Symmetry.TO_C0_C180:
+        plane, = _split_into_planes(converted_intensities, 1, n_gamma)
         for c in c_angles:
-            if c <= 180:
-                for gamma in gamma_angles:
-                    value = _extract_intensity(converted_intensities)
-                    values[(c, gamma)] = value
-                    if c != 0:
-                        values[(360 - c, gamma)] = value
+            planes[c] = plane
+    elif symmetry == Symmetry.TO_C0_C180:
+        stored_angles = [c for c in c_angles if c <= 180]
+        for c, plane in zip(stored_angles, _split_into_planes(converted_intensities, len(stored_angles), n_gamma)):
+            planes[c] = plane
+            if c != 0:
+                planes[360 - c] = plane
     elif symmetry == Symmetry.TO_C90_C270:
-        angles = [c for c in c_angles if 270 <= c < 360]
-        angles += [c for c in c_angles if c <= 90]
-        angles += [c for c in c_angles if 90 < c < 270]
-
-        for c in angles:
-            if 270 <= c < 360:
-                for gamma in gamma_angles:
-                    value = _extract_intensity(converted_intensities)
-                    values[(c, gamma)] = value
-                    values[(270 - (c - 270), gamma)] = value
-            if c <= 90:
-                for gamma in gamma_angles:
-                    value = _extract_intensity(converted_intensities)
-                    values[(c, gamma)] = value
-                    values[(180 - c, gamma)] = value
-
+        stored_angles = [c for c in c_angles if 270 <= c < 360]
+        stored_angles += [c for c in c_angles if c <= 90]
+        for c, plane in zip(stored_angles, _split_into_planes(converted_intensities, len(stored_angles), n_gamma)):
+            planes[c] = plane
+            if c >= 270:
+                planes[270 - (c - 270)] = plane
+            else:
+                planes[180 - c] = plane
     elif symmetry == Symmetry.TO_C0_C180_C90_C270:
-        for c in c_angles:
-            if c <= 90:
-                for gamma in gamma_angles:
-                    value = _extract_intensity(converted_intensities)
-                    values[(c, gamma)] = value
-                    values[(180 + c, gamma)] = value
-                    if c != 0:
-                        values[(360 - c, gamma)] = value
-                        values[(180 - c, gamma)] = value
+        stored_angles = [c for c in c_angles if c <= 90]
+        for c, plane in zip(stored_angles, _split_into_planes(converted_intensities, len(stored_angles), n_gamma)):
+            planes[c] = plane
+            planes[180 + c] = plane
+            if c != 0:
+                planes[360 - c] = plane
+                planes[180 - c] = plane
 
-    return {k: v for k, v in values.items() if v is not None}
+    return {
+        (c, gamma): value
+        for c, plane in planes.items()
+        for gamma, value in zip(gamma_angles, plane)
+        if value is not None
+    }
 
 
 def _extract_luminaire_geometry(content: LdtContent) -> LuminaireGeometry | None:
@@ -220,20 +221,33 @@ def convert_content(content: LdtContent) -> Luminaire:
             efficacy=_extract_efficacy(content)
         ),
         lamps=[_extract_lamp_set(lamp_set) for lamp_set in content.lamp_sets],
-        metadata=PhotometryMetadata(
-            catalog_number=content.luminaire_number,
-            luminaire=content.luminaire_name,
-            manufacturer=content.header,
-            file_format=FileFormat.LDT,
-            file_units=LengthUnits.MILLIMETERS,
-            luminaire_type=_extract_light_source_type(content),
-            measurement=content.measurement_report,
-            date_and_user=content.date_and_user,
-            conversion_factor=content.conversion_factor,
-            filename=content.file_name,
-            file_source=None,
-            additional_properties={},
-            symmetry=_extract_symmetry(content),
-            direct_ratios_for_room_indices=_extract_direct_ratios_for_room_indices(content)
-        )
+        metadata=_extract_metadata(content)
+    )
+
+
+def convert_summary(content: LdtContent) -> LuminaireSummary:
+    return LuminaireSummary(
+        metadata=_extract_metadata(content),
+        lamps=[_extract_lamp_set(lamp_set) for lamp_set in content.lamp_sets],
+        number_of_c_planes=content.number_of_c_planes or 0,
+        number_of_gamma_angles=content.number_of_intensities or 0
+    )
+
+
+def _extract_metadata(content: LdtContent) -> PhotometryMetadata:
+    return PhotometryMetadata(
+        catalog_number=content.luminaire_number,
+        luminaire=content.luminaire_name,
+        manufacturer=content.header,
+        file_format=FileFormat.LDT,
+        file_units=LengthUnits.MILLIMETERS,
+        luminaire_type=_extract_light_source_type(content),
+        measurement=content.measurement_report,
+        date_and_user=content.date_and_user,
+        conversion_factor=content.conversion_factor,
+        filename=content.file_name,
+        file_source=None,
+        additional_properties={},
+        symmetry=_extract_symmetry(content),
+        direct_ratios_for_room_indices=_extract_direct_ratios_for_room_indices(content)
     )
\ No newline at end of file
@@ -2,7 +2,7 @@ from typing import IO
 
 from photometric_viewer.photometry.ldt.model import LdtContent, LampSet
 from photometric_viewer.utils.conversion import safe_int, safe_float
-from photometric_viewer.utils.ioutil import read_line, read_till_end
+from photometric_viewer.utils.ioutil import read_line, read_floats_till_end
 
 
 def extract_lamp_set(f) -> LampSet:
@@ -17,6 +17,21 @@ def extract_lamp_set(f) -> LampSet:
 
 
 def extract_content(f: IO) -> LdtContent:
+    content = extract_header(f)
+    content.c_angles = [
+        safe_float(f.readline().strip()) for _ in range(content.number_of_c_planes)
+    ] if content.number_of_c_planes else []
+    content.gamma_angles = [
+        safe_float(f.readline().strip()) for _ in range(content.number_of_intensities)
+    ] if content.number_of_intensities else []
+    content.intensities = read_floats_till_end(f)
+    return content
+
+
+def extract_header(f: IO) -> LdtContent:
+    """
+    Reads the content up to the angle tables, leaving angles and intensities empty
+    """
     header = read_line(f)
     type_indicator = safe_int(f.readline().strip())
     symmetry_indicator = safe_int(f.readline().strip())
@@ -45,13 +60,6 @@ def extract_content(f: IO) -> LdtContent:
     number_of_lamp_sets = safe_int(f.readline().strip())
     lamp_sets = [extract_lamp_set(f) for _ in range(number_of_lamp_sets)] if number_of_lamp_sets else []
     direct_ratios_for_room_indices = [safe_float(f.readline().strip()) for _ in range(10)]
-    c_angles = [safe_float(f.readline().strip()) for _ in range(number_of_c_planes)] if number_of_c_planes else []
-    gamma_angles = [safe_float(f.readline().strip()) for _ in range(number_of_intensities)] if number_of_intensities else []
-
-    intensities = [
-        safe_float(v)
-        for v in read_till_end(f)
-    ]
 
     return LdtContent(
         header=header,
@@ -81,8 +89,5 @@ def extract_content(f: IO) -> LdtContent:
         tilt=tilt,
         number_of_lamp_sets=number_of_lamp_sets,
         lamp_sets=lamp_sets,
-        direct_ratios_for_room_indices=direct_ratios_for_room_indices,
-        c_angles=c_angles,
-        gamma_angles=gamma_angles,
-        intensities=intensities
+        direct_ratios_for_room_indices=direct_ratios_for_room_indices
     )
@@ -0,0 +1,145 @@
+import argparse
+import functools
+import sys
+from copy import copy
+from pathlib import Path
+from typing import List
+
+from photometric_viewer.config import plotter_themes
+from photometric_viewer.formats import png, svg
+from photometric_viewer.formats.common import import_from_string
+from photometric_viewer.utils.batch import BatchItem, find_photometric_files, run_batch, format_summary, \
+    is_up_to_date
+from photometric_viewer.utils.ioutil import decode_contents
+from photometric_viewer.utils.plotters import LightDistributionPlotterSettings, DiagramStyle, DisplayHalfSpaces, \
+    SnapValueAnglesTo
+
+MIN_LDC_SIZE = 50
+MAX_LDC_SIZE = 10000
+
+EXPORTERS = {
+    "png": png.export_photometry,
+    "svg": svg.export_photometry,
+}
+
+
+def plotter_settings(
+        theme_name: str,
+        dark: bool = False,
+        transparent: bool = False,
+        style: DiagramStyle = DiagramStyle.DETAILED,
+        snap_value_angles_to: SnapValueAnglesTo = SnapValueAnglesTo.ROUND_NUMBER,
+        display_half_spaces: DisplayHalfSpaces = DisplayHalfSpaces.ONLY_RELEVANT
+) -> LightDistributionPlotterSettings:
+    theme = next(theme for theme in plotter_themes.THEMES if theme.name == theme_name)
+    plotter_theme = copy(theme.plotter_theme_dark if dark else theme.plotter_theme)
+
+    if transparent:
+        plotter_theme.background_color = None
+    else:
+        plotter_theme.background_color = plotter_theme.background_color or ((0, 0, 0, 1) if dark else (1, 1, 1, 1))
+
+    return LightDistributionPlotterSettings(
+        style=style,
+        snap_value_angles_to=snap_value_angles_to,
+        display_half_spaces=display_half_spaces,
+        theme=plotter_theme
+    )
+
+
+def target_path(item: BatchItem, output_dir: Path | None, file_format: str) -> Path:
+    if output_dir is None:
+        return item.path.with_suffix(f".{file_format}")
+    return (output_dir / item.relative_path).with_suffix(f".{file_format}")
+
+
+def render_file(
+        item: BatchItem,
+        file_formats: List[str],
+        size: int,
+        settings: LightDistributionPlotterSettings,
+        output_dir: Path | None,
+        force: bool = False
+) -> bool:
+    targets = {
+        file_format: target_path(item, output_dir, file_format)
+        for file_format in file_formats
+    }
+    if not force:
+        targets = {
+            file_format: target for file_format, target in targets.items()
+            if not is_up_to_date(item.path, target)
+        }
+    if not targets:
+        return False
+
+    luminaire = import_from_string(decode_contents(item.path.read_bytes()))
+    for file_format, target in targets.items():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(EXPORTERS[file_format](luminaire, size, settings))
+    return True
+
+
+def _size(value: str) -> int:
+    size = int(value)
+    if not MIN_LDC_SIZE <= size <= MAX_LDC_SIZE:
+        raise argparse.ArgumentTypeError(f"Size must be between {MIN_LDC_SIZE} and {MAX_LDC_SIZE} px")
+    return size
+
+
+def _parse_args(args):
+    parser = argparse.ArgumentParser(
+        prog="photometric-viewer-render",
+        description="Render light distribution curves of IES and LDT photometric files"
+    )
+    parser.add_argument("paths", nargs="+", help="Photometric files, directories or glob patterns")
+    parser.add_argument("-f", "--format", dest="file_formats", action="append", choices=EXPORTERS.keys(),
+                        help="Image format, can be given multiple times. Defaults to png")
+    parser.add_argument("-s", "--size", type=_size, default=300, help="Image size in px")
+    parser.add_argument("--theme", default="Adwaita", choices=[theme.name for theme in plotter_themes.THEMES],
+                        help="Curve theme")
+    parser.add_argument("--dark", action="store_true", help="Use the dark variant of the theme")
+    parser.add_argument("--transparent", action="store_true", help="Render without background")
+    parser.add_argument("--style", default="detailed", choices=["simple", "detailed"], help="Diagram style")
+    parser.add_argument("-o", "--output-dir", type=Path,
+                        help="Directory for rendered images. By default images are written next to their sources")
+    parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes. Defaults to the number of CPUs")
+    parser.add_argument("--force", action="store_true",
+                        help="Render images even if they are newer than their source files. "
+                             "Required to apply changed render options to existing images")
+    return parser.parse_args(args)
+
+
+def run(args=None):
+    arguments = _parse_args(args if args is not None else sys.argv[1:])
+    items = find_photometric_files(arguments.paths)
+
+    settings = plotter_settings(
+        theme_name=arguments.theme,
+        dark=arguments.dark,
+        transparent=arguments.transparent,
+        style=DiagramStyle[arguments.style.upper()]
+    )
+    task = functools.partial(
+        render_file,
+        file_formats=arguments.file_formats or ["png"],
+        size=arguments.size,
+        settings=settings,
+        output_dir=arguments.output_dir,
+        force=arguments.force
+    )
+    summary = run_batch(task, items, jobs=arguments.jobs)
+
+    print(format_summary(summary, "Rendered"))
+    if summary.skipped:
+        # Up-to-date images are detected by modification times only, they may have been rendered with other options
+        print(
+            f"{summary.skipped} files already had images newer than the source files and were skipped. "
+            f"Use --force to render them again with the current options",
+            file=sys.stderr
+        )
+    sys.exit(1 if summary.failures else 0)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,107 @@
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, List, TextIO, Tuple
+
+PHOTOMETRIC_FILE_EXTENSIONS = (".ies", ".ldt")
+
+
+@dataclass
+class BatchItem:
+    path: Path
+    # Path relative to the directory given on the command line, used to mirror its structure in the output
+    relative_path: Path
+
+
+@dataclass
+class BatchSummary:
+    processed: int = 0
+    skipped: int = 0
+    failures: List[Tuple[Path, str]] = field(default_factory=list)
+    elapsed_seconds: float = 0
+
+    @property
+    def files_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0
+        return self.processed / self.elapsed_seconds
+
+
+def _is_photometric_file(path: Path) -> bool:
+    return path.is_file() and path.suffix.lower() in PHOTOMETRIC_FILE_EXTENSIONS
+
+
+def find_photometric_files(patterns: Iterable[str]) -> List[BatchItem]:
+    """
+    Resolves files, directories (searched recursively) and glob patterns to a list of photometric files
+    """
+    items = {}
+    for pattern in patterns:
+        paths = [Path(p) for p in glob.glob(pattern, recursive=True)] if glob.has_magic(pattern) else [Path(pattern)]
+        for path in paths:
+            if path.is_dir():
+                for file in sorted(path.rglob("*")):
+                    if _is_photometric_file(file):
+                        items.setdefault(file.resolve(), BatchItem(file, file.relative_to(path)))
+            elif _is_photometric_file(path):
+                items.setdefault(path.resolve(), BatchItem(path, Path(path.name)))
+    return list(items.values())
+
+
+def is_up_to_date(source: Path, target: Path) -> bool:
+    """
+    Returns true when target exists and was written after the last modification of source
+    """
+    try:
+        return target.stat().st_mtime >= source.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def _run_task(task: Callable[[BatchItem], bool], item: BatchItem) -> Tuple[bool, str | None]:
+    try:
+        return task(item), None
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+
+def run_batch(
+        task: Callable[[BatchItem], bool],
+        items: List[BatchItem],
+        jobs: int | None = None,
+        report: TextIO = sys.stderr
+) -> BatchSummary:
+    """
+    Runs task for every item in a pool of worker processes.
+
+    The task must be picklable and return False when an item was skipped. Failures are reported as they occur.
+    """
+    summary = BatchSummary()
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        futures = {executor.submit(_run_task, task, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            processed, error = future.result()
+            if error is not None:
+                summary.failures.append((item.path, error))
+                report.write(f"{item.path}: {error}\n")
+            elif processed:
+                summary.processed += 1
+            else:
+                summary.skipped += 1
+
+    summary.elapsed_seconds = time.perf_counter() - start
+    return summary
+
+
+def format_summary(summary: BatchSummary, action: str) -> str:
+    return (
+        f"{action} {summary.processed} files, {summary.skipped} skipped, {len(summary.failures)} failed "
+        f"in {summary.elapsed_seconds:.1f} s ({summary.files_per_second:.1f} files/s)"
+    )
@@ -0,0 +1,167 @@
+import functools
+import math
+import operator
+from typing import Tuple, List, Dict
+
+from photometric_viewer.model.bug_rating import BugRating
+from photometric_viewer.model.luminaire import Luminaire, Symmetry
+from photometric_viewer.utils import calc
+from photometric_viewer.utils.interpolation import effective_symmetry
+
+# C angles of the front (street side) of the luminaire, the rest is the back (house side)
+FRONT_C_ANGLES = (0, 180)
+
+# Gamma angles of the zones of IES TM-15, forward and backward zones are split by FRONT_C_ANGLES
+DOWNWARD_ZONES = {"L": (0, 30), "M": (30, 60), "H": (60, 80), "VH": (80, 90)}
+UPWARD_ZONES = {"UL": (90, 100), "UH": (100, 180)}
+
+# Maximal flux in lm of zones for ratings 0 to 4 (IES TM-15-11, Addendum A), higher flux gets rating 5
+BACKLIGHT_LIMITS = {
+    "BH": (110, 500, 1000, 2500, 5000),
+    "BM": (220, 1000, 2500, 5000, 8500),
+    "BL": (110, 500, 1000, 2500, 5000),
+}
+UPLIGHT_LIMITS = {
+    "UH": (0, 10, 50, 500, 1000),
+    "UL": (0, 10, 50, 500, 1000),
+}
+GLARE_LIMITS = {
+    "FVH": (10, 100, 225, 350, 450),
+    "BVH": (10, 100, 225, 350, 450),
+    "FH": (660, 1800, 5000, 7500, 12000),
+    "BH": (110, 500, 1000, 2500, 5000),
+}
+
+# Images of an interval of C angles given by a luminaire with a symmetry
+_SYMMETRY_IMAGES = {
+    Symmetry.NONE: [lambda a, b: (a, b)],
+    Symmetry.TO_C0_C180: [lambda a, b: (a, b), lambda a, b: (360 - b, 360 - a)],
+    Symmetry.TO_C90_C270: [lambda a, b: (a, b), lambda a, b: (180 - b, 180 - a)],
+    Symmetry.TO_C0_C180_C90_C270: [
+        lambda a, b: (a, b),
+        lambda a, b: (180 - b, 180 - a),
+        lambda a, b: (180 + a, 180 + b),
+        lambda a, b: (360 - b, 360 - a),
+    ],
+}
+
+
+def _plane_intervals(c_angles: Tuple[float, ...], symmetry: Symmetry) -> List[List[Tuple[float, float]]]:
+    """
+    Intervals of C angles around the full circle represented by each C plane
+    """
+    if symmetry == Symmetry.TO_VERTICAL_AXIS:
+        return [[(0, 360)]] + [[] for _ in c_angles[1:]]
+
+    angles = list(c_angles)
+    duplicate_last = False
+    if symmetry == Symmetry.NONE and angles[0] == 0 and angles[-1] > 180:
+        # Full circle, boundaries between the last and the first plane wrap around
+        if angles[-1] == 360:
+            angles.pop()
+            duplicate_last = True
+        lower_neighbours = [angles[-1] - 360] + angles[:-1]
+        upper_neighbours = angles[1:] + [angles[0] + 360]
+    else:
+        lower_neighbours = [angles[0]] + angles[:-1]
+        upper_neighbours = angles[1:] + [angles[-1]]
+
+    intervals = []
+    for lower, angle, upper in zip(lower_neighbours, angles, upper_neighbours):
+        interval = ((lower + angle) / 2, (angle + upper) / 2)
+        intervals.append([image(*interval) for image in _SYMMETRY_IMAGES[symmetry]])
+    if duplicate_last:
+        intervals.append([])
+    return intervals
+
+
+def _front_measure(start: float, end: float) -> float:
+    """
+    Part of the interval of C angles lying in the front of the luminaire, in degrees
+    """
+    front_start, front_end = FRONT_C_ANGLES
+    return sum(
+        max(0, min(end, front_end + offset) - max(start, front_start + offset))
+        for offset in [-360, 0, 360]
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _zone_masks(
+        c_angles: Tuple[float, ...],
+        gamma_angles: Tuple[float, ...],
+        symmetry: Symmetry
+) -> Dict[str, Tuple[Tuple[float, ...], Dict[str, Tuple[float, ...]]]]:
+    """
+    Solid angle weights of zones, separated into weights of gamma angles and weights of C planes (in radians).
+    Masks depend only on the angle grid, so they are calculated once for all luminaires measured on the same grid
+    """
+    front = []
+    back = []
+    for intervals in _plane_intervals(c_angles, symmetry):
+        total = sum(end - start for start, end in intervals)
+        front_part = sum(_front_measure(start, end) for start, end in intervals)
+        front.append(math.radians(front_part))
+        back.append(math.radians(total - front_part))
+    both = tuple(map(operator.add, front, back))
+
+    masks = {}
+    for name, (lower, upper) in DOWNWARD_ZONES.items():
+        masks[name] = (
+            calc.gamma_zone_weights(gamma_angles, upper, lower),
+            {"F" + name: tuple(front), "B" + name: tuple(back)}
+        )
+    for name, (lower, upper) in UPWARD_ZONES.items():
+        masks[name] = (calc.gamma_zone_weights(gamma_angles, upper, lower), {name: both})
+    return masks
+
+
+def bug_zone_flux(luminaire: Luminaire) -> Dict[str, float] | None:
+    """
+    Luminous flux in lm emitted into the zones of IES TM-15, None for relative photometry when the flux of lamps
+    is unknown
+    """
+    multiplier = calc.candela_multiplier(luminaire)
+    if multiplier is None:
+        return None
+
+    grid = luminaire.intensity_values
+    symmetry = effective_symmetry(grid.c_angles, luminaire.metadata.symmetry)
+    masks = _zone_masks(grid.c_angles, grid.gamma_angles, symmetry)
+    rows = [[0 if math.isnan(v) else v for v in grid.row(c)] for c in grid.c_angles]
+
+    flux = {}
+    for gamma_weights, c_masks in masks.values():
+        plane_sums = [sum(map(operator.mul, row, gamma_weights)) for row in rows]
+        for name, c_weights in c_masks.items():
+            flux[name] = multiplier * sum(map(operator.mul, plane_sums, c_weights))
+    return flux
+
+
+def _rating(zone_flux: Dict[str, float], limits: Dict[str, Tuple[float, ...]]) -> int:
+    return max(
+        next((rating for rating, limit in enumerate(zone_limits) if zone_flux[zone] <= limit), len(zone_limits))
+        for zone, zone_limits in limits.items()
+    )
+
+
+def bug_rating(luminaire: Luminaire) -> BugRating | None:
+    """
+    Backlight, uplight and glare rating of IES TM-15, None when the luminous flux in lm cannot be determined
+    """
+    if not luminaire.c_planes or not luminaire.gamma_angles:
+        return None
+
+    zone_flux = bug_zone_flux(luminaire)
+    if zone_flux is None:
+        return None
+    return BugRating(
+        backlight=_rating(zone_flux, BACKLIGHT_LIMITS),
+        uplight=_rating(zone_flux, UPLIGHT_LIMITS),
+        glare=_rating(zone_flux, GLARE_LIMITS),
+        zone_flux=zone_flux
+    )
+
+
+def cached_bug_rating(luminaire: Luminaire) -> BugRating | None:
+    return luminaire.get_derived_value("bug_rating", bug_rating)
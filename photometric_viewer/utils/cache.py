@@ -0,0 +1,99 @@
+import copy
+import dataclasses
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from photometric_viewer.model.luminaire import Luminaire
+
+DEFAULT_MAX_SIZE_BYTES = 256 * 1024 * 1024
+ENTRY_SUFFIX = ".luminaire"
+
+# Increase whenever the layout of cached entries changes
+CACHE_FORMAT_VERSION = 2
+
+
+def user_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "photometric-viewer"
+
+
+def default_cache_dir() -> Path:
+    return user_cache_dir() / "luminaires"
+
+
+def cache_key(source: str, parser_version: int) -> str:
+    digest = hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{parser_version}:".encode())
+    digest.update(source.encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+class LuminaireCache:
+    """
+    Persistent cache of parsed luminaires keyed by a hash of the file content.
+
+    Luminaires are stored pickled together with their derived values, but without the file source,
+    which is already known to the caller. Least recently used entries are removed once the cache
+    grows beyond max_size_bytes. Errors are logged and treated as cache misses.
+    """
+
+    def __init__(self, directory: Path | None = None, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES):
+        self.directory = directory or default_cache_dir()
+        self.max_size_bytes = max_size_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Luminaire | None:
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                luminaire = pickle.load(f)
+            # Modification time marks the last use of an entry
+            os.utime(path)
+            return luminaire
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            logging.warning("Removing unreadable cache entry %s", path, exc_info=True)
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, luminaire: Luminaire):
+        entry = copy.copy(luminaire)
+        # Derived values do not depend on the file source, so it is dropped without changing the revision
+        entry._metadata = dataclasses.replace(luminaire.metadata, file_source=None)
+
+        temp_path = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as f:
+                temp_path = f.name
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._entry_path(key))
+            self.evict()
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            logging.warning("Could not write cache entry for %s", key, exc_info=True)
+        finally:
+            # Left over only when writing the entry failed
+            if temp_path is not None:
+                Path(temp_path).unlink(missing_ok=True)
+
+    def evict(self):
+        entries = []
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
@@ -1,9 +1,46 @@
+import functools
 import math
+import operator
+from typing import List, Tuple, Dict, Iterable, Set
 
+from photometric_viewer.model.beam import BeamAngles
 from photometric_viewer.model.luminaire import Luminaire, Lamps, LuminairePhotometricProperties, Calculable
+from photometric_viewer.model.utilization import CoefficientsOfUtilization, CavityReflectances
+from photometric_viewer.model.zonal import ZonalLumens, ZonalLumenSummary
 
 DAYS_IN_YEAR = 365
 
+# Ratios of the peak intensity limiting the beam angle and the field angle
+BEAM_ANGLE_RATIO = 0.5
+FIELD_ANGLE_RATIO = 0.1
+
+# Width of gamma angle zones of the zonal flux
+ZONE_ANGLE = 10
+
+# Zones of gamma angles of the zonal lumen summary
+SUMMARY_ZONES = ((0, 30), (0, 40), (0, 60), (0, 90), (90, 180), (0, 180))
+
+# Room indices of direct ratios of EULUMDAT files
+STANDARD_ROOM_INDICES = (0.6, 0.8, 1.0, 1.25, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0)
+
+STANDARD_ROOM_CAVITY_RATIOS = tuple(range(11))
+STANDARD_FLOOR_CAVITY_REFLECTANCE = 0.2
+# Ceiling cavity and wall reflectances of IES coefficient of utilization tables
+STANDARD_CU_REFLECTANCES = (
+    (0.8, 0.7), (0.8, 0.5), (0.8, 0.3), (0.8, 0.1),
+    (0.7, 0.7), (0.7, 0.5), (0.7, 0.3), (0.7, 0.1),
+    (0.5, 0.5), (0.5, 0.3), (0.5, 0.1),
+    (0.3, 0.5), (0.3, 0.3), (0.3, 0.1),
+    (0.1, 0.5), (0.1, 0.3), (0.1, 0.1),
+    (0, 0),
+)
+
+# Constants A and B of zonal multipliers Kz = exp(-A * RCR ^ B) of the downward zones, IES zonal cavity method
+_ZONAL_MULTIPLIER_CONSTANTS = (
+    (0, 0), (0.041, 0.98), (0.070, 1.05), (0.100, 1.12), (0.136, 1.16),
+    (0.190, 1.25), (0.315, 1.25), (0.640, 1.25), (2.100, 0.80),
+)
+
 
 def annual_power_consumption(wattage: float, daily_hours: float):
     if wattage < 0:
@@ -49,34 +86,89 @@ def calculate_photometry(luminaire: Luminaire) -> LuminairePhotometricProperties
         return empty_values()
 
 
+def cached_photometry(luminaire: Luminaire) -> LuminairePhotometricProperties:
+    return luminaire.get_derived_value("photometry", calculate_photometry)
+
+
+@functools.lru_cache(maxsize=64)
+def gamma_zone_weights(
+        gamma_angles: Tuple[float, ...],
+        upper_limit: float = 180,
+        lower_limit: float = 0
+) -> Tuple[float, ...]:
+    """
+    Solid angle (divided by 2 pi) of the zone represented by each gamma angle.
+
+    Each intensity is taken as constant within a band centred on its gamma angle, reaching halfway to the
+    neighbouring measured gamma angles and not beyond the first and the last one, so the spacing of gamma angles
+    does not need to be uniform. Bands are clipped to lower_limit and upper_limit, so bands crossing a limit
+    are split between the neighbouring zones.
+    """
+    def clip(angle):
+        return math.radians(min(max(angle, lower_limit), upper_limit))
+
+    midpoints = [(a + b) / 2 for a, b in zip(gamma_angles, gamma_angles[1:])]
+    starts = gamma_angles[:1] + tuple(midpoints)
+    ends = tuple(midpoints) + gamma_angles[-1:]
+    return tuple(
+        math.cos(clip(start)) - math.cos(clip(end))
+        for start, end in zip(starts, ends)
+    )
+
+
+def _zonal_flux(luminaire: Luminaire) -> Tuple[float, float]:
+    """
+    Returns flux emitted in all directions and flux emitted in the lower hemisphere, in units of intensity values
+    """
+    intensities = luminaire.intensity_values
+    total_weights = gamma_zone_weights(intensities.gamma_angles)
+    lower_weights = gamma_zone_weights(intensities.gamma_angles, upper_limit=90)
+
+    total_flux = 0
+    lower_flux = 0
+    for c in luminaire.c_planes:
+        row = [0 if math.isnan(v) else v for v in intensities.row(c)]
+        total_flux += sum(map(operator.mul, row, total_weights))
+        lower_flux += sum(map(operator.mul, row, lower_weights))
+
+    plane_factor = 2 * math.pi / len(luminaire.c_planes)
+    return total_flux * plane_factor, lower_flux * plane_factor
+
+
+def lamp_flux(luminaire: Luminaire) -> float | None:
+    """
+    Rated luminous flux of the first set of lamps in lm, None when the file does not declare it
+    """
+    if not luminaire.lamps:
+        return None
+    lamps = luminaire.lamps[0]
+    if not lamps.lumens_per_lamp or not lamps.number_of_lamps or lamps.lumens_per_lamp <= 0:
+        return None
+    return lamps.lumens_per_lamp * lamps.number_of_lamps
+
+
+def candela_multiplier(luminaire: Luminaire) -> float | None:
+    """
+    Factor converting intensity values of the luminaire to candela.
+    None for relative photometry when the flux of lamps is unknown
+    """
+    if luminaire.photometry.is_absolute:
+        return 1
+    flux = lamp_flux(luminaire)
+    return flux / 1000 if flux is not None else None
+
+
 def _calculate_photometry(luminaire: Luminaire) -> LuminairePhotometricProperties:
     assert luminaire.intensity_values
 
     is_absolute = luminaire.photometry.is_absolute
     lamps = luminaire.lamps[0]
-    ratio = 1 if is_absolute else (lamps.lumens_per_lamp * lamps.number_of_lamps) / 1000
-    gamma_step = luminaire.gamma_angles[1] - luminaire.gamma_angles[0]
+    ratio = candela_multiplier(luminaire)
+    assert ratio is not None
 
-    assert gamma_step > 0
-
-    flux_luminaire = 0
-    flux_lower_luminaire = 0
-    for c in luminaire.c_planes:
-        gamma = 0
-        n = 1
-        plane_flux = 0
-        plane_lower_flux = 0
-        while gamma < 180:
-            closest_gamma = min(luminaire.gamma_angles, key=lambda x: abs(x - gamma))
-            candelas = luminaire.intensity_values.get((c, closest_gamma), 0) * ratio
-            flux = candelas * (math.cos((n - 1) * math.radians(gamma_step)) - math.cos(n*math.radians(gamma_step)))
-            plane_flux += flux
-            if gamma < 90:
-                plane_lower_flux += flux
-            gamma += gamma_step
-            n += 1
-        flux_luminaire += plane_flux * 2 * math.pi / len(luminaire.c_planes)
-        flux_lower_luminaire += plane_lower_flux * 2 * math.pi / len(luminaire.c_planes)
+    flux_luminaire, flux_lower_luminaire = _zonal_flux(luminaire)
+    flux_luminaire *= ratio
+    flux_lower_luminaire *= ratio
 
     lor = (flux_luminaire / (lamps.lumens_per_lamp * lamps.number_of_lamps)) if not is_absolute else 1
     efficacy = (flux_luminaire / lamps.wattage) if is_absolute and lamps.wattage else None
@@ -88,3 +180,345 @@ def _calculate_photometry(luminaire: Luminaire) -> LuminairePhotometricPropertie
         dff=luminaire.photometry.dff.to_calculated(flux_lower_luminaire / flux_luminaire),
         efficacy=luminaire.photometry.efficacy.to_calculated(efficacy)
     )
+
+
+def _plane_profile(
+        luminaire: Luminaire,
+        c_angle: float
+) -> Tuple[List[float], List[float], Set[Tuple[int, int]]]:
+    """
+    Intensities of the plane c_angle - c_angle + 180 as a profile around the circle, with angles
+    increasing from the nadir through the C angle half up to the zenith and down through the opposite half.
+    Also returns the neighbouring indices of the profile not joined by measured angles at the nadir or the zenith
+    """
+    halves = [luminaire.get_values_for_c_angle(c) for c in [c_angle, (c_angle + 180) % 360]]
+    joined_at_nadir = all(0 in half for half in halves)
+    joined_at_zenith = all(180 in half for half in halves)
+
+    angles = sorted(halves[0].keys())
+    intensities = [halves[0][gamma] for gamma in angles]
+    for gamma in sorted(halves[1].keys(), reverse=True):
+        if (gamma == 180 and joined_at_zenith) or (gamma == 0 and joined_at_nadir):
+            continue
+        angles.append(360 - gamma)
+        intensities.append(halves[1][gamma])
+
+    gaps = set()
+    if not joined_at_nadir:
+        gaps.add((0, len(angles) - 1))
+    if not joined_at_zenith:
+        gaps.add((len(halves[0]) - 1, len(halves[0])))
+    return angles, intensities, gaps
+
+
+def _spread(
+        angles: List[float],
+        intensities: List[float],
+        peak: int,
+        threshold: float,
+        direction: int,
+        gaps: Set[Tuple[int, int]]
+) -> float | None:
+    """
+    Angle from the peak, in the given direction around the profile, at which the intensity falls below threshold.
+    Linear interpolation is used between measured angles. Returns None when an unmeasured gap is reached first
+    """
+    count = len(angles)
+    spread = 0
+    i = peak
+    while True:
+        j = (i + direction) % count
+        if j == peak or (min(i, j), max(i, j)) in gaps:
+            return None
+        step = ((angles[j] - angles[i]) * direction) % 360
+        a, b = intensities[i], intensities[j]
+        if b < threshold:
+            return spread + step * (a - threshold) / (a - b)
+        spread += step
+        i = j
+
+
+def _plane_beam_angles(luminaire: Luminaire, c_angle: float, ratios: Tuple[float, ...]) -> List[float | None]:
+    """
+    Full angles in the plane c_angle - c_angle + 180 within which the intensity stays above each ratio of the peak,
+    measured on both sides of the peak intensity of the plane
+    """
+    angles, intensities, gaps = _plane_profile(luminaire, c_angle)
+    if not angles:
+        return [None for _ in ratios]
+
+    peak = max(range(len(angles)), key=intensities.__getitem__)
+    result = []
+    for ratio in ratios:
+        threshold = intensities[peak] * ratio
+        spreads = [
+            _spread(angles, intensities, peak, threshold, direction, gaps) if threshold > 0 else None
+            for direction in [1, -1]
+        ]
+        result.append(None if None in spreads else sum(spreads))
+    return result
+
+
+def beam_angle(luminaire: Luminaire, ratio: float = BEAM_ANGLE_RATIO, c_angle: float = 0) -> float | None:
+    """
+    Full angle in the C0-C180 plane (or the plane c_angle) within which the intensity stays above ratio
+    of the peak intensity. Beam angle is calculated for ratio 0.5, field angle for ratio 0.1.
+    """
+    return _plane_beam_angles(luminaire, c_angle, (ratio,))[0]
+
+
+def beam_angles(luminaire: Luminaire, c_angles: Iterable[float] | None = (0, 90)) -> List[BeamAngles]:
+    """
+    Beam and field angles of the given planes, or of every measured C plane when c_angles is None
+    """
+    if c_angles is None:
+        c_angles = sorted(set(c % 180 for c in luminaire.c_planes))
+
+    result = []
+    for c_angle in c_angles:
+        beam, field = _plane_beam_angles(luminaire, c_angle, (BEAM_ANGLE_RATIO, FIELD_ANGLE_RATIO))
+        result.append(BeamAngles(c_angle=c_angle, beam_angle=beam, field_angle=field))
+    return result
+
+
+def cached_beam_angles(luminaire: Luminaire) -> List[BeamAngles]:
+    """
+    Beam and field angles of the C0-C180 and C90-C270 planes
+    """
+    return luminaire.get_derived_value("beam_angles", beam_angles)
+
+
+@functools.lru_cache(maxsize=64)
+def zonal_weights(c_plane_count: int, gamma_angles: Tuple[float, ...]) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Solid angle weights of every gamma angle of a single C plane, one row per zone of ZONE_ANGLE degrees.
+    Weights depend only on the angle grid, so they are calculated once for all luminaires measured on the same grid
+    """
+    plane_factor = 2 * math.pi / c_plane_count
+    return tuple(
+        tuple(plane_factor * w for w in gamma_zone_weights(gamma_angles, lower + ZONE_ANGLE, lower))
+        for lower in range(0, 180, ZONE_ANGLE)
+    )
+
+
+def _calculate_relative_zonal_flux(luminaire: Luminaire) -> Tuple[float, ...]:
+    intensities = luminaire.intensity_values
+    c_planes = luminaire.c_planes
+    if not c_planes:
+        return (0,) * (180 // ZONE_ANGLE)
+
+    # Intensities of all C planes summed up for every gamma angle, shared by all zones
+    totals = [0.0] * len(intensities.gamma_angles)
+    for c in c_planes:
+        row = [0 if math.isnan(v) else v for v in intensities.row(c)]
+        totals = list(map(operator.add, totals, row))
+
+    return tuple(
+        sum(map(operator.mul, totals, weights))
+        for weights in zonal_weights(len(c_planes), intensities.gamma_angles)
+    )
+
+
+def relative_zonal_flux(luminaire: Luminaire) -> Tuple[float, ...]:
+    """
+    Flux emitted into zones of gamma angles 0-10°, 10-20°, ..., 170-180° in units of intensity values,
+    known also for relative photometry without the flux of lamps
+    """
+    return luminaire.get_derived_value("relative_zonal_flux", _calculate_relative_zonal_flux)
+
+
+def _calculate_zonal_flux(luminaire: Luminaire) -> Tuple[float, ...] | None:
+    multiplier = candela_multiplier(luminaire)
+    if multiplier is None:
+        return None
+    return tuple(multiplier * flux for flux in relative_zonal_flux(luminaire))
+
+
+def zonal_flux(luminaire: Luminaire) -> Tuple[float, ...] | None:
+    """
+    Luminous flux in lm emitted into zones of gamma angles 0-10°, 10-20°, ..., 170-180°,
+    None for relative photometry when the flux of lamps is unknown
+    """
+    return luminaire.get_derived_value("zonal_flux", _calculate_zonal_flux)
+
+
+def zonal_lumen_summary(luminaire: Luminaire) -> ZonalLumenSummary | None:
+    """
+    Flux emitted into the zones of the zonal lumen summary and into zones of ZONE_ANGLE degrees,
+    related to the flux of the luminaire and to the rated flux of lamps.
+    None for relative photometry when the flux of lamps is unknown
+    """
+    if not luminaire.c_planes:
+        return None
+
+    bands = zonal_flux(luminaire)
+    if bands is None:
+        return None
+    total = sum(bands)
+    if total <= 0:
+        return None
+
+    rated_flux = lamp_flux(luminaire) if not luminaire.photometry.is_absolute else None
+
+    def zone(lower: float, upper: float, lumens: float) -> ZonalLumens:
+        return ZonalLumens(
+            lower=lower,
+            upper=upper,
+            lumens=lumens,
+            lamp_fraction=lumens / rated_flux if rated_flux else None,
+            luminaire_fraction=lumens / total
+        )
+
+    return ZonalLumenSummary(
+        zones=[
+            zone(lower, upper, sum(bands[lower // ZONE_ANGLE:upper // ZONE_ANGLE]))
+            for lower, upper in SUMMARY_ZONES
+        ],
+        bands=[zone(i * ZONE_ANGLE, (i + 1) * ZONE_ANGLE, lumens) for i, lumens in enumerate(bands)]
+    )
+
+
+def cached_zonal_lumen_summary(luminaire: Luminaire) -> ZonalLumenSummary | None:
+    return luminaire.get_derived_value("zonal_lumen_summary", zonal_lumen_summary)
+
+
+def _reference_flux(luminaire: Luminaire) -> float | None:
+    """
+    Flux utilization is related to: rated flux of lamps, or flux of the luminaire for absolute photometry.
+    None when the flux of lamps is unknown
+    """
+    if luminaire.photometry.is_absolute:
+        return sum(zonal_flux(luminaire))
+    return lamp_flux(luminaire)
+
+
+def zonal_direct_ratio(zone_fractions: Tuple[float, ...], room_cavity_ratio: float) -> float:
+    """
+    Part of the downward flux falling directly on the floor cavity, calculated with zonal multipliers
+    """
+    downward = sum(zone_fractions[:len(_ZONAL_MULTIPLIER_CONSTANTS)])
+    if downward <= 0:
+        return 0
+    direct = sum(
+        fraction * math.exp(-a * room_cavity_ratio ** b)
+        for fraction, (a, b) in zip(zone_fractions, _ZONAL_MULTIPLIER_CONSTANTS)
+    )
+    return direct / downward
+
+
+def _solve_linear_system(matrix: List[List[float]], vector: List[float]) -> List[float]:
+    """
+    Gaussian elimination with partial pivoting
+    """
+    n = len(vector)
+    rows = [list(row) + [value] for row, value in zip(matrix, vector)]
+    for i in range(n):
+        pivot = max(range(i, n), key=lambda r: abs(rows[r][i]))
+        rows[i], rows[pivot] = rows[pivot], rows[i]
+        for r in range(i + 1, n):
+            factor = rows[r][i] / rows[i][i]
+            rows[r] = [a - factor * b for a, b in zip(rows[r], rows[i])]
+
+    solution = [0.0] * n
+    for i in reversed(range(n)):
+        solution[i] = (rows[i][n] - sum(rows[i][j] * solution[j] for j in range(i + 1, n))) / rows[i][i]
+    return solution
+
+
+def incident_cavity_flux(
+        downward: float,
+        upward: float,
+        direct_ratio: float,
+        room_cavity_ratio: float,
+        reflectances: CavityReflectances
+) -> List[float]:
+    """
+    Flux incident on ceiling cavity, walls and floor cavity after interreflections between them.
+    Upward flux falls on the ceiling cavity, downward flux on the floor cavity and walls according to direct_ratio
+    """
+    # Form factor between ceiling and floor cavity
+    f = (math.sqrt(room_cavity_ratio ** 2 + 25) - room_cavity_ratio) / 5
+    if room_cavity_ratio > 0:
+        wall_to_plane = 2.5 * (1 - f) / room_cavity_ratio
+        walls = (wall_to_plane, 1 - 2 * wall_to_plane, wall_to_plane)
+    else:
+        walls = (0, 0, 0)
+
+    # Form factors from ceiling cavity, walls and floor cavity to each of them
+    form_factors = ((0, 1 - f, f), walls, (f, 1 - f, 0))
+    rho = (reflectances.ceiling, reflectances.walls, reflectances.floor)
+    initial = [upward, downward * (1 - direct_ratio), downward * direct_ratio]
+
+    # Incident flux E satisfies E = E0 + F^T * diag(rho) * E
+    matrix = [
+        [(1 if i == j else 0) - form_factors[j][i] * rho[j] for j in range(3)]
+        for i in range(3)
+    ]
+    return _solve_linear_system(matrix, initial)
+
+
+def coefficients_of_utilization(
+        luminaire: Luminaire,
+        room_cavity_ratios: Tuple[float, ...] = STANDARD_ROOM_CAVITY_RATIOS,
+        reflectances: Tuple[Tuple[float, float], ...] = STANDARD_CU_REFLECTANCES,
+        floor_reflectance: float = STANDARD_FLOOR_CAVITY_REFLECTANCE
+) -> CoefficientsOfUtilization | None:
+    """
+    Table of coefficients of utilization calculated with the zonal cavity method,
+    for combinations of ceiling cavity and wall reflectances
+    """
+    if not luminaire.c_planes:
+        return None
+
+    reference_flux = _reference_flux(luminaire)
+    if reference_flux is None or reference_flux <= 0:
+        return None
+
+    zone_fractions = tuple(flux / reference_flux for flux in zonal_flux(luminaire))
+    downward = sum(zone_fractions[:9])
+    upward = sum(zone_fractions[9:])
+    cavity_reflectances = [
+        CavityReflectances(ceiling=ceiling, walls=walls, floor=floor_reflectance)
+        for ceiling, walls in reflectances
+    ]
+
+    values = []
+    for room_cavity_ratio in room_cavity_ratios:
+        direct_ratio = zonal_direct_ratio(zone_fractions, room_cavity_ratio)
+        values.append([
+            incident_cavity_flux(downward, upward, direct_ratio, room_cavity_ratio, r)[2]
+            for r in cavity_reflectances
+        ])
+
+    return CoefficientsOfUtilization(
+        room_cavity_ratios=list(room_cavity_ratios),
+        reflectances=cavity_reflectances,
+        values=values
+    )
+
+
+def cached_coefficients_of_utilization(luminaire: Luminaire) -> CoefficientsOfUtilization | None:
+    return luminaire.get_derived_value("coefficients_of_utilization", coefficients_of_utilization)
+
+
+def _calculate_direct_ratios(luminaire: Luminaire) -> Dict[float, float]:
+    zones = relative_zonal_flux(luminaire) if luminaire.c_planes else ()
+    if sum(zones[:len(_ZONAL_MULTIPLIER_CONSTANTS)]) <= 0:
+        return {}
+    # Room cavity ratio of a room with room index k is 5 / k
+    return {k: zonal_direct_ratio(zones, 5 / k) for k in STANDARD_ROOM_INDICES}
+
+
+def direct_ratios(luminaire: Luminaire) -> Calculable:
+    """
+    Direct ratios for room indices: part of the downward flux of the luminaire falling directly on the workplane.
+    Values missing in the photometric file are calculated from the zonal flux with zonal multipliers
+    """
+    calculable = Calculable(luminaire.metadata.direct_ratios_for_room_indices or None)
+    if calculable.value is not None:
+        return calculable
+    return calculable.to_calculated(_calculate_direct_ratios(luminaire) or None)
+
+
+def cached_direct_ratios(luminaire: Luminaire) -> Calculable:
+    return luminaire.get_derived_value("direct_ratios", direct_ratios)
@@ -0,0 +1,252 @@
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, astuple
+from os import PathLike
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+from photometric_viewer.formats.common import import_from_file
+from photometric_viewer.utils import calc
+from photometric_viewer.utils.batch import find_photometric_files
+from photometric_viewer.utils.cache import user_cache_dir
+from photometric_viewer.utils.conversion import color_temperature, color_rendering_index
+from photometric_viewer.utils.ioutil import open_text_file
+
+# Increase whenever the schema or the way entries are calculated changes, the catalog is then rebuilt
+SCHEMA_VERSION = 1
+
+
+def default_catalog_path() -> Path:
+    return user_cache_dir() / "catalog.sqlite"
+
+
+@dataclass
+class CatalogEntry:
+    path: str
+    mtime: float
+    size: int
+    file_format: str | None = None
+    manufacturer: str | None = None
+    luminaire: str | None = None
+    catalog_number: str | None = None
+    luminous_flux: float | None = None
+    wattage: float | None = None
+    efficacy: float | None = None
+    beam_angle: float | None = None
+    color_temperature: int | None = None
+    cri: float | None = None
+    # Set instead of the properties above when the file could not be read
+    error: str | None = None
+
+
+_COLUMNS = [f.name for f in fields(CatalogEntry)]
+
+
+@dataclass
+class CatalogQuery:
+    # Matched against manufacturer, luminaire name and catalog number
+    text: str | None = None
+    file_format: str | None = None
+    min_luminous_flux: float | None = None
+    max_luminous_flux: float | None = None
+    min_efficacy: float | None = None
+    min_color_temperature: int | None = None
+    max_color_temperature: int | None = None
+    min_cri: float | None = None
+    min_beam_angle: float | None = None
+    max_beam_angle: float | None = None
+    limit: int = 500
+
+
+@dataclass
+class RefreshSummary:
+    indexed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    failures: List[Tuple[str, str]] = field(default_factory=list)
+    elapsed_seconds: float = 0
+
+
+def index_file(path: str, mtime: float, size: int) -> CatalogEntry:
+    """
+    Reads a photometric file and calculates the properties stored in the catalog.
+    Errors are recorded in the entry, so that one broken file does not stop the refresh of the others
+    """
+    try:
+        return _read_entry(path, mtime, size)
+    except Exception as e:
+        return CatalogEntry(path=path, mtime=mtime, size=size, error=f"{type(e).__name__}: {e}")
+
+
+def _read_entry(path: str, mtime: float, size: int) -> CatalogEntry:
+    with open_text_file(path) as f:
+        luminaire = import_from_file(f)
+
+    photometry = calc.calculate_photometry(luminaire)
+    first_lamp_set = luminaire.lamps[0] if luminaire.lamps else None
+    wattage = sum(lamp_set.wattage for lamp_set in luminaire.lamps if lamp_set.wattage) or None
+    luminous_flux = photometry.luminous_flux.value
+    efficacy = photometry.efficacy.value
+    if efficacy is None and luminous_flux and wattage:
+        efficacy = luminous_flux / wattage
+
+    return CatalogEntry(
+        path=path,
+        mtime=mtime,
+        size=size,
+        file_format=luminaire.metadata.file_format.name if luminaire.metadata.file_format else None,
+        manufacturer=luminaire.metadata.manufacturer,
+        luminaire=luminaire.metadata.luminaire,
+        catalog_number=luminaire.metadata.catalog_number,
+        luminous_flux=luminous_flux,
+        wattage=wattage,
+        efficacy=efficacy,
+        beam_angle=calc.cached_beam_angles(luminaire)[0].beam_angle,
+        color_temperature=color_temperature(first_lamp_set.color) if first_lamp_set else None,
+        cri=color_rendering_index(first_lamp_set.cri, first_lamp_set.color) if first_lamp_set else None
+    )
+
+
+def _index_stat(item: Tuple[str, float, int]) -> CatalogEntry:
+    return index_file(*item)
+
+
+class Catalog:
+    """
+    SQLite index of photometric files in a set of directories.
+
+    Files are read again only when their modification time or size changed since the last refresh.
+    """
+
+    def __init__(self, path: str | PathLike | None = None):
+        self.path = Path(path) if path is not None else default_catalog_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._create_schema()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _create_schema(self):
+        version, = self.connection.execute("PRAGMA user_version").fetchone()
+        with self.connection:
+            if version != SCHEMA_VERSION:
+                self.connection.execute("DROP TABLE IF EXISTS entries")
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    path TEXT PRIMARY KEY,
+                    mtime REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    file_format TEXT,
+                    manufacturer TEXT,
+                    luminaire TEXT,
+                    catalog_number TEXT,
+                    luminous_flux REAL,
+                    wattage REAL,
+                    efficacy REAL,
+                    beam_angle REAL,
+                    color_temperature INTEGER,
+                    cri REAL,
+                    error TEXT
+                )
+            """)
+            for column in ["luminous_flux", "efficacy", "beam_angle", "color_temperature", "cri", "manufacturer"]:
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS entries_{column} ON entries ({column})")
+
+    def refresh(self, directories: Iterable[str | PathLike], jobs: int | None = None) -> RefreshSummary:
+        """
+        Indexes new and modified files in worker processes and removes entries of deleted files
+        """
+        summary = RefreshSummary()
+        start = time.perf_counter()
+
+        roots = [str(Path(directory).resolve()) for directory in directories]
+        found = {}
+        for item in find_photometric_files(roots):
+            path = str(item.path.resolve())
+            stat = item.path.stat()
+            found[path] = (path, stat.st_mtime, stat.st_size)
+
+        known = {}
+        for root in roots:
+            rows = self.connection.execute(
+                "SELECT path, mtime, size FROM entries WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                (root, _escape_like(root.rstrip(os.sep) + os.sep) + "%")
+            )
+            known.update({path: (path, mtime, size) for path, mtime, size in rows})
+
+        changed = [stat for path, stat in found.items() if known.get(path) != stat]
+        removed = [path for path in known if path not in found]
+        summary.unchanged = len(found) - len(changed)
+
+        entries = []
+        if changed:
+            with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+                entries = list(executor.map(_index_stat, changed, chunksize=16))
+
+        with self.connection:
+            self.connection.executemany("DELETE FROM entries WHERE path = ?", [(path,) for path in removed])
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO entries ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                [astuple(entry) for entry in entries]
+            )
+
+        summary.indexed = len(entries)
+        summary.removed = len(removed)
+        summary.failures = [(entry.path, entry.error) for entry in entries if entry.error is not None]
+        summary.elapsed_seconds = time.perf_counter() - start
+        return summary
+
+    def search(self, query: CatalogQuery) -> List[CatalogEntry]:
+        conditions = ["error IS NULL"]
+        parameters = []
+
+        if query.text:
+            conditions.append(
+                "(manufacturer LIKE ? ESCAPE '\\' OR luminaire LIKE ? ESCAPE '\\' OR catalog_number LIKE ? ESCAPE '\\')"
+            )
+            parameters += [f"%{_escape_like(query.text)}%"] * 3
+
+        if query.file_format:
+            conditions.append("file_format = ?")
+            parameters.append(query.file_format)
+
+        ranges = [
+            ("luminous_flux >= ?", query.min_luminous_flux),
+            ("luminous_flux <= ?", query.max_luminous_flux),
+            ("efficacy >= ?", query.min_efficacy),
+            ("color_temperature >= ?", query.min_color_temperature),
+            ("color_temperature <= ?", query.max_color_temperature),
+            ("cri >= ?", query.min_cri),
+            ("beam_angle >= ?", query.min_beam_angle),
+            ("beam_angle <= ?", query.max_beam_angle),
+        ]
+        for condition, value in ranges:
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+
+        rows = self.connection.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM entries WHERE {' AND '.join(conditions)} "
+            f"ORDER BY manufacturer, luminaire, path LIMIT ?",
+            parameters + [query.limit]
+        )
+        return [CatalogEntry(*row) for row in rows]
+
+    def __len__(self):
+        count, = self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return count
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -1,3 +1,4 @@
+import re
 from typing import Any
 
 
@@ -13,3 +14,45 @@ def safe_float(value: Any | None) -> float | None:
         return float(value)
     except (ValueError, TypeError):
         return None
+
+
+def compact_number(value: float) -> int | float:
+    """
+    Returns integral values as int, so that intensities stored as floats are written without a fractional part
+    """
+    return int(value) if float(value).is_integer() else value
+
+
+_COLOR_TEMPERATURE_REGEX = re.compile("^(\\d\\d\\d\\d\\d?)\\s*K?$")
+# Color codes, such as 840 for CRI of at least 80 and color temperature of 4000 K
+_COLOR_CODE_REGEX = re.compile("^(\\d)(\\d\\d)$")
+
+
+def color_temperature(color: str | None) -> int | None:
+    if not color:
+        return None
+
+    color_temp_match = _COLOR_TEMPERATURE_REGEX.match(color.strip())
+    if color_temp_match:
+        return int(color_temp_match.groups()[0])
+
+    color_code_match = _COLOR_CODE_REGEX.match(color.strip())
+    if color_code_match:
+        return int(color_code_match.groups()[1]) * 100
+
+    return None
+
+
+def color_rendering_index(cri: str | None, color: str | None = None) -> float | None:
+    """
+    Returns CRI given as a number or, as a lower bound, encoded in the color code
+    """
+    value = safe_float(cri)
+    if value is not None:
+        return value
+
+    color_code_match = _COLOR_CODE_REGEX.match(color.strip()) if color else None
+    if color_code_match:
+        return int(color_code_match.groups()[0]) * 10
+
+    return None
@@ -41,6 +41,7 @@ class SettingsManager:
         self._gsettings.set_boolean("editor-grid", self.settings.editor_grid)
         self._gsettings.set_boolean("editor-highlight-current-line", self.settings.editor_highlight_current_line)
         self._gsettings.set_boolean("editor-show-line-numbers", self.settings.editor_show_line_numbers)
+        self._gsettings.set_strv("catalog-directories", self.settings.catalog_directories)
 
     def load(self):
         if self._gsettings:
@@ -56,7 +57,8 @@ class SettingsManager:
                 editor_word_warp=self._gsettings.get_boolean("editor-word-warp"),
                 editor_grid=self._gsettings.get_boolean("editor-grid"),
                 editor_highlight_current_line=self._gsettings.get_boolean("editor-highlight-current-line"),
-                editor_show_line_numbers=self._gsettings.get_boolean("editor-show-line-numbers")
+                editor_show_line_numbers=self._gsettings.get_boolean("editor-show-line-numbers"),
+                catalog_directories=self._gsettings.get_strv("catalog-directories")
             )
 
         self.notify_update()
@@ -1,21 +1,11 @@
-import io
-
 from gi.repository import Gio, GLib
 
-
-def _detect_encoding(contents):
-    wrapper = io.TextIOWrapper(io.BytesIO(contents), encoding="utf-8")
-    try:
-        wrapper.readline()
-        return "utf-8"
-    except UnicodeDecodeError:
-        return "windows-1252"
+from photometric_viewer.utils.ioutil import contents_stream
 
 
 def gio_file_stream(file: Gio.File):
     _, contents, _ = file.load_contents()
-    encoding = _detect_encoding(contents)
-    return io.TextIOWrapper(io.BytesIO(contents), encoding=encoding)
+    return contents_stream(contents)
 
 def write_string(file: Gio.File, data: str):
     stream: Gio.FileOutputStream = file.replace(None, False, Gio.FileCreateFlags.REPLACE_DESTINATION)
@@ -0,0 +1,206 @@
+import math
+from typing import Tuple, Dict, List
+
+from photometric_viewer.model.glare import UgrRoom, UgrTable
+from photometric_viewer.model.luminaire import Luminaire, LuminousOpeningShape, Shape
+from photometric_viewer.model.utilization import CavityReflectances
+from photometric_viewer.utils import calc
+from photometric_viewer.utils.interpolation import interpolator
+
+# Rooms of the standard UGR table (CIE 117, CIE 190), dimensions across and along the line of sight in multiples of H
+STANDARD_UGR_ROOMS = (
+    (2, 2), (2, 3), (2, 4), (2, 6), (2, 8), (2, 12),
+    (4, 2), (4, 3), (4, 4), (4, 6), (4, 8), (4, 12),
+    (8, 4), (8, 6), (8, 8), (8, 12),
+    (12, 4), (12, 6), (12, 8),
+)
+# Ceiling, wall and floor reflectances of the standard UGR table
+STANDARD_UGR_REFLECTANCES = (
+    (0.7, 0.5, 0.2),
+    (0.7, 0.3, 0.2),
+    (0.5, 0.5, 0.2),
+    (0.5, 0.3, 0.2),
+    (0.3, 0.3, 0.2),
+)
+# Spacing of luminaires in multiples of H
+STANDARD_UGR_SPACING = 0.25
+
+# Offsets between the observer and luminaires are rounded to this number of digits when looking up glare terms
+_OFFSET_DIGITS = 9
+
+LuminousArea = Tuple[float, float, bool, Tuple[float, float, float, float]]
+
+
+def _luminous_area(luminaire: Luminaire) -> LuminousArea | None:
+    """
+    Length, width, round shape and heights of sides facing C0, C90, C180 and C270 of the luminous area.
+    Luminaire dimensions are used when the file does not describe the luminous opening.
+    Shapes other than round are treated as rectangular
+    """
+    opening = luminaire.luminous_opening_geometry
+    if opening and opening.length and opening.width and opening.shape != LuminousOpeningShape.POINT:
+        height = opening.height or 0
+        heights = tuple(h if h is not None else height for h in [
+            opening.height, opening.height_c90, opening.height_c180, opening.height_c270
+        ])
+        is_round = opening.shape in [LuminousOpeningShape.ROUND, LuminousOpeningShape.SPHERE]
+        return abs(opening.length), abs(opening.width), is_round, heights
+
+    geometry = luminaire.geometry
+    if geometry and geometry.length:
+        return abs(geometry.length), abs(geometry.width or geometry.length), geometry.shape == Shape.ROUND, (0, 0, 0, 0)
+    return None
+
+
+def projected_area(area: LuminousArea, c_angle: float, gamma: float) -> float:
+    """
+    Area of the luminous opening seen from the direction (c_angle, gamma), in square meters
+    """
+    length, width, is_round, (h_c0, h_c90, h_c180, h_c270) = area
+    cos_gamma = math.cos(math.radians(gamma))
+    sin_gamma = math.sin(math.radians(gamma))
+
+    if is_round:
+        return math.pi / 4 * length * width * cos_gamma + length * h_c0 * sin_gamma
+
+    cos_c = math.cos(math.radians(c_angle))
+    sin_c = math.sin(math.radians(c_angle))
+    sides = width * (h_c0 if cos_c > 0 else h_c180) * abs(cos_c) + length * (h_c90 if sin_c > 0 else h_c270) * abs(sin_c)
+    return length * width * cos_gamma + sides * sin_gamma
+
+
+def position_index(lateral: float, forward: float, height: float) -> float:
+    """
+    Guth position index of a source above the line of sight, in the approximation of CIE 117
+    """
+    alpha = math.degrees(math.atan2(abs(lateral), height))
+    beta = math.degrees(math.atan2(math.hypot(lateral, height), forward))
+    return math.exp(
+        (35.2 - 0.31889 * alpha - 1.22 * math.exp(-2 * alpha / 9)) * 1e-3 * beta
+        + (21 + 0.26667 * alpha - 0.002963 * alpha ** 2) * 1e-5 * beta ** 2
+    )
+
+
+def _positions(size: float, spacing: float) -> List[float]:
+    count = round(size / spacing)
+    return [(i + 0.5) * spacing - size / 2 for i in range(count)]
+
+
+class _GlareTerms:
+    """
+    Terms L^2 * omega / p^2 of luminaires at offsets from the observer, calculated once for all rooms.
+    H is taken as the unit of length, the table does not depend on its value
+    """
+
+    def __init__(self, luminaire: Luminaire, multiplier: float, area: LuminousArea, c_offset: float):
+        self.intensity = interpolator(luminaire)
+        self.multiplier = multiplier
+        self.area = area
+        self.c_offset = c_offset
+        self.terms: Dict[Tuple[float, float], float] = {}
+
+    def room_sum(self, xs: List[float], ys: List[float]) -> float:
+        offsets = [(round(x, _OFFSET_DIGITS), round(y, _OFFSET_DIGITS)) for y in ys for x in xs]
+        missing = [offset for offset in dict.fromkeys(offsets) if offset not in self.terms]
+
+        # Directions from luminaires towards the observer, in coordinates of the luminaire
+        directions = [
+            (math.degrees(math.atan2(-y, -x)) + self.c_offset, math.degrees(math.atan2(math.hypot(x, y), 1)))
+            for x, y in missing
+        ]
+        intensities = self.intensity.evaluate(directions)
+
+        for (x, y), (c_angle, gamma), intensity in zip(missing, directions, intensities):
+            area = projected_area(self.area, c_angle, gamma)
+            if area <= 0 or intensity <= 0:
+                self.terms[(x, y)] = 0
+                continue
+            candela = intensity * self.multiplier
+            distance_squared = x * x + y * y + 1
+            p = position_index(x, y, 1)
+            self.terms[(x, y)] = candela * candela / (area * distance_squared * p * p)
+
+        return sum(map(self.terms.__getitem__, offsets))
+
+
+def _background_luminance(
+        room: UgrRoom,
+        spacing: float,
+        zones: Tuple[float, ...],
+        reflectances: CavityReflectances
+) -> float:
+    """
+    Luminance of the walls lit by interreflected light only, with H taken as the unit of length
+    """
+    count = round(room.x / spacing) * round(room.y / spacing)
+    downward = sum(zones[:9]) * count
+    upward = sum(zones[9:]) * count
+    room_cavity_ratio = 5 * (room.x + room.y) / (room.x * room.y)
+    direct_ratio = calc.zonal_direct_ratio(zones, room_cavity_ratio)
+
+    incident = calc.incident_cavity_flux(downward, upward, direct_ratio, room_cavity_ratio, reflectances)
+    indirect_wall_flux = incident[1] - downward * (1 - direct_ratio)
+    indirect_illuminance = indirect_wall_flux / (2 * (room.x + room.y))
+    return indirect_illuminance / math.pi
+
+
+def _ugr(terms_sum: float, background_luminance: float) -> float | None:
+    if terms_sum <= 0 or background_luminance <= 0:
+        return None
+    return 8 * math.log10(0.25 / background_luminance * terms_sum)
+
+
+def ugr_table(
+        luminaire: Luminaire,
+        rooms: Tuple[Tuple[float, float], ...] = STANDARD_UGR_ROOMS,
+        reflectances: Tuple[Tuple[float, float, float], ...] = STANDARD_UGR_REFLECTANCES,
+        spacing: float = STANDARD_UGR_SPACING
+) -> UgrTable | None:
+    """
+    Unified glare rating by the tabular method of CIE 117 and CIE 190.
+
+    The observer sits at the middle of a wall and looks horizontally along the room, luminaires are placed
+    in a regular grid covering the ceiling. Luminance is the intensity towards the observer divided by the
+    projected luminous area, background luminance comes from light interreflected by the room surfaces.
+    Returns None when the luminous area or, for relative photometry, the flux of lamps is unknown.
+    """
+    if not luminaire.c_planes:
+        return None
+    multiplier = calc.candela_multiplier(luminaire)
+    if multiplier is None:
+        return None
+    area = _luminous_area(luminaire)
+    if area is None:
+        return None
+
+    zones = calc.zonal_flux(luminaire)
+    ugr_rooms = [UgrRoom(x=x, y=y) for x, y in rooms]
+    cavity_reflectances = [CavityReflectances(ceiling=c, walls=w, floor=f) for c, w, f in reflectances]
+
+    # Crosswise the C0-C180 plane of luminaires is across the line of sight, endwise along it
+    crosswise_terms = _GlareTerms(luminaire, multiplier, area, c_offset=0)
+    endwise_terms = _GlareTerms(luminaire, multiplier, area, c_offset=-90)
+
+    crosswise = []
+    endwise = []
+    for room in ugr_rooms:
+        xs = _positions(room.x, spacing)
+        ys = [y + room.y / 2 for y in _positions(room.y, spacing)]
+        crosswise_sum = crosswise_terms.room_sum(xs, ys)
+        endwise_sum = endwise_terms.room_sum(xs, ys)
+
+        background = [_background_luminance(room, spacing, zones, r) for r in cavity_reflectances]
+        crosswise.append([_ugr(crosswise_sum, b) for b in background])
+        endwise.append([_ugr(endwise_sum, b) for b in background])
+
+    return UgrTable(
+        rooms=ugr_rooms,
+        reflectances=cavity_reflectances,
+        spacing=spacing,
+        crosswise=crosswise,
+        endwise=endwise
+    )
+
+
+def cached_ugr_table(luminaire: Luminaire) -> UgrTable | None:
+    return luminaire.get_derived_value("ugr_table", ugr_table)
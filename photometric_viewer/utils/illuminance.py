@@ -0,0 +1,150 @@
+import math
+import operator
+from dataclasses import dataclass
+from typing import List, Tuple, Dict
+
+from photometric_viewer.model.luminaire import Luminaire, Symmetry
+from photometric_viewer.utils import calc
+from photometric_viewer.utils.interpolation import interpolator, IntensityInterpolator
+
+# Offsets between luminaires and calculation points are rounded to this number of digits (in meters)
+# when looking up already calculated contributions
+_OFFSET_DIGITS = 9
+
+
+@dataclass
+class IlluminanceGrid:
+    # Coordinates of calculation points in meters
+    xs: List[float]
+    ys: List[float]
+    # Horizontal illuminance in lx, one row per y coordinate
+    values: List[List[float]]
+
+    @property
+    def e_min(self) -> float:
+        return min(min(row) for row in self.values)
+
+    @property
+    def e_max(self) -> float:
+        return max(max(row) for row in self.values)
+
+    @property
+    def e_avg(self) -> float:
+        return sum(sum(row) for row in self.values) / (len(self.xs) * len(self.ys))
+
+    @property
+    def uniformity(self) -> float | None:
+        """
+        Ratio of minimal to average illuminance (U0)
+        """
+        e_avg = self.e_avg
+        return self.e_min / e_avg if e_avg > 0 else None
+
+
+def _cell_centers(size: float, count: int) -> List[float]:
+    return [size * (i + 0.5) / count for i in range(count)]
+
+
+def grid_layout(width: float, length: float, columns: int, rows: int) -> List[Tuple[float, float]]:
+    """
+    Positions of luminaires placed in the centers of equal cells of the zone
+    """
+    return [(x, y) for y in _cell_centers(length, rows) for x in _cell_centers(width, columns)]
+
+
+def layout_for_count(width: float, length: float, count: int) -> Tuple[int, int]:
+    """
+    Returns number of columns and rows of a grid with at least count luminaires, following the proportions of the zone
+    """
+    if count <= 0:
+        return 0, 0
+    columns = max(1, min(count, round(math.sqrt(count * width / length)))) if length > 0 else count
+    rows = math.ceil(count / columns)
+    return columns, rows
+
+
+def _mirrored_axes(symmetry: Symmetry) -> Tuple[bool, bool]:
+    """
+    Whether offsets along the x-axis and along the y-axis give the same contribution as their opposites
+    """
+    match symmetry:
+        case Symmetry.TO_C0_C180:
+            return False, True
+        case Symmetry.TO_C90_C270:
+            return True, False
+        case Symmetry.TO_C0_C180_C90_C270 | Symmetry.TO_VERTICAL_AXIS:
+            return True, True
+    return False, False
+
+
+def _row_contributions(intensity: IntensityInterpolator, dxs: List[float], dy: float, h: float) -> List[float]:
+    """
+    Illuminance at offsets dxs from a luminaire of 1 cd/klm in a row at offset dy, with all intensities
+    of the row looked up in one batch
+    """
+    dy2 = dy * dy
+    h2 = h * h
+    directions = [
+        (math.degrees(math.atan2(dy, dx)), math.degrees(math.atan(math.sqrt(dx * dx + dy2) / h)))
+        for dx in dxs
+    ]
+    # I * cos³(γ) / h² with cos(γ) = h / d
+    return [
+        i * h / (dx * dx + dy2 + h2) ** 1.5
+        for i, dx in zip(intensity.evaluate(directions), dxs)
+    ]
+
+
+def calculate_illuminance(
+        luminaire: Luminaire,
+        positions: List[Tuple[float, float]],
+        mounting_height: float,
+        width: float,
+        length: float,
+        points_x: int = 100,
+        points_y: int = 100,
+        mf: float = 1
+) -> IlluminanceGrid:
+    """
+    Calculates horizontal illuminance on a grid of points of the workplane, using the inverse-square and cosine laws.
+
+    Luminaires are placed at the given positions, mounting_height above the workplane, with their C0 plane
+    along the x-axis. Contributions are calculated once for every distinct offset between a luminaire and a point,
+    mirrored offsets of symmetric luminaires sharing one, and intensities are looked up in batches of one row.
+    Raises ValueError if the mounting height is not positive or the intensities can not be converted to candela.
+    """
+    if mounting_height <= 0:
+        raise ValueError("Mounting height must be greater than 0")
+
+    multiplier = calc.candela_multiplier(luminaire)
+    if multiplier is None:
+        raise ValueError("Luminous flux of the lamps is unknown")
+
+    intensity = interpolator(luminaire)
+    mirrored_x, mirrored_y = _mirrored_axes(intensity.symmetry)
+    h = mounting_height
+
+    xs = _cell_centers(width, points_x)
+    ys = _cell_centers(length, points_y)
+
+    # Contributions by offset in y, then by offset in x
+    contributions: Dict[float, Dict[float, float]] = {}
+    values = [[0.0] * points_x for _ in ys]
+
+    for lx, ly in positions:
+        x_offsets = [round(x - lx, _OFFSET_DIGITS) for x in xs]
+        if mirrored_x:
+            x_offsets = [abs(dx) for dx in x_offsets]
+        for j, y in enumerate(ys):
+            dy = round(y - ly, _OFFSET_DIGITS)
+            if mirrored_y:
+                dy = abs(dy)
+            row_contributions = contributions.setdefault(dy, {})
+            missing = [dx for dx in dict.fromkeys(x_offsets) if dx not in row_contributions]
+            if missing:
+                row_contributions.update(zip(missing, _row_contributions(intensity, missing, dy, h)))
+            values[j] = list(map(operator.add, values[j], map(row_contributions.__getitem__, x_offsets)))
+
+    factor = multiplier * mf
+    values = [[value * factor for value in row] for row in values]
+    return IlluminanceGrid(xs=xs, ys=ys, values=values)
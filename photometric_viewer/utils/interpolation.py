@@ -0,0 +1,223 @@
+import bisect
+import math
+from array import array
+from enum import Enum
+from typing import Tuple, List, Iterable, Sequence
+
+from photometric_viewer.model.intensities import IntensityGrid
+from photometric_viewer.model.luminaire import Luminaire, Symmetry
+from photometric_viewer.utils.symmetry import fold_c_angle
+
+
+class InterpolationMethod(Enum):
+    BILINEAR = 1
+    BICUBIC = 2
+
+
+class _Axis:
+    """
+    Sorted angles of one axis of the intensity grid. Brackets of equidistant axes are found arithmetically
+    """
+
+    def __init__(self, values: Sequence[float]):
+        self.values = tuple(values)
+        self.last = len(self.values) - 1
+        self.step = None
+        if len(self.values) > 1:
+            step = (self.values[-1] - self.values[0]) / self.last
+            if step > 0 and all(
+                    math.isclose(value, self.values[0] + i * step, abs_tol=1e-9)
+                    for i, value in enumerate(self.values)
+            ):
+                self.step = step
+
+    def bracket(self, value: float) -> Tuple[int, float]:
+        """
+        Returns index of the lower neighbouring angle and weight of the upper one, clamped to the ends of the axis
+        """
+        values = self.values
+        if value <= values[0]:
+            return 0, 0
+        if value >= values[-1]:
+            return self.last, 0
+        if self.step is not None:
+            i = min(int((value - values[0]) / self.step), self.last - 1)
+        else:
+            i = bisect.bisect_right(values, value) - 1
+        return i, (value - values[i]) / (values[i + 1] - values[i])
+
+
+def effective_symmetry(c_angles: Tuple[float, ...], symmetry: Symmetry) -> Symmetry:
+    """
+    Symmetry that has to be applied to C angles not covered by the C planes of the grid.
+    Files without symmetry information are checked for the ranges of C planes used by IES files
+    """
+    if len(c_angles) <= 1:
+        return Symmetry.TO_VERTICAL_AXIS
+    first, last = c_angles[0], c_angles[-1]
+    if first == 0 and last > 180:
+        return Symmetry.NONE
+    if symmetry != Symmetry.NONE:
+        return symmetry
+    if last <= 90:
+        return Symmetry.TO_C0_C180_C90_C270
+    if first >= 90 and last <= 270:
+        return Symmetry.TO_C90_C270
+    if last <= 180:
+        return Symmetry.TO_C0_C180
+    return Symmetry.NONE
+
+
+def _cubic_weights(t: float) -> Tuple[float, float, float, float]:
+    """
+    Weights of four neighbouring values of a Catmull-Rom spline
+    """
+    t2 = t * t
+    t3 = t2 * t
+    return (
+        (-t3 + 2 * t2 - t) / 2,
+        (3 * t3 - 5 * t2 + 2) / 2,
+        (-3 * t3 + 4 * t2 + t) / 2,
+        (t3 - t2) / 2
+    )
+
+
+class IntensityInterpolator:
+    """
+    Interpolation of intensities between measured C planes and gamma angles.
+
+    C angles not covered by the measured planes are mapped to them according to the symmetry of the luminaire.
+    Intensities between the last C plane and 360° are interpolated towards the C0 plane.
+    Missing values and directions outside of the measured gamma angles count as 0.
+    """
+
+    def __init__(
+            self,
+            grid: IntensityGrid,
+            symmetry: Symmetry = Symmetry.NONE,
+            method: InterpolationMethod = InterpolationMethod.BILINEAR
+    ):
+        self.method = method
+        self.symmetry = effective_symmetry(grid.c_angles, symmetry)
+        self.rows: List[List[float]] = [
+            [0 if math.isnan(v) else v for v in grid.row(c)]
+            for c in grid.c_angles
+        ]
+
+        c_angles = grid.c_angles
+        # Number of distinct planes around the circle when the distribution is periodic
+        self.period = None
+        if self.symmetry == Symmetry.NONE and c_angles and c_angles[0] == 0 and c_angles[-1] > 180:
+            if c_angles[-1] == 360:
+                self.period = len(c_angles) - 1
+            else:
+                self.period = len(c_angles)
+                c_angles = c_angles + (360,)
+                self.rows.append(self.rows[0])
+
+        self.c_axis = _Axis(c_angles)
+        self.gamma_axis = _Axis(grid.gamma_angles)
+
+    def __call__(self, c_angle: float, gamma: float) -> float:
+        gamma_axis = self.gamma_axis
+        if not self.rows or not gamma_axis.values:
+            return 0
+        if not gamma_axis.values[0] <= gamma <= gamma_axis.values[-1]:
+            return 0
+
+        c_bracket = self.c_axis.bracket(fold_c_angle(c_angle, self.symmetry))
+        gamma_bracket = gamma_axis.bracket(gamma)
+        if self.method == InterpolationMethod.BICUBIC:
+            return self._bicubic(c_bracket, gamma_bracket)
+        return self._bilinear(c_bracket, gamma_bracket)
+
+    def _bilinear(self, c_bracket: Tuple[int, float], gamma_bracket: Tuple[int, float]) -> float:
+        c_index, c_weight = c_bracket
+        g_lower, g_weight = gamma_bracket
+        g_upper = min(g_lower + 1, self.gamma_axis.last)
+
+        lower_row = self.rows[c_index]
+        upper_row = self.rows[min(c_index + 1, self.c_axis.last)]
+        lower = lower_row[g_lower] + (lower_row[g_upper] - lower_row[g_lower]) * g_weight
+        upper = upper_row[g_lower] + (upper_row[g_upper] - upper_row[g_lower]) * g_weight
+        return lower + (upper - lower) * c_weight
+
+    def _c_neighbours(self, c_index: int) -> List[int]:
+        if self.period is not None:
+            return [i % self.period for i in range(c_index - 1, c_index + 3)]
+        return [min(max(i, 0), self.c_axis.last) for i in range(c_index - 1, c_index + 3)]
+
+    def _bicubic(self, c_bracket: Tuple[int, float], gamma_bracket: Tuple[int, float]) -> float:
+        c_index, c_weight = c_bracket
+        g_index, g_weight = gamma_bracket
+        last = self.gamma_axis.last
+        g_neighbours = [min(max(i, 0), last) for i in range(g_index - 1, g_index + 3)]
+        g_weights = _cubic_weights(g_weight)
+
+        value = 0
+        for row_index, weight in zip(self._c_neighbours(c_index), _cubic_weights(c_weight)):
+            row = self.rows[row_index]
+            value += weight * sum(row[i] * w for i, w in zip(g_neighbours, g_weights))
+        # Splines may overshoot below 0 next to steep edges of the distribution
+        return max(value, 0)
+
+    def evaluate(self, directions: Iterable[Tuple[float, float]]) -> array:
+        """
+        Returns intensities in a series of (C angle, gamma angle) directions
+        """
+        gamma_axis = self.gamma_axis
+        if self.method == InterpolationMethod.BICUBIC or not self.rows or not gamma_axis.values:
+            return array("d", (self(c_angle, gamma) for c_angle, gamma in directions))
+
+        # Bilinear interpolation inlined, as batches of directions are evaluated for every point of a calculation
+        low, high = gamma_axis.values[0], gamma_axis.values[-1]
+        gamma_bracket, c_bracket = gamma_axis.bracket, self.c_axis.bracket
+        gamma_last, c_last = gamma_axis.last, self.c_axis.last
+        rows, symmetry = self.rows, self.symmetry
+
+        result = array("d")
+        for c_angle, gamma in directions:
+            if not low <= gamma <= high:
+                result.append(0)
+                continue
+            c_index, c_weight = c_bracket(fold_c_angle(c_angle, symmetry))
+            g_lower, g_weight = gamma_bracket(gamma)
+            g_upper = g_lower + 1 if g_lower < gamma_last else gamma_last
+            lower_row = rows[c_index]
+            upper_row = rows[c_index + 1 if c_index < c_last else c_last]
+            lower = lower_row[g_lower] + (lower_row[g_upper] - lower_row[g_lower]) * g_weight
+            upper = upper_row[g_lower] + (upper_row[g_upper] - upper_row[g_lower]) * g_weight
+            result.append(lower + (upper - lower) * c_weight)
+        return result
+
+    def evaluate_grid(self, c_angles: Sequence[float], gamma_angles: Sequence[float]) -> List[array]:
+        """
+        Returns intensities on a grid of directions, one row of gamma angles per C angle.
+        Brackets of every angle are found only once for the whole grid
+        """
+        gamma_axis = self.gamma_axis
+        if not self.rows or not gamma_axis.values:
+            return [array("d", [0] * len(gamma_angles)) for _ in c_angles]
+
+        low, high = gamma_axis.values[0], gamma_axis.values[-1]
+        gamma_brackets = [gamma_axis.bracket(gamma) if low <= gamma <= high else None for gamma in gamma_angles]
+        interpolate = self._bicubic if self.method == InterpolationMethod.BICUBIC else self._bilinear
+
+        result = []
+        for c_angle in c_angles:
+            c_bracket = self.c_axis.bracket(fold_c_angle(c_angle, self.symmetry))
+            result.append(array("d", (
+                interpolate(c_bracket, gamma_bracket) if gamma_bracket is not None else 0
+                for gamma_bracket in gamma_brackets
+            )))
+        return result
+
+
+def interpolator(
+        luminaire: Luminaire,
+        method: InterpolationMethod = InterpolationMethod.BILINEAR
+) -> IntensityInterpolator:
+    return luminaire.get_derived_value(
+        f"interpolator.{method.name}",
+        lambda l: IntensityInterpolator(l.intensity_values, l.metadata.symmetry, method)
+    )
@@ -1,4 +1,8 @@
-from typing import IO
+import io
+from os import PathLike
+from typing import IO, List, TextIO
+
+from photometric_viewer.utils.conversion import safe_float
 
 
 def first_non_empty_line(f: IO) -> str | None:
@@ -37,14 +41,41 @@ def get_n_values(f: IO, n: int):
     return raw_values[:n]
 
 
-def read_till_end(f: IO):
-    raw_values = []
-    line = first_non_empty_line(f)
-    while line is not None:
-        values = line.strip().split(" ")
-        for value in values:
-            if value == "":
-                continue
-            raw_values.append(value)
-        line = first_non_empty_line(f)
-    return raw_values
\ No newline at end of file
+def read_floats_till_end(f: IO) -> List[float | None]:
+    """
+    Reads all remaining values separated by any whitespace, including blank lines.
+    Values that are not valid numbers are returned as None.
+    """
+    tokens = f.read().split()
+    try:
+        return list(map(float, tokens))
+    except ValueError:
+        return [safe_float(token) for token in tokens]
+
+
+def _detect_encoding(contents):
+    wrapper = io.TextIOWrapper(io.BytesIO(contents), encoding="utf-8")
+    try:
+        wrapper.readline()
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "windows-1252"
+
+
+def contents_stream(contents: bytes):
+    encoding = _detect_encoding(contents)
+    return io.TextIOWrapper(io.BytesIO(contents), encoding=encoding)
+
+
+def open_text_file(path: str | PathLike) -> TextIO:
+    """
+    Opens a file for reading text, detecting its encoding from the beginning of the file
+    """
+    with open(path, "rb") as f:
+        encoding = _detect_encoding(f.read(io.DEFAULT_BUFFER_SIZE))
+    return open(path, encoding=encoding, errors="replace")
+
+
+def decode_contents(contents: bytes) -> str:
+    with contents_stream(contents) as f:
+        return f.read()
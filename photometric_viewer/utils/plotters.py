@@ -7,6 +7,7 @@ import cairo
 
 from photometric_viewer.model.luminaire import Luminaire
 from photometric_viewer.utils.coordinates import cartesian_to_screen
+from photometric_viewer.utils.resampling import decimated
 
 
 class DiagramStyle(Enum):
@@ -50,6 +51,25 @@ class LightDistributionPlotterSettings:
     theme: LightDistributionPlotterTheme = field(default_factory=lambda : LightDistributionPlotterTheme())
 
 
+def _calculate_maxima(luminaire: Luminaire) -> Tuple[float, float, float]:
+    """
+    Returns maximal intensities in C0-C180 and C90-C270 planes for gamma below 45°, between 45° and 135° and above 135°
+    """
+    max_lower_half = 0
+    max_upper_half = 0
+    max_other = 0
+    for c_angle in [0, 90, 180, 270]:
+        values = luminaire.get_values_for_c_angle(c_angle)
+        for angle, candelas in values.items():
+            if angle < 45 and candelas > max_lower_half:
+                max_lower_half = candelas
+            if angle >= 135 and candelas > max_upper_half:
+                max_upper_half = candelas
+            if 45 <= angle < 135 and candelas > max_other:
+                max_other = candelas
+    return max_lower_half, max_other, max_upper_half
+
+
 class LightDistributionPlotter:
     def __init__(self, settings: LightDistributionPlotterSettings = None):
         self.size = 300
@@ -84,18 +104,7 @@ class LightDistributionPlotter:
         if self.settings.display_half_spaces == DisplayHalfSpaces.BOTH:
             return self.size / 2, self.size / 2
 
-        max_lower_half = 0
-        max_upper_half = 0
-        max_other = 0
-        for c_angle in [0, 90, 180, 270]:
-            values = luminaire.get_values_for_c_angle(c_angle)
-            for angle, candelas in values.items():
-                if angle < 45 and candelas > max_lower_half:
-                    max_lower_half = candelas
-                if angle >= 135 and candelas > max_upper_half:
-                    max_upper_half = candelas
-                if 45 <= angle < 135 and candelas > max_other:
-                    max_other = candelas
+        max_lower_half, max_other, max_upper_half = luminaire.get_derived_value("ldc_maxima", _calculate_maxima)
 
         if max_other > max_upper_half and max_other > max_lower_half:
             return self.size / 2, self.size / 2
@@ -107,13 +116,7 @@ class LightDistributionPlotter:
             return self.size / 2, self.size * 0.5
 
     def _get_max_candela(self, luminaire: Luminaire):
-        max_candelas = 0
-
-        for c_angle in [0, 90, 180, 270]:
-            values = luminaire.get_values_for_c_angle(c_angle)
-            for angle, candelas in values.items():
-                if candelas > max_candelas:
-                    max_candelas = candelas
+        max_candelas = max(luminaire.get_derived_value("ldc_maxima", _calculate_maxima))
 
         if self.settings.snap_value_angles_to == SnapValueAnglesTo.MAX_VALUE:
             return max_candelas
@@ -215,6 +218,8 @@ class LightDistributionPlotter:
         theme = self.settings.theme
         context.set_line_width(theme.curve_line_width)
         max_candelas = self._get_max_candela(luminaire)
+        # Dense measured grids are drawn from fewer gamma angles
+        luminaire = decimated(luminaire)
 
         context.set_dash(self.settings.theme.c0_dash)
         self._draw_halfcurve(context, luminaire, max_candelas, 0, theme.c0_stroke, theme.c0_fill)
@@ -272,6 +277,8 @@ class LightDistributionPlotter:
         if self.highlight_angle is None:
             return
 
+        max_candelas = self._get_max_candela(luminaire)
+
         for c_angle in [0, 90, 180, 270]:
 
             if c_angle in (90, 270):
@@ -287,8 +294,6 @@ class LightDistributionPlotter:
 
             candelas = gammas_and_candelas[self.highlight_angle]
 
-            max_candelas = self._get_max_candela(luminaire)
-
             x, y = self._get_screen_coordinates(c_angle, self.highlight_angle, candelas, max_candelas)
 
             context.new_path()
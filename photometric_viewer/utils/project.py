@@ -1,6 +1,8 @@
 import importlib.metadata
 import os
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict
 
 @dataclass
 class ProjectUrls:
@@ -42,5 +44,18 @@ def _get_metadata():
 
 PROJECT = _get_metadata()
 
+
+def export_tool_keywords() -> Dict[str, str]:
+    """
+    Keywords identifying this application in exported IES files
+    """
+    return {
+        "_EXPORT_TOOL": PROJECT.name,
+        "_EXPORT_TOOL_VERSION": PROJECT.version,
+        "_EXPORT_TOOL_HOMEPAGE": PROJECT.urls.homepage,
+        "_EXPORT_TOOL_ISSUE_TRACKER": PROJECT.urls.bug_tracker,
+        "_EXPORT_TIMESTAMP": datetime.now().isoformat()
+    }
+
 ASSETS_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets')
 
@@ -0,0 +1,98 @@
+import dataclasses
+import math
+from array import array
+from typing import List, Sequence, Tuple
+
+from photometric_viewer.model.intensities import IntensityGrid
+from photometric_viewer.model.luminaire import Luminaire
+from photometric_viewer.utils import calc
+from photometric_viewer.utils.interpolation import interpolator, InterpolationMethod
+from photometric_viewer.utils.symmetry import apply_symmetry
+
+# Steps of C and gamma angles in degrees of commonly used target grids
+CATALOG_GRID = (15, 5)
+SIMULATION_GRID = (1, 1)
+
+# Largest number of gamma angles drawn by the plotter, denser grids are decimated
+MAX_PLOTTED_GAMMA_ANGLES = 181
+
+
+def angle_steps(start: float, stop: float, step: float) -> List[float]:
+    """
+    Angles from start up to stop in equal steps, including stop when it is reached by a whole number of steps
+    """
+    if step <= 0:
+        raise ValueError("Angle step must be greater than 0")
+    count = math.floor((stop - start) / step + 1e-9)
+    return [round(start + i * step, 9) for i in range(count + 1)]
+
+
+def resample(
+        luminaire: Luminaire,
+        c_angles: Sequence[float],
+        gamma_angles: Sequence[float],
+        preserve_flux: bool = False,
+        method: InterpolationMethod = InterpolationMethod.BILINEAR
+) -> Luminaire:
+    """
+    Returns a copy of the luminaire with intensities interpolated onto the given C and gamma angles.
+
+    C angles not measured by the luminaire are taken from the planes they are mirrored from according to its
+    symmetry. With preserve_flux, intensities are rescaled so that the luminous flux of the copy matches the flux
+    of the original, compensating for peaks lost between the target angles.
+    """
+    rows = interpolator(luminaire, method).evaluate_grid(c_angles, gamma_angles)
+    values = array("d")
+    for row in rows:
+        values.extend(row)
+
+    resampled = Luminaire(
+        c_planes=list(c_angles),
+        gamma_angles=list(gamma_angles),
+        intensity_values=IntensityGrid(c_angles, gamma_angles, values),
+        luminous_opening_geometry=luminaire.luminous_opening_geometry,
+        geometry=luminaire.geometry,
+        lamps=luminaire.lamps,
+        metadata=dataclasses.replace(luminaire.metadata, file_source=None),
+        photometry=luminaire.photometry
+    )
+
+    if preserve_flux:
+        original_flux = sum(calc.relative_zonal_flux(luminaire))
+        resampled_flux = sum(calc.relative_zonal_flux(resampled))
+        if resampled_flux > 0:
+            factor = original_flux / resampled_flux
+            resampled.intensity_values = IntensityGrid(c_angles, gamma_angles, (v * factor for v in values))
+
+    apply_symmetry(resampled)
+    return resampled
+
+
+def resample_to_steps(
+        luminaire: Luminaire,
+        steps: Tuple[float, float],
+        preserve_flux: bool = False
+) -> Luminaire:
+    """
+    Resamples the luminaire onto C angles around the full circle and gamma angles covering the measured range,
+    spaced by steps of C and gamma angles, e.g. CATALOG_GRID or SIMULATION_GRID
+    """
+    c_step, gamma_step = steps
+    c_angles = [c for c in angle_steps(0, 360, c_step) if c < 360]
+    gamma_angles = angle_steps(luminaire.gamma_angles[0], luminaire.gamma_angles[-1], gamma_step)
+    return resample(luminaire, c_angles, gamma_angles, preserve_flux)
+
+
+def _decimate(luminaire: Luminaire) -> Luminaire:
+    gamma_angles = luminaire.gamma_angles
+    if len(gamma_angles) <= MAX_PLOTTED_GAMMA_ANGLES:
+        return luminaire
+    step = (gamma_angles[-1] - gamma_angles[0]) / (MAX_PLOTTED_GAMMA_ANGLES - 1)
+    return resample(luminaire, [0, 90, 180, 270], angle_steps(gamma_angles[0], gamma_angles[-1], step))
+
+
+def decimated(luminaire: Luminaire) -> Luminaire:
+    """
+    Luminaire with at most MAX_PLOTTED_GAMMA_ANGLES gamma angles in the C0, C90, C180 and C270 planes, for drawing
+    """
+    return luminaire.get_derived_value("decimated", _decimate)
@@ -0,0 +1,111 @@
+import dataclasses
+import math
+from array import array
+from typing import List
+
+from photometric_viewer.model.intensities import IntensityGrid
+from photometric_viewer.model.luminaire import Luminaire, Symmetry
+
+# Largest difference between mirrored intensities still regarded as symmetric, relative to the peak intensity
+SYMMETRY_TOLERANCE = 0.001
+
+# Symmetries checked by detect_symmetry, the ones with fewer unique C planes first
+_CANDIDATES = [
+    Symmetry.TO_VERTICAL_AXIS,
+    Symmetry.TO_C0_C180_C90_C270,
+    Symmetry.TO_C0_C180,
+    Symmetry.TO_C90_C270,
+]
+
+
+def fold_c_angle(c_angle: float, symmetry: Symmetry) -> float:
+    """
+    Maps a C angle into the part of the distribution given by a luminaire with the given symmetry
+    """
+    c_angle = c_angle % 360
+    match symmetry:
+        case Symmetry.TO_VERTICAL_AXIS:
+            return 0
+        case Symmetry.TO_C0_C180:
+            return 360 - c_angle if c_angle > 180 else c_angle
+        case Symmetry.TO_C90_C270:
+            return (540 - c_angle) % 360 if c_angle < 90 or c_angle > 270 else c_angle
+        case Symmetry.TO_C0_C180_C90_C270:
+            c_angle = c_angle % 180
+            return 180 - c_angle if c_angle > 90 else c_angle
+    return c_angle
+
+
+def _source_planes(grid: IntensityGrid, symmetry: Symmetry) -> List[int | None]:
+    """
+    Index of the C plane holding the values of each C plane of the grid, None when the grid lacks it
+    """
+    return [grid.c_index(fold_c_angle(c, symmetry)) for c in grid.c_angles]
+
+
+def _rows_match(first: array, second: array, tolerance: float) -> bool:
+    return all(
+        abs(a - b) <= tolerance or (math.isnan(a) and math.isnan(b))
+        for a, b in zip(first, second)
+    )
+
+
+def _is_full_circle(grid: IntensityGrid) -> bool:
+    return len(grid.c_angles) > 1 and grid.c_angles[0] == 0 and grid.c_angles[-1] > 180
+
+
+def detect_symmetry(grid: IntensityGrid, tolerance: float = SYMMETRY_TOLERANCE) -> Symmetry:
+    """
+    Finds the symmetry of a distribution measured around the full circle of C planes.
+    Planes mirrored by a symmetry have to be measured and may differ by tolerance times the peak intensity.
+    """
+    if not _is_full_circle(grid):
+        return Symmetry.NONE
+
+    absolute_tolerance = tolerance * (grid.max() or 0)
+    rows = [grid.row(c) for c in grid.c_angles]
+    for symmetry in _CANDIDATES:
+        sources = _source_planes(grid, symmetry)
+        if None in sources:
+            continue
+        if all(_rows_match(rows[i], rows[source], absolute_tolerance) for i, source in enumerate(sources)):
+            return symmetry
+    return Symmetry.NONE
+
+
+def compact_grid(grid: IntensityGrid, symmetry: Symmetry) -> IntensityGrid:
+    """
+    Returns a grid storing only the unique C planes of a luminaire with the given symmetry.
+    Mirrored C planes share the stored rows of the planes they are mirrored from.
+    """
+    sources = [
+        i if source is None else source
+        for i, source in enumerate(_source_planes(grid, symmetry))
+    ]
+    stored = sorted(set(sources))
+    if len(stored) == len(grid.c_angles):
+        return grid
+
+    row_numbers = {source: number for number, source in enumerate(stored)}
+    values = array("d")
+    for source in stored:
+        values.extend(grid.row(grid.c_angles[source]))
+
+    return IntensityGrid(
+        c_angles=grid.c_angles,
+        gamma_angles=grid.gamma_angles,
+        values=values,
+        row_sources=[row_numbers[source] for source in sources]
+    )
+
+
+def apply_symmetry(luminaire: Luminaire, tolerance: float = SYMMETRY_TOLERANCE):
+    """
+    Detects the symmetry of luminaires whose files do not declare it, and keeps only their unique C planes
+    """
+    if luminaire.metadata.symmetry == Symmetry.NONE:
+        symmetry = detect_symmetry(luminaire.intensity_values, tolerance)
+        if symmetry != Symmetry.NONE:
+            luminaire.metadata = dataclasses.replace(luminaire.metadata, symmetry=symmetry)
+    if luminaire.metadata.symmetry != Symmetry.NONE and _is_full_circle(luminaire.intensity_values):
+        luminaire.intensity_values = compact_grid(luminaire.intensity_values, luminaire.metadata.symmetry)
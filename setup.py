@@ -13,7 +13,11 @@ setup(name='photometric-viewer',
       license='MIT',
       packages=find_packages(),
       entry_points={
-          'console_scripts': ['photometric-viewer=photometric_viewer.main:run'],
+          'console_scripts': [
+              'photometric-viewer=photometric_viewer.main:run',
+              'photometric-viewer-convert=photometric_viewer.convert:run',
+              'photometric-viewer-render=photometric_viewer.render:run',
+          ],
       },
       package_data={
           'photometric_viewer': [
@@ -168,6 +168,16 @@ NON_EQUIDISTANT_UPWARD_RADIATING_SOURCE.intensity_values = {
     for gamma in NON_EQUIDISTANT_UPWARD_RADIATING_SOURCE.gamma_angles
 }
 
+LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE = copy.deepcopy(MINIMAL_LUMINAIRE)
+LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE.lamps[0].lumens_per_lamp = 1000 * 2 * math.pi
+LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE.c_planes = [0, 90, 180, 270]
+LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE.gamma_angles = [0, 5, 15, 45, 90]
+LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE.intensity_values = {
+    (c, gamma): 1000
+    for c in LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE.c_planes
+    for gamma in LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE.gamma_angles
+}
+
 LOR_50_UNIFORM_RADIATING_SOURCE = copy.deepcopy(UNIFORM_RADIATING_SOURCE)
 LOR_50_UNIFORM_RADIATING_SOURCE.photometry.is_absolute = False
 LOR_50_UNIFORM_RADIATING_SOURCE.lamps = [
@@ -186,3 +196,7 @@ LOR_50_UNIFORM_RADIATING_SOURCE.intensity_values = {
     for c in LOR_50_UNIFORM_RADIATING_SOURCE.c_planes
     for gamma in LOR_50_UNIFORM_RADIATING_SOURCE.gamma_angles
 }
+
+LUMINAIRE_WITHOUT_LAMP_FLUX = copy.deepcopy(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+LUMINAIRE_WITHOUT_LAMP_FLUX.photometry.is_absolute = False
+LUMINAIRE_WITHOUT_LAMP_FLUX.lamps[0].lumens_per_lamp = None
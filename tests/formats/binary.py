@@ -0,0 +1,61 @@
+import copy
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from photometric_viewer.formats import binary
+from photometric_viewer.formats.common import import_from_string
+from photometric_viewer.formats.exceptions import InvalidPhotometricFileFormatException
+
+
+class TestBinary(unittest.TestCase):
+    FILES_PATH = Path(__file__).parent / ".." / "data" / "photometrics"
+
+    def _import(self, path: str):
+        luminaire = import_from_string((self.FILES_PATH / path).read_text())
+        luminaire.metadata.file_source = None
+        return luminaire
+
+    def test_roundtrip(self):
+        for path in ["ies95/metric_units.ies", "ldt/multiple_lamp_sets.ldt", "ldt/symmetry_to_c0c180.ldt"]:
+            with(self.subTest(path=path)):
+                luminaire = self._import(path)
+
+                data = binary.export_photometry(luminaire)
+
+                self.assertTrue(binary.is_binary(data))
+                self.assertEqual(binary.import_from_bytes(data), luminaire)
+
+    def test_intensity_values_are_not_copied(self):
+        data = bytearray(binary.export_photometry(self._import("ldt/no_symmetry.ldt")))
+
+        luminaire = binary.import_from_bytes(data)
+
+        self.assertIsInstance(luminaire.intensity_values.values, memoryview)
+        self.assertIs(luminaire.intensity_values.values.obj, data)
+
+    def test_imported_luminaire_can_be_copied(self):
+        luminaire = binary.import_from_bytes(binary.export_photometry(self._import("ldt/no_symmetry.ldt")))
+
+        self.assertEqual(copy.deepcopy(luminaire), luminaire)
+        self.assertEqual(pickle.loads(pickle.dumps(luminaire)), luminaire)
+
+    def test_import_from_file(self):
+        luminaire = self._import("ldt/no_symmetry.ldt")
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / f"luminaire{binary.FILE_EXTENSION}"
+            path.write_bytes(binary.export_photometry(luminaire))
+
+            self.assertEqual(binary.import_from_file(path), luminaire)
+
+    def test_invalid_content(self):
+        data = binary.export_photometry(self._import("ldt/no_symmetry.ldt"))
+        cases = [
+            ("text", b"IESNA:LM-63-1995"),
+            ("truncated", data[:-8]),
+        ]
+        for name, content in cases:
+            with(self.subTest(name=name)):
+                with self.assertRaises(InvalidPhotometricFileFormatException):
+                    binary.import_from_bytes(content)
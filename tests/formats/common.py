@@ -0,0 +1,87 @@
+import io
+import unittest
+from pathlib import Path
+
+from photometric_viewer.formats import binary
+from photometric_viewer.formats.common import import_from_file, import_from_string, scan_file, scan_from_file, \
+    import_from_bytes, is_imported, editable_source
+from photometric_viewer.model.luminaire import FileFormat
+
+
+class TestImport(unittest.TestCase):
+    FILES_PATH = Path(__file__).parent / ".." / "data" / "photometrics"
+
+    def test_detects_file_format(self):
+        cases = [
+            ("ies95/metric_units.ies", FileFormat.IES),
+            ("ldt/no_symmetry.ldt", FileFormat.LDT),
+        ]
+        for path, expected_format in cases:
+            with(self.subTest(path=path)):
+                source = (self.FILES_PATH / path).read_text()
+                self.assertEqual(import_from_string(source).metadata.file_format, expected_format)
+
+    def test_file_source_is_shared(self):
+        source = (self.FILES_PATH / "ldt" / "no_symmetry.ldt").read_text()
+
+        luminaire = import_from_string(source)
+
+        self.assertIs(luminaire.metadata.file_source, source)
+
+    def test_import_from_file(self):
+        for path in (self.FILES_PATH / "ies95").iterdir():
+            with(self.subTest(path=path)):
+                source = path.read_text()
+                with io.StringIO(source) as f:
+                    from_file = import_from_file(f)
+                self.assertEqual(from_file, import_from_string(source))
+                self.assertEqual(from_file.metadata.file_source, source)
+
+    def test_import_text_from_bytes(self):
+        source = (self.FILES_PATH / "ldt" / "no_symmetry.ldt").read_text()
+
+        luminaire = import_from_bytes(source.encode("utf-8"))
+
+        self.assertFalse(is_imported(luminaire))
+        self.assertEqual(editable_source(luminaire), source)
+
+    def test_binary_file_is_imported(self):
+        original = import_from_string((self.FILES_PATH / "ldt" / "symmetry_to_c0c180.ldt").read_text())
+        contents = binary.export_photometry(original)
+
+        luminaire = import_from_bytes(contents)
+        source = editable_source(luminaire)
+
+        # Binary files are not saved back, their editor content is a complete EULUMDAT file instead of being empty
+        self.assertTrue(is_imported(luminaire))
+        self.assertNotEqual(source, "")
+        self.assertEqual(import_from_string(source).intensity_values, original.intensity_values)
+        self.assertEqual(binary.import_from_bytes(contents), luminaire)
+
+
+class TestScan(unittest.TestCase):
+    FILES_PATH = Path(__file__).parent / ".." / "data" / "photometrics"
+
+    def test_summary_matches_imported_luminaire(self):
+        for path in sorted((self.FILES_PATH / "ies95").iterdir()) + sorted((self.FILES_PATH / "ldt").iterdir()):
+            with(self.subTest(path=path)):
+                summary = scan_file(path)
+                luminaire = import_from_string(path.read_text())
+                luminaire.metadata.file_source = summary.metadata.file_source
+
+                self.assertEqual(summary.metadata, luminaire.metadata)
+                self.assertEqual(summary.lamps, luminaire.lamps)
+                self.assertEqual(summary.number_of_c_planes, len(luminaire.c_planes))
+                self.assertEqual(summary.number_of_gamma_angles, len(luminaire.gamma_angles))
+
+    def test_intensities_are_not_read(self):
+        for path in ["ies95/metric_units.ies", "ldt/no_symmetry.ldt"]:
+            with(self.subTest(path=path)):
+                source = (self.FILES_PATH / path).read_text()
+                with io.StringIO(source) as f:
+                    summary = scan_from_file(f)
+                    remaining_values = f.read().split()
+
+                n_c = summary.number_of_c_planes
+                n_gamma = summary.number_of_gamma_angles
+                self.assertEqual(len(remaining_values), n_c + n_gamma + n_c * n_gamma)
@@ -57,6 +57,10 @@ class TestJson(unittest.TestCase):
             "is_absolute": True,
             "gamma_angles": [0, 45, 90],
             "c_planes": [0, 90, 180, 270],
+            "beam_angles": [
+                {"c": 0, "beam_angle": 67.5, "field_angle": 168.75},
+                {"c": 90, "beam_angle": 67.5, "field_angle": 168.75},
+            ],
             "values": [
                 {'c': 0, 'gamma': 0, 'value': 300},
                 {'c': 0, 'gamma': 45, 'value': 100},
@@ -10,6 +10,7 @@ from photometric_viewer.photometry.ies02.extractor import extract_content as ext
 from photometric_viewer.photometry.ies02.converter import convert_content as convert_content_ies02
 from photometric_viewer.photometry.ldt.converter import convert_content as convert_content_ldt
 from photometric_viewer.photometry.ldt.extractor import extract_content as extract_content_ldt
+from photometric_viewer.utils import calc
 
 UNSUPPORTED_EXPORT_SHAPES = {
     LuminousOpeningShape.ELLIPSE_ALONG_LENGTH,
@@ -77,6 +78,15 @@ class TestIes(unittest.TestCase):
 
                 self.assertEqual(luminaire.lamps[0].description, reimported_luminaire.lamps[0].description)
 
+                direct_ratios = calc.cached_direct_ratios(luminaire)
+                self.assertTrue(direct_ratios.is_calculated)
+                for room_index, ratio in direct_ratios.value.items():
+                    self.assertAlmostEqual(
+                        ratio,
+                        reimported_luminaire.metadata.direct_ratios_for_room_indices[room_index],
+                        places=4
+                    )
+
                 self.assertEqual(luminaire.metadata.luminaire.replace("\n", " ")[0:78], reimported_luminaire.metadata.luminaire)
                 self.assertEqual(luminaire.metadata.catalog_number, reimported_luminaire.metadata.catalog_number)
 
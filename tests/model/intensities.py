@@ -0,0 +1,130 @@
+import copy
+import math
+import unittest
+
+from photometric_viewer.model.intensities import IntensityGrid
+from photometric_viewer.model.luminaire import Luminaire, LuminairePhotometricProperties
+
+
+class TestIntensityGrid(unittest.TestCase):
+    def test_from_mapping_sorts_axes(self):
+        grid = IntensityGrid.from_mapping({
+            (90, 45): 4,
+            (0, 0): 1,
+            (90, 0): 3,
+            (0, 45): 2
+        })
+
+        self.assertEqual(grid.c_angles, (0, 90))
+        self.assertEqual(grid.gamma_angles, (0, 45))
+        self.assertEqual(list(grid.values), [1, 2, 3, 4])
+        self.assertEqual(list(grid.keys()), [(0, 0), (0, 45), (90, 0), (90, 45)])
+
+    def test_mapping_interface(self):
+        values = {(0, 0): 300, (0, 90): 20, (180, 0): 250, (180, 90): 10}
+        grid = IntensityGrid.from_mapping(values)
+
+        self.assertEqual(grid, values)
+        self.assertEqual(len(grid), 4)
+        self.assertEqual(grid[180, 0], 250)
+        self.assertEqual(grid.get((90, 0), 0), 0)
+        self.assertIn((0, 90), grid)
+        self.assertNotIn((0, 45), grid)
+        with self.assertRaises(KeyError):
+            _ = grid[(0, 45)]
+
+    def test_missing_values_are_hidden(self):
+        grid = IntensityGrid.from_mapping({(0, 0): 1, (90, 45): 2})
+
+        self.assertEqual(grid.shape, (2, 2))
+        self.assertEqual(len(grid), 2)
+        self.assertEqual(dict(grid), {(0, 0): 1, (90, 45): 2})
+        self.assertTrue(math.isnan(grid.values[1]))
+        self.assertNotIn((0, 45), grid)
+
+    def test_row(self):
+        grid = IntensityGrid.from_mapping({(0, 0): 1, (0, 45): 2, (90, 0): 3, (90, 45): 4})
+
+        self.assertEqual(list(grid.row(90)), [3, 4])
+        self.assertEqual(list(grid.row(180)), [])
+
+    def test_max(self):
+        self.assertEqual(IntensityGrid.from_mapping({(0, 0): 1, (90, 45): 7}).max(), 7)
+        self.assertIsNone(IntensityGrid().max())
+
+    def test_invalid_number_of_values(self):
+        with self.assertRaises(ValueError):
+            IntensityGrid(c_angles=[0, 90], gamma_angles=[0], values=[1])
+
+    def test_shared_rows(self):
+        grid = IntensityGrid(c_angles=[0, 90, 180, 270], gamma_angles=[0, 90], values=[1, 2, 3, 4], row_sources=[0, 1, 0, 1])
+
+        self.assertTrue(grid.is_compact)
+        self.assertEqual(len(grid.values), 4)
+        self.assertEqual(list(grid.row(180)), [1, 2])
+        self.assertEqual(grid[270, 90], 4)
+        self.assertEqual(len(grid), 8)
+        self.assertEqual(list(grid.dense_values()), [1, 2, 3, 4, 1, 2, 3, 4])
+        self.assertEqual(grid, {
+            (0, 0): 1, (0, 90): 2, (90, 0): 3, (90, 90): 4, (180, 0): 1, (180, 90): 2, (270, 0): 3, (270, 90): 4
+        })
+
+    def test_invalid_row_sources(self):
+        with self.assertRaises(ValueError):
+            IntensityGrid(c_angles=[0, 90], gamma_angles=[0], values=[1], row_sources=[0])
+
+
+class TestLuminaireIntensityValues(unittest.TestCase):
+    def test_default_is_empty_grid(self):
+        luminaire = Luminaire(photometry=LuminairePhotometricProperties())
+
+        self.assertIsInstance(luminaire.intensity_values, IntensityGrid)
+        self.assertEqual(luminaire.intensity_values, {})
+
+    def test_assigned_mapping_is_converted(self):
+        luminaire = Luminaire(photometry=LuminairePhotometricProperties())
+        luminaire.intensity_values = {(0, 0): 100, (0, 90): 50}
+
+        self.assertIsInstance(luminaire.intensity_values, IntensityGrid)
+        self.assertEqual(luminaire.intensity_values, {(0, 0): 100, (0, 90): 50})
+
+    def test_deepcopy(self):
+        luminaire = Luminaire(
+            intensity_values={(0, 0): 100, (0, 90): 50},
+            photometry=LuminairePhotometricProperties()
+        )
+
+        self.assertEqual(copy.deepcopy(luminaire), luminaire)
+
+
+class TestValuesForCAngle(unittest.TestCase):
+    def setUp(self):
+        self.luminaire = Luminaire(
+            gamma_angles=[0, 45, 90],
+            c_planes=[0, 90],
+            intensity_values={
+                (0, 0): 300, (0, 45): 200, (0, 90): 100,
+                (90, 0): 30, (90, 45): 20, (90, 90): 10
+            },
+            photometry=LuminairePhotometricProperties()
+        )
+
+    def test_existing_plane(self):
+        self.assertEqual(self.luminaire.get_values_for_c_angle(90), {0: 30, 45: 20, 90: 10})
+        self.assertEqual(list(self.luminaire.get_values_for_c_angle(0)), [0, 45, 90])
+
+    def test_mirrored_plane(self):
+        self.assertEqual(self.luminaire.get_values_for_c_angle(180), {0: 300, 45: 200, 90: 100})
+        self.assertEqual(self.luminaire.get_values_for_c_angle(270), {0: 30, 45: 20, 90: 10})
+
+    def test_unknown_plane(self):
+        self.assertEqual(self.luminaire.get_values_for_c_angle(45), {})
+
+    def test_index_is_invalidated_on_update(self):
+        self.assertEqual(self.luminaire.get_values_for_c_angle(180), {0: 300, 45: 200, 90: 100})
+
+        self.luminaire.intensity_values = {(0, 0): 1, (180, 0): 2}
+        self.luminaire.c_planes = [0, 180]
+
+        self.assertEqual(self.luminaire.get_values_for_c_angle(180), {0: 2})
+        self.assertEqual(self.luminaire.get_values_for_c_angle(90), {})
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from photometric_viewer.utils.batch import find_photometric_files, BatchSummary, format_summary, \
+    is_up_to_date
+
+
+class TestFindPhotometricFiles(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        for name in ["a.ies", "b.LDT", "notes.txt", "sub/c.ldt", "sub/deeper/d.ies"]:
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_directory(self):
+        items = find_photometric_files([str(self.root)])
+
+        self.assertEqual(
+            sorted(str(item.relative_path) for item in items),
+            ["a.ies", "b.LDT", "sub/c.ldt", "sub/deeper/d.ies"]
+        )
+
+    def test_files_and_globs(self):
+        items = find_photometric_files([
+            str(self.root / "a.ies"),
+            str(self.root / "notes.txt"),
+            str(self.root / "**" / "*.ldt")
+        ])
+
+        self.assertEqual(sorted(str(item.relative_path) for item in items), ["a.ies", "c.ldt"])
+
+    def test_duplicates_are_removed(self):
+        items = find_photometric_files([str(self.root / "a.ies"), str(self.root / "*.ies")])
+
+        self.assertEqual(len(items), 1)
+
+    def test_missing_path(self):
+        self.assertEqual(find_photometric_files([str(self.root / "missing.ies")]), [])
+
+
+class TestIsUpToDate(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source = Path(self.temp_dir.name) / "a.ies"
+        self.target = Path(self.temp_dir.name) / "a.png"
+        self.source.write_text("")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_missing_target(self):
+        self.assertFalse(is_up_to_date(self.source, self.target))
+
+    def test_newer_target(self):
+        self.target.write_text("")
+        os.utime(self.source, (1000, 1000))
+        os.utime(self.target, (2000, 2000))
+        self.assertTrue(is_up_to_date(self.source, self.target))
+
+    def test_outdated_target(self):
+        self.target.write_text("")
+        os.utime(self.source, (2000, 2000))
+        os.utime(self.target, (1000, 1000))
+        self.assertFalse(is_up_to_date(self.source, self.target))
+
+
+class TestBatchSummary(unittest.TestCase):
+    def test_files_per_second(self):
+        self.assertEqual(BatchSummary(processed=10, elapsed_seconds=2).files_per_second, 5)
+        self.assertEqual(BatchSummary(processed=10, elapsed_seconds=0).files_per_second, 0)
+
+    def test_format_summary(self):
+        summary = BatchSummary(processed=8, skipped=1, failures=[(Path("x.ies"), "Error")], elapsed_seconds=2)
+        self.assertEqual(
+            format_summary(summary, "Converted"),
+            "Converted 8 files, 1 skipped, 1 failed in 2.0 s (4.0 files/s)"
+        )
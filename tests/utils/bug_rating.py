@@ -0,0 +1,76 @@
+import unittest
+
+from photometric_viewer.utils.bug_rating import bug_rating, bug_zone_flux
+from photometric_viewer.utils.calc import zonal_flux
+from tests.fixtures.photometry import *
+
+HALF_ASYMMETRIC_SOURCE = copy.deepcopy(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+HALF_ASYMMETRIC_SOURCE.c_planes = [0, 45, 90, 135, 180]
+HALF_ASYMMETRIC_SOURCE.intensity_values = {
+    (c, gamma): 1000 + 10 * c - 5 * gamma
+    for c in HALF_ASYMMETRIC_SOURCE.c_planes
+    for gamma in HALF_ASYMMETRIC_SOURCE.gamma_angles
+}
+
+FULL_ASYMMETRIC_SOURCE = copy.deepcopy(HALF_ASYMMETRIC_SOURCE)
+FULL_ASYMMETRIC_SOURCE.c_planes = [0, 45, 90, 135, 180, 225, 270, 315]
+FULL_ASYMMETRIC_SOURCE.intensity_values = {
+    (c, gamma): 1000 + 10 * min(c, 360 - c) - 5 * gamma
+    for c in FULL_ASYMMETRIC_SOURCE.c_planes
+    for gamma in FULL_ASYMMETRIC_SOURCE.gamma_angles
+}
+
+
+class TestBugZoneFlux(unittest.TestCase):
+    def test_zones_add_up_to_luminous_flux(self):
+        for luminaire in [UNIFORM_RADIATING_SOURCE, FULL_ASYMMETRIC_SOURCE, HALF_ASYMMETRIC_SOURCE]:
+            with(self.subTest(luminaire=luminaire)):
+                self.assertAlmostEqual(sum(bug_zone_flux(luminaire).values()), sum(zonal_flux(luminaire)), places=6)
+
+    def test_front_and_back(self):
+        flux = bug_zone_flux(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+        for zone in ["L", "M", "H", "VH"]:
+            with(self.subTest(zone=zone)):
+                self.assertAlmostEqual(flux["F" + zone], flux["B" + zone])
+
+    def test_symmetric_half(self):
+        half = bug_zone_flux(HALF_ASYMMETRIC_SOURCE)
+        full = bug_zone_flux(FULL_ASYMMETRIC_SOURCE)
+        for zone, value in full.items():
+            with(self.subTest(zone=zone)):
+                self.assertAlmostEqual(half[zone], value, places=6)
+
+    def test_uniform_source(self):
+        flux = bug_zone_flux(UNIFORM_RADIATING_SOURCE)
+        cases = [
+            ("FL", 0, 30),
+            ("BM", 30, 60),
+            ("FH", 60, 80),
+            ("BVH", 80, 90),
+        ]
+        for zone, lower, upper in cases:
+            with(self.subTest(zone=zone)):
+                expected = 1000 * math.pi * (math.cos(math.radians(lower)) - math.cos(math.radians(upper)))
+                self.assertAlmostEqual(flux[zone], expected, delta=expected * 0.1)
+
+
+class TestBugRating(unittest.TestCase):
+    def test_bug_rating(self):
+        rating = bug_rating(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+
+        self.assertEqual((rating.backlight, rating.uplight, rating.glare), (3, 0, 5))
+        self.assertEqual(str(rating), "B3 U0 G5")
+
+    def test_uplight(self):
+        self.assertEqual(bug_rating(UNIFORM_RADIATING_SOURCE).uplight, 5)
+        self.assertEqual(bug_rating(DOWNWARD_RADIATING_SOURCE).uplight, 0)
+
+    def test_without_lamps(self):
+        luminaire = copy.deepcopy(TWO_LAMPS_LUMINAIRE)
+        luminaire.photometry.is_absolute = False
+        luminaire.lamps = []
+        self.assertIsNone(bug_rating(luminaire))
+
+    def test_without_lamp_flux(self):
+        self.assertIsNone(bug_zone_flux(LUMINAIRE_WITHOUT_LAMP_FLUX))
+        self.assertIsNone(bug_rating(LUMINAIRE_WITHOUT_LAMP_FLUX))
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from photometric_viewer.formats.common import import_from_string
+from photometric_viewer.utils import calc
+from photometric_viewer.utils.cache import LuminaireCache, cache_key, ENTRY_SUFFIX
+
+
+class TestLuminaireCache(unittest.TestCase):
+    FILES_PATH = Path(__file__).parent / ".." / "data" / "photometrics"
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+        self.cache = LuminaireCache(self.directory)
+        self.source = (self.FILES_PATH / "ldt" / "no_symmetry.ldt").read_text()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_cache_key(self):
+        self.assertEqual(cache_key(self.source, 1), cache_key(self.source, 1))
+        self.assertNotEqual(cache_key(self.source, 1), cache_key(self.source, 2))
+        self.assertNotEqual(cache_key(self.source, 1), cache_key(self.source + " ", 1))
+
+    def test_missing_entry(self):
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_roundtrip(self):
+        luminaire = import_from_string(self.source)
+        self.cache.put("key", luminaire)
+
+        cached = self.cache.get("key")
+
+        self.assertIsNone(cached.metadata.file_source)
+        cached.metadata.file_source = self.source
+        self.assertEqual(cached, luminaire)
+        self.assertIsNotNone(luminaire.metadata.file_source)
+
+    def test_derived_values_are_kept(self):
+        luminaire = import_from_string(self.source)
+        photometry = calc.cached_photometry(luminaire)
+        self.cache.put("key", luminaire)
+
+        cached = self.cache.get("key")
+
+        self.assertEqual(cached._derived_values["photometry"], (cached.revision, photometry))
+        self.assertNotEqual(cached.revision, luminaire.revision)
+
+    def test_unreadable_entry_is_removed(self):
+        path = self.directory / f"key{ENTRY_SUFFIX}"
+        path.write_bytes(b"not a pickle")
+
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(self.cache.get("key"))
+        self.assertFalse(path.exists())
+
+    def test_unpicklable_entry_is_not_written(self):
+        luminaire = import_from_string(self.source)
+        luminaire.get_derived_value("unpicklable", lambda l: lambda: None)
+
+        with self.assertLogs(level="WARNING"):
+            self.cache.put("key", luminaire)
+
+        self.assertEqual(list(self.directory.iterdir()), [])
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        luminaire = import_from_string(self.source)
+        self.cache.put("first", luminaire)
+        self.cache.put("second", luminaire)
+        entry_size = (self.directory / f"first{ENTRY_SUFFIX}").stat().st_size
+        os.utime(self.directory / f"first{ENTRY_SUFFIX}", (2000, 2000))
+        os.utime(self.directory / f"second{ENTRY_SUFFIX}", (1000, 1000))
+
+        self.cache.max_size_bytes = entry_size * 2
+        self.cache.put("third", luminaire)
+
+        self.assertIsNotNone(self.cache.get("first"))
+        self.assertIsNone(self.cache.get("second"))
+        self.assertIsNotNone(self.cache.get("third"))
+
+    def test_import_uses_cache(self):
+        luminaire = import_from_string(self.source, self.cache)
+        self.assertEqual(len(list(self.directory.glob(f"*{ENTRY_SUFFIX}"))), 1)
+
+        cached = import_from_string(self.source, self.cache)
+
+        self.assertIs(cached.metadata.file_source, self.source)
+        self.assertEqual(cached, luminaire)
+        self.assertIn("photometry", cached._derived_values)
@@ -1,10 +1,23 @@
+import dataclasses
 import unittest
+from pathlib import Path
 
 from photometric_viewer.utils.calc import annual_power_consumption, energy_cost, calculate_photometry, \
-    required_number_of_luminaires, illuminance
+    required_number_of_luminaires, illuminance, cached_photometry, beam_angle, zonal_flux, \
+    coefficients_of_utilization, STANDARD_CU_REFLECTANCES, direct_ratios, STANDARD_ROOM_INDICES, \
+    zonal_lumen_summary, zonal_weights, beam_angles, candela_multiplier, gamma_zone_weights
+from photometric_viewer.formats.common import import_from_string
+from photometric_viewer.model.luminaire import Symmetry
 from tests.fixtures.photometry import *
 
 
+def _relative_file_without_lamp_flux():
+    # Relative photometry with total lumens of the lamps set to 0
+    lines = (Path(__file__).parent / ".." / "data" / "photometrics" / "ldt" / "relative.ldt").read_text().splitlines()
+    lines[28] = "0"
+    return import_from_string("\r\n".join(lines))
+
+
 class TestPowerConsumption(unittest.TestCase):
     def test_power_consumption_with_correct_values(self):
         cases = [
@@ -150,6 +163,14 @@ class TestPhotometricProperties(unittest.TestCase):
         Test uniform radiating light sources
         """
         EXPECTED_FLUX = 1000 * 4 * math.pi
+
+        # Intensities are constant within bands centred on the gamma angles, so steps of 2000 cd
+        # reach halfway to the next measured angle
+        def cone_flux(gamma):
+            return 2000 * 2 * math.pi * (1 - math.cos(math.radians(gamma)))
+
+        def cone_dff(gamma):
+            return math.cos(math.radians(gamma)) / (1 + math.cos(math.radians(gamma)))
         cases = [
             {
                 "title": "Equidistant uniform radiating source",
@@ -159,12 +180,12 @@ class TestPhotometricProperties(unittest.TestCase):
             {
                 "title": "Equidistant downward radiating source",
                 "source": DOWNWARD_RADIATING_SOURCE,
-                "expected": (EXPECTED_FLUX, 1, 1)
+                "expected": (cone_flux(75), 1, 1)
             },
             {
                 "title": "Equidistant upward radiating source",
                 "source": UPWARD_RADIATING_SOURCE,
-                "expected": (EXPECTED_FLUX, 1, 0)
+                "expected": (EXPECTED_FLUX * 2 - cone_flux(75), 1, cone_dff(75))
             },
             {
                 "title": "Non equidistant uniform radiating source",
@@ -174,12 +195,17 @@ class TestPhotometricProperties(unittest.TestCase):
             {
                 "title": "Non equidistant downward radiating source",
                 "source": NON_EQUIDISTANT_DOWNWARD_RADIATING_SOURCE,
-                "expected": (EXPECTED_FLUX, 1, 1)
+                "expected": (cone_flux(85), 1, 1)
             },
             {
                 "title": "Non equidistant upward radiating source",
                 "source": NON_EQUIDISTANT_UPWARD_RADIATING_SOURCE,
-                "expected": (EXPECTED_FLUX, 1, 0)
+                "expected": (EXPECTED_FLUX * 2 - cone_flux(85), 1, cone_dff(85))
+            },
+            {
+                "title": "Source measured only in the lower hemisphere",
+                "source": LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE,
+                "expected": (EXPECTED_FLUX / 2, 1, 1)
             },
             {
                 "title": "LOR 50 equidistant upward radiating source",
@@ -277,4 +303,247 @@ class TestPhotometricProperties(unittest.TestCase):
                 luminaire = copy.deepcopy(UNIFORM_RADIATING_SOURCE)
                 luminaire.photometry = case["source"]
                 properties = calculate_photometry(luminaire)
-                self.assertEqual(properties, case["expected"])
\ No newline at end of file
+                self.assertEqual(properties, case["expected"])
+
+    def test_cached_photometry(self):
+        luminaire = copy.deepcopy(UNIFORM_RADIATING_SOURCE)
+
+        first = cached_photometry(luminaire)
+        self.assertIs(cached_photometry(luminaire), first)
+        self.assertEqual(first, calculate_photometry(luminaire))
+
+        luminaire.intensity_values = DOWNWARD_RADIATING_SOURCE.intensity_values
+        self.assertAlmostEqual(cached_photometry(luminaire).dff.value, 1)
+
+    def test_cached_values_follow_lamps_and_metadata(self):
+        luminaire = copy.deepcopy(LOR_50_UNIFORM_RADIATING_SOURCE)
+        self.assertAlmostEqual(sum(zonal_flux(luminaire)), 1000)
+
+        luminaire.lamps = [dataclasses.replace(luminaire.lamps[0], lumens_per_lamp=None)]
+        self.assertIsNone(zonal_flux(luminaire))
+
+        revision = luminaire.revision
+        luminaire.metadata = dataclasses.replace(luminaire.metadata, symmetry=Symmetry.TO_VERTICAL_AXIS)
+        self.assertNotEqual(luminaire.revision, revision)
+
+
+class TestBeamAngle(unittest.TestCase):
+    def test_beam_angle(self):
+        luminaire = copy.deepcopy(UNIFORM_RADIATING_SOURCE)
+        luminaire.intensity_values = {
+            (c, gamma): max(1000 - gamma * 20, 0)
+            for c in luminaire.c_planes
+            for gamma in luminaire.gamma_angles
+        }
+
+        self.assertAlmostEqual(beam_angle(luminaire), 50)
+        self.assertAlmostEqual(beam_angle(luminaire, ratio=0.1), 105)
+
+    def test_beam_angle_around_peak(self):
+        cases = [
+            {"name": "side-emitting", "intensity": lambda gamma: 1000 - abs(gamma - 90) * 1000 / 90,
+             "beam": 90, "field": 162},
+            {"name": "uplight", "intensity": lambda gamma: max(1000 - (180 - gamma) * 20, 0),
+             "beam": 50, "field": 105},
+        ]
+        for case in cases:
+            with(self.subTest(name=case["name"])):
+                luminaire = copy.deepcopy(UNIFORM_RADIATING_SOURCE)
+                luminaire.intensity_values = {
+                    (c, gamma): case["intensity"](gamma)
+                    for c in luminaire.c_planes
+                    for gamma in luminaire.gamma_angles
+                }
+
+                self.assertAlmostEqual(beam_angle(luminaire), case["beam"])
+                self.assertAlmostEqual(beam_angle(luminaire, ratio=0.1), case["field"])
+
+    def test_no_beam_angle_for_uniform_distribution(self):
+        self.assertIsNone(beam_angle(UNIFORM_RADIATING_SOURCE))
+
+    def test_beam_angles_per_plane(self):
+        luminaire = copy.deepcopy(UNIFORM_RADIATING_SOURCE)
+        luminaire.intensity_values = {
+            (c, gamma): max(1000 - gamma * (20 if c in [0, 180] else 10), 0)
+            for c in luminaire.c_planes
+            for gamma in luminaire.gamma_angles
+        }
+
+        cases = [
+            (0, 50, 105),
+            (90, 100, 180),
+        ]
+        for angles, (c_angle, beam, field) in zip(beam_angles(luminaire), cases):
+            with(self.subTest(c_angle=c_angle)):
+                self.assertEqual(angles.c_angle, c_angle)
+                self.assertAlmostEqual(angles.beam_angle, beam)
+                self.assertEqual(angles.field_angle is None, field is None)
+                if field is not None:
+                    self.assertAlmostEqual(angles.field_angle, field)
+
+        self.assertEqual([a.c_angle for a in beam_angles(luminaire, None)], [0, 90])
+        self.assertAlmostEqual(beam_angle(luminaire, c_angle=90), 100)
+
+
+class TestZonalFlux(unittest.TestCase):
+    def test_zonal_flux(self):
+        cases = [
+            {"luminaire": UNIFORM_RADIATING_SOURCE, "lower": 1000 * 2 * math.pi, "upper": 1000 * 2 * math.pi},
+            {"luminaire": LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE, "lower": 1000 * 2 * math.pi, "upper": 0},
+            # Intensities of gamma 60 reach up to 75 degrees
+            {"luminaire": DOWNWARD_RADIATING_SOURCE, "lower": 2000 * 2 * math.pi * (1 - math.cos(math.radians(75))),
+             "upper": 0},
+        ]
+        for case in cases:
+            with(self.subTest(case=case)):
+                zones = zonal_flux(case["luminaire"])
+                self.assertEqual(len(zones), 18)
+                self.assertAlmostEqual(sum(zones[:9]), case["lower"], places=3)
+                self.assertAlmostEqual(sum(zones[9:]), case["upper"], places=3)
+
+    def test_bands_are_split_at_zone_boundaries(self):
+        def cos(angle):
+            return math.cos(math.radians(angle))
+
+        cases = [
+            {"zone": (0, 10), "expected": (1 - cos(10), 0, 0)},
+            {"zone": (10, 20), "expected": (0, cos(10) - cos(20), 0)},
+            {"zone": (20, 40), "expected": (0, cos(20) - cos(30), cos(30) - cos(40))},
+        ]
+        for case in cases:
+            with(self.subTest(case=case)):
+                lower, upper = case["zone"]
+                weights = gamma_zone_weights((0, 20, 40), upper, lower)
+                for weight, expected in zip(weights, case["expected"]):
+                    self.assertAlmostEqual(weight, expected)
+
+    def test_zonal_flux_matches_luminous_flux(self):
+        luminaire = NON_EQUIDISTANT_UNIFORM_RADIATING_SOURCE
+        self.assertAlmostEqual(sum(zonal_flux(luminaire)), cached_photometry(luminaire).luminous_flux.value)
+
+
+class TestZonalLumenSummary(unittest.TestCase):
+    def test_zones(self):
+        summary = zonal_lumen_summary(UNIFORM_RADIATING_SOURCE)
+        cases = [
+            (0, 30), (0, 40), (0, 60), (0, 90), (90, 180), (0, 180),
+        ]
+        self.assertEqual([(z.lower, z.upper) for z in summary.zones], cases)
+        self.assertEqual(len(summary.bands), 18)
+
+        total = 1000 * 4 * math.pi
+        for zone in summary.zones:
+            with(self.subTest(zone=(zone.lower, zone.upper))):
+                self.assertAlmostEqual(zone.luminaire_fraction, zone.lumens / total)
+                self.assertIsNone(zone.lamp_fraction)
+        self.assertAlmostEqual(summary.zones[3].luminaire_fraction, 0.5)
+        self.assertAlmostEqual(summary.zones[5].lumens, total)
+
+    def test_lamp_fraction(self):
+        luminaire = copy.deepcopy(UNIFORM_RADIATING_SOURCE)
+        luminaire.photometry.is_absolute = False
+        summary = zonal_lumen_summary(luminaire)
+
+        lamp_flux = luminaire.lamps[0].lumens_per_lamp * luminaire.lamps[0].number_of_lamps
+        for zone in summary.zones + summary.bands:
+            with(self.subTest(zone=(zone.lower, zone.upper))):
+                self.assertAlmostEqual(zone.lamp_fraction, zone.lumens / lamp_flux)
+
+    def test_without_lamp_flux(self):
+        self.assertIsNone(zonal_lumen_summary(LUMINAIRE_WITHOUT_LAMP_FLUX))
+        self.assertIsNone(zonal_lumen_summary(_relative_file_without_lamp_flux()))
+
+    def test_weights_shared_by_grids(self):
+        first = copy.deepcopy(UNIFORM_RADIATING_SOURCE)
+        second = copy.deepcopy(DOWNWARD_RADIATING_SOURCE)
+        second.gamma_angles = first.gamma_angles
+        second.intensity_values = {(c, gamma): 2000 - 10 * gamma for c in first.c_planes for gamma in first.gamma_angles}
+
+        zonal_lumen_summary(first)
+        hits = zonal_weights.cache_info().hits
+        zonal_lumen_summary(second)
+        self.assertEqual(zonal_weights.cache_info().hits, hits + 1)
+
+
+class TestCoefficientsOfUtilization(unittest.TestCase):
+    def test_table_shape(self):
+        table = coefficients_of_utilization(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+
+        self.assertEqual(table.room_cavity_ratios, list(range(11)))
+        self.assertEqual(len(table.reflectances), 18)
+        self.assertTrue(all(len(row) == len(STANDARD_CU_REFLECTANCES) for row in table.values))
+
+    def test_zero_room_cavity_ratio(self):
+        table = coefficients_of_utilization(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+        for reflectances, value in zip(table.reflectances, table.values[0]):
+            with(self.subTest(reflectances=reflectances)):
+                self.assertAlmostEqual(value, 1 / (1 - reflectances.ceiling * reflectances.floor))
+
+    def test_black_room(self):
+        table = coefficients_of_utilization(UNIFORM_RADIATING_SOURCE, reflectances=((0, 0),), floor_reflectance=0)
+        self.assertAlmostEqual(table.values[0][0], 0.5)
+        for i in range(1, len(table.room_cavity_ratios)):
+            self.assertLess(table.values[i][0], table.values[i - 1][0])
+
+    def test_relative_photometry(self):
+        luminaire = copy.deepcopy(TWO_LAMPS_LUMINAIRE)
+        luminaire.photometry.is_absolute = False
+        table = coefficients_of_utilization(luminaire)
+        lamp_flux = luminaire.lamps[0].lumens_per_lamp * luminaire.lamps[0].number_of_lamps
+
+        self.assertAlmostEqual(table.values[0][-1], sum(zonal_flux(luminaire)[:9]) / lamp_flux)
+
+    def test_without_lamps(self):
+        luminaire = copy.deepcopy(TWO_LAMPS_LUMINAIRE)
+        luminaire.photometry.is_absolute = False
+        luminaire.lamps = []
+        self.assertIsNone(coefficients_of_utilization(luminaire))
+
+    def test_without_lamp_flux(self):
+        for luminaire in [LUMINAIRE_WITHOUT_LAMP_FLUX, _relative_file_without_lamp_flux()]:
+            with(self.subTest(luminaire=luminaire.metadata.filename)):
+                self.assertIsNone(candela_multiplier(luminaire))
+                self.assertIsNone(zonal_flux(luminaire))
+                self.assertIsNone(coefficients_of_utilization(luminaire))
+                self.assertIsNotNone(direct_ratios(luminaire).value)
+
+
+class TestDirectRatios(unittest.TestCase):
+    def test_direct_ratios_from_file(self):
+        luminaire = copy.deepcopy(MINIMAL_LUMINAIRE)
+        luminaire.metadata.direct_ratios_for_room_indices = {0.6: 0.5, 5.0: 0.9}
+        ratios = direct_ratios(luminaire)
+
+        self.assertFalse(ratios.is_calculated)
+        self.assertEqual(ratios.value, {0.6: 0.5, 5.0: 0.9})
+
+    def test_calculated_direct_ratios(self):
+        ratios = direct_ratios(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+
+        self.assertTrue(ratios.is_calculated)
+        self.assertEqual(list(ratios.value.keys()), list(STANDARD_ROOM_INDICES))
+        values = list(ratios.value.values())
+        self.assertTrue(all(0 < value <= 1 for value in values))
+        self.assertEqual(values, sorted(values))
+
+    def test_direct_ratios_do_not_depend_on_upward_flux(self):
+        expected = direct_ratios(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE).value
+        for room_index, ratio in direct_ratios(UNIFORM_RADIATING_SOURCE).value.items():
+            with(self.subTest(room_index=room_index)):
+                self.assertAlmostEqual(ratio, expected[room_index])
+
+    def test_without_lamp_flux(self):
+        ratios = direct_ratios(LUMINAIRE_WITHOUT_LAMP_FLUX)
+
+        self.assertTrue(ratios.is_calculated)
+        self.assertEqual(ratios.value, direct_ratios(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE).value)
+
+    def test_without_downward_flux(self):
+        luminaire = copy.deepcopy(UPWARD_RADIATING_SOURCE)
+        luminaire.intensity_values = {
+            (c, gamma): (2000 if gamma > 90 else 0)
+            for c in luminaire.c_planes
+            for gamma in luminaire.gamma_angles
+        }
+        ratios = direct_ratios(luminaire)
+        self.assertIsNone(ratios.value)
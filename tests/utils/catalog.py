@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from photometric_viewer.utils.catalog import Catalog, CatalogQuery, index_file
+
+
+class TestCatalog(unittest.TestCase):
+    FILES_PATH = Path(__file__).parent / ".." / "data" / "photometrics"
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name) / "files"
+        shutil.copytree(self.FILES_PATH / "ldt", self.root / "ldt")
+        shutil.copy(self.FILES_PATH / "ies95" / "absolute_photometry.ies", self.root)
+        self.catalog = Catalog(Path(self.temp_dir.name) / "catalog.sqlite")
+
+    def tearDown(self):
+        self.catalog.close()
+        self.temp_dir.cleanup()
+
+    def test_refresh_is_incremental(self):
+        first = self.catalog.refresh([self.root], jobs=2)
+        self.assertEqual(first.indexed, 16)
+        self.assertEqual(len(self.catalog), 16)
+
+        changed = self.root / "absolute_photometry.ies"
+        os.utime(changed, (changed.stat().st_atime, changed.stat().st_mtime + 10))
+        (self.root / "ldt" / "relative.ldt").unlink()
+
+        second = self.catalog.refresh([self.root], jobs=2)
+        self.assertEqual((second.indexed, second.unchanged, second.removed), (1, 14, 1))
+        self.assertEqual(len(self.catalog), 15)
+
+    def test_unreadable_file(self):
+        entry = index_file(str(self.root / "missing.ldt"), 1, 2)
+
+        self.assertIsNotNone(entry.error)
+        self.assertIsNone(entry.luminous_flux)
+
+    def test_search(self):
+        self.catalog.refresh([self.root], jobs=2)
+
+        cases = [
+            ("all", CatalogQuery(), 16),
+            ("text", CatalogQuery(text="ies"), 1),
+            ("file format", CatalogQuery(file_format="LDT"), 15),
+            ("efficacy", CatalogQuery(min_efficacy=60), 6),
+            ("efficacy and file format", CatalogQuery(min_efficacy=60, file_format="IES"), 1),
+            ("color temperature", CatalogQuery(min_color_temperature=3000, max_color_temperature=3000), 15),
+            ("limit", CatalogQuery(limit=3), 3),
+            ("no match", CatalogQuery(min_luminous_flux=1e9), 0),
+        ]
+        for name, query, expected_count in cases:
+            with(self.subTest(name=name)):
+                self.assertEqual(len(self.catalog.search(query)), expected_count)
+
+    def test_index_file(self):
+        path = self.root / "absolute_photometry.ies"
+        entry = index_file(str(path), 1, 2)
+
+        self.assertEqual(entry.file_format, "IES")
+        self.assertEqual(entry.manufacturer, "ACME Inc.")
+        self.assertAlmostEqual(entry.efficacy, entry.luminous_flux / entry.wattage)
+        self.assertIsNotNone(entry.beam_angle)
+        self.assertIsNone(entry.error)
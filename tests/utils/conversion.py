@@ -0,0 +1,44 @@
+import unittest
+
+from photometric_viewer.utils.conversion import color_temperature, color_rendering_index, compact_number
+
+
+class TestColorTemperature(unittest.TestCase):
+    def test_color_temperature(self):
+        cases = [
+            ("4000", 4000),
+            ("3000 K", 3000),
+            ("10000K", 10000),
+            ("840", 4000),
+            ("Warm white", None),
+            ("", None),
+            (None, None),
+        ]
+        for color, expected in cases:
+            with(self.subTest(color=color)):
+                self.assertEqual(color_temperature(color), expected)
+
+    def test_color_rendering_index(self):
+        cases = [
+            ("92", "3000K", 92),
+            (None, "840", 80),
+            ("1B", "Warm white", None),
+            (None, None, None),
+        ]
+        for cri, color, expected in cases:
+            with(self.subTest(cri=cri, color=color)):
+                self.assertEqual(color_rendering_index(cri, color), expected)
+
+
+class TestCompactNumber(unittest.TestCase):
+    def test_compact_number(self):
+        cases = [
+            (150.0, "150"),
+            (0.0, "0"),
+            (10.8, "10.8"),
+            (12345678.0, "12345678"),
+            (float("nan"), "nan"),
+        ]
+        for value, expected in cases:
+            with(self.subTest(value=value)):
+                self.assertEqual(str(compact_number(value)), expected)
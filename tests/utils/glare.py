@@ -0,0 +1,76 @@
+import unittest
+
+from photometric_viewer.utils.glare import ugr_table, position_index, projected_area, STANDARD_UGR_ROOMS, \
+    STANDARD_UGR_REFLECTANCES
+from tests.fixtures.photometry import *
+
+DOUBLE_FLUX_SOURCE = copy.deepcopy(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+DOUBLE_FLUX_SOURCE.intensity_values = {
+    key: value * 2
+    for key, value in LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE.intensity_values.items()
+}
+
+
+class TestPositionIndex(unittest.TestCase):
+    def test_source_on_line_of_sight(self):
+        self.assertAlmostEqual(position_index(0, 1e9, 1), 1)
+
+    def test_position_index_grows_with_angle(self):
+        indices = [position_index(0, forward, 1) for forward in [8, 4, 2, 1, 0.5]]
+        self.assertEqual(indices, sorted(indices))
+
+
+class TestProjectedArea(unittest.TestCase):
+    def test_projected_area(self):
+        rectangle = (2, 1, False, (0.1, 0.2, 0.3, 0.4))
+        cases = [
+            {"area": rectangle, "c": 0, "gamma": 0, "expected": 2},
+            {"area": rectangle, "c": 0, "gamma": 90, "expected": 0.1},
+            {"area": rectangle, "c": 90, "gamma": 90, "expected": 0.4},
+            {"area": rectangle, "c": 180, "gamma": 90, "expected": 0.3},
+            {"area": rectangle, "c": 270, "gamma": 90, "expected": 0.8},
+            {"area": rectangle, "c": 0, "gamma": 60, "expected": 2 * 0.5 + 0.1 * math.sqrt(3) / 2},
+            {"area": (1, 1, True, (0.5, 0.5, 0.5, 0.5)), "c": 45, "gamma": 0, "expected": math.pi / 4},
+            {"area": (1, 1, True, (0.5, 0.5, 0.5, 0.5)), "c": 45, "gamma": 90, "expected": 0.5},
+        ]
+        for case in cases:
+            with(self.subTest(case=case)):
+                self.assertAlmostEqual(projected_area(case["area"], case["c"], case["gamma"]), case["expected"])
+
+
+class TestUgrTable(unittest.TestCase):
+    def test_table_shape(self):
+        table = ugr_table(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+
+        self.assertEqual(len(table.rooms), len(STANDARD_UGR_ROOMS))
+        self.assertEqual(len(table.reflectances), len(STANDARD_UGR_REFLECTANCES))
+        for rows in [table.crosswise, table.endwise]:
+            self.assertTrue(all(len(row) == len(STANDARD_UGR_REFLECTANCES) for row in rows))
+
+    def test_rotationally_symmetric_luminaire(self):
+        table = ugr_table(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+        for crosswise, endwise in zip(table.crosswise, table.endwise):
+            for a, b in zip(crosswise, endwise):
+                self.assertAlmostEqual(a, b)
+
+    def test_darker_rooms_have_more_glare(self):
+        table = ugr_table(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+        for row in table.crosswise:
+            self.assertLess(row[0], row[1])
+            self.assertLess(row[3], row[4])
+
+    def test_flux_scaling(self):
+        table = ugr_table(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+        double_flux_table = ugr_table(DOUBLE_FLUX_SOURCE)
+        for row, double_flux_row in zip(table.crosswise, double_flux_table.crosswise):
+            for value, double_flux_value in zip(row, double_flux_row):
+                self.assertAlmostEqual(double_flux_value - value, 8 * math.log10(2))
+
+    def test_without_geometry(self):
+        luminaire = copy.deepcopy(LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE)
+        luminaire.geometry = None
+        luminaire.luminous_opening_geometry = None
+        self.assertIsNone(ugr_table(luminaire))
+
+    def test_without_lamp_flux(self):
+        self.assertIsNone(ugr_table(LUMINAIRE_WITHOUT_LAMP_FLUX))
@@ -0,0 +1,126 @@
+import unittest
+
+from photometric_viewer.utils.illuminance import calculate_illuminance, grid_layout, layout_for_count, \
+    IlluminanceGrid
+from photometric_viewer.model.luminaire import Symmetry
+from tests.fixtures.photometry import *
+
+
+class TestCalculateIlluminance(unittest.TestCase):
+    def test_illuminance_below_luminaire(self):
+        cases = [
+            {"luminaire": ABSOLUTE_PHOTOMETRY_LUMINAIRE, "height": 2, "mf": 1, "expected": 300 / 4},
+            {"luminaire": ABSOLUTE_PHOTOMETRY_LUMINAIRE, "height": 3, "mf": 0.8, "expected": 300 * 0.8 / 9},
+            {"luminaire": LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE, "height": 2, "mf": 1,
+             "expected": 1000 / 4},
+        ]
+        for case in cases:
+            with(self.subTest(case=case)):
+                grid = calculate_illuminance(
+                    luminaire=case["luminaire"],
+                    positions=[(1, 1)],
+                    mounting_height=case["height"],
+                    width=2,
+                    length=2,
+                    points_x=1,
+                    points_y=1,
+                    mf=case["mf"]
+                )
+                self.assertAlmostEqual(grid.values[0][0], case["expected"])
+
+    def test_cosine_law(self):
+        grid = calculate_illuminance(
+            luminaire=LOWER_HEMISPHERE_UNIFORM_RADIATING_SOURCE,
+            positions=[(0, 0)],
+            mounting_height=2,
+            width=8,
+            length=2,
+            points_x=4,
+            points_y=1
+        )
+        for x, value in zip(grid.xs, grid.values[0]):
+            with(self.subTest(x=x)):
+                distance = math.hypot(x, 1, 2)
+                self.assertAlmostEqual(value, 1000 * 2 / distance ** 3)
+
+    def test_layout_symmetry(self):
+        grid = calculate_illuminance(
+            luminaire=ABSOLUTE_PHOTOMETRY_LUMINAIRE,
+            positions=grid_layout(6, 4, 3, 2),
+            mounting_height=2.5,
+            width=6,
+            length=4,
+            points_x=12,
+            points_y=8
+        )
+        for row, mirrored_row in zip(grid.values, reversed(grid.values)):
+            for value, mirrored_value in zip(row, reversed(mirrored_row)):
+                self.assertAlmostEqual(value, mirrored_value)
+
+    def test_symmetric_luminaire(self):
+        luminaire = copy.deepcopy(ABSOLUTE_PHOTOMETRY_LUMINAIRE)
+        luminaire.intensity_values = {
+            (c, gamma): value * (1 + c / 180 if c <= 180 else 3 - c / 180)
+            for (c, gamma), value in ABSOLUTE_PHOTOMETRY_LUMINAIRE.intensity_values.items()
+        }
+        symmetric_luminaire = copy.deepcopy(luminaire)
+        symmetric_luminaire.metadata.symmetry = Symmetry.TO_C0_C180
+        symmetric_luminaire.c_planes = [0, 90, 180]
+        symmetric_luminaire.intensity_values = {
+            (c, gamma): value for (c, gamma), value in luminaire.intensity_values.items() if c <= 180
+        }
+
+        grids = [
+            calculate_illuminance(
+                luminaire=l,
+                positions=[(2, 1.5), (1, 0.5)],
+                mounting_height=2,
+                width=4,
+                length=3,
+                points_x=8,
+                points_y=6
+            )
+            for l in [luminaire, symmetric_luminaire]
+        ]
+
+        for row, symmetric_row in zip(grids[0].values, grids[1].values):
+            for value, symmetric_value in zip(row, symmetric_row):
+                self.assertAlmostEqual(value, symmetric_value)
+
+    def test_without_lamp_flux(self):
+        with self.assertRaises(ValueError):
+            calculate_illuminance(LUMINAIRE_WITHOUT_LAMP_FLUX, [(0, 0)], 2, 1, 1)
+
+    def test_invalid_mounting_height(self):
+        with self.assertRaises(ValueError):
+            calculate_illuminance(ABSOLUTE_PHOTOMETRY_LUMINAIRE, [(0, 0)], 0, 1, 1)
+
+
+class TestIlluminanceGrid(unittest.TestCase):
+    def test_statistics(self):
+        grid = IlluminanceGrid(xs=[0, 1], ys=[0, 1], values=[[100, 200], [300, 400]])
+
+        self.assertEqual(grid.e_min, 100)
+        self.assertEqual(grid.e_max, 400)
+        self.assertEqual(grid.e_avg, 250)
+        self.assertEqual(grid.uniformity, 0.4)
+
+    def test_uniformity_without_light(self):
+        grid = IlluminanceGrid(xs=[0], ys=[0], values=[[0]])
+        self.assertIsNone(grid.uniformity)
+
+
+class TestLayout(unittest.TestCase):
+    def test_grid_layout(self):
+        self.assertEqual(grid_layout(4, 2, 2, 1), [(1, 1), (3, 1)])
+
+    def test_layout_for_count(self):
+        cases = [
+            {"width": 1, "length": 1, "count": 4, "expected": (2, 2)},
+            {"width": 4, "length": 1, "count": 4, "expected": (4, 1)},
+            {"width": 1, "length": 1, "count": 5, "expected": (2, 3)},
+            {"width": 1, "length": 1, "count": 0, "expected": (0, 0)},
+        ]
+        for case in cases:
+            with(self.subTest(case=case)):
+                self.assertEqual(layout_for_count(case["width"], case["length"], case["count"]), case["expected"])
@@ -0,0 +1,132 @@
+import unittest
+
+from photometric_viewer.model.luminaire import Symmetry
+from photometric_viewer.utils.interpolation import IntensityInterpolator, interpolator, InterpolationMethod, _Axis
+from tests.fixtures.photometry import *
+
+ASYMMETRIC_LUMINAIRE = copy.deepcopy(ABSOLUTE_PHOTOMETRY_LUMINAIRE)
+ASYMMETRIC_LUMINAIRE.intensity_values = {
+    (c, gamma): (c + 100) * (90 - gamma) / 90
+    for c in ASYMMETRIC_LUMINAIRE.c_planes
+    for gamma in ASYMMETRIC_LUMINAIRE.gamma_angles
+}
+
+HALF_LUMINAIRE = copy.deepcopy(ABSOLUTE_PHOTOMETRY_LUMINAIRE)
+HALF_LUMINAIRE.c_planes = [0, 90, 180]
+HALF_LUMINAIRE.intensity_values = {
+    (c, gamma): (c + 100) * (90 - gamma) / 90
+    for c in HALF_LUMINAIRE.c_planes
+    for gamma in HALF_LUMINAIRE.gamma_angles
+}
+
+QUADRANT_LUMINAIRE = copy.deepcopy(ABSOLUTE_PHOTOMETRY_LUMINAIRE)
+QUADRANT_LUMINAIRE.c_planes = [0, 45, 90]
+QUADRANT_LUMINAIRE.intensity_values = {
+    (c, gamma): (c + 100) * (90 - gamma) / 90
+    for c in QUADRANT_LUMINAIRE.c_planes
+    for gamma in QUADRANT_LUMINAIRE.gamma_angles
+}
+
+BILATERAL_LUMINAIRE = copy.deepcopy(ABSOLUTE_PHOTOMETRY_LUMINAIRE)
+BILATERAL_LUMINAIRE.c_planes = [90, 180, 270]
+BILATERAL_LUMINAIRE.intensity_values = {
+    (c, gamma): c * (90 - gamma) / 90
+    for c in BILATERAL_LUMINAIRE.c_planes
+    for gamma in BILATERAL_LUMINAIRE.gamma_angles
+}
+
+
+class TestIntensityInterpolator(unittest.TestCase):
+    def test_measured_values(self):
+        interpolate = IntensityInterpolator(ASYMMETRIC_LUMINAIRE.intensity_values)
+        for (c, gamma), value in ASYMMETRIC_LUMINAIRE.intensity_values.items():
+            with(self.subTest(c=c, gamma=gamma)):
+                self.assertAlmostEqual(interpolate(c, gamma), value)
+
+    def test_interpolated_values(self):
+        interpolate = IntensityInterpolator(ASYMMETRIC_LUMINAIRE.intensity_values)
+        cases = [
+            {"c": 45, "gamma": 0, "expected": 145},
+            {"c": 0, "gamma": 22.5, "expected": 75},
+            {"c": 45, "gamma": 45, "expected": 72.5},
+            {"c": 315, "gamma": 0, "expected": 235},
+            {"c": -45, "gamma": 0, "expected": 235},
+            {"c": 0, "gamma": 100, "expected": 0},
+        ]
+        for case in cases:
+            with(self.subTest(case=case)):
+                self.assertAlmostEqual(interpolate(case["c"], case["gamma"]), case["expected"])
+
+    def test_symmetric_half(self):
+        interpolate = IntensityInterpolator(HALF_LUMINAIRE.intensity_values)
+        for c in [0, 45, 90, 135, 180]:
+            with(self.subTest(c=c)):
+                self.assertAlmostEqual(interpolate(360 - c, 30), interpolate(c, 30))
+
+    def test_interpolator_is_cached(self):
+        luminaire = copy.deepcopy(ABSOLUTE_PHOTOMETRY_LUMINAIRE)
+        self.assertIs(interpolator(luminaire), interpolator(luminaire))
+
+    def test_symmetries(self):
+        cases = [
+            {"luminaire": HALF_LUMINAIRE, "symmetry": Symmetry.NONE, "c": 300, "same_as": 60},
+            {"luminaire": HALF_LUMINAIRE, "symmetry": Symmetry.TO_C0_C180, "c": 200, "same_as": 160},
+            {"luminaire": QUADRANT_LUMINAIRE, "symmetry": Symmetry.NONE, "c": 135, "same_as": 45},
+            {"luminaire": QUADRANT_LUMINAIRE, "symmetry": Symmetry.NONE, "c": 190, "same_as": 10},
+            {"luminaire": QUADRANT_LUMINAIRE, "symmetry": Symmetry.NONE, "c": 350, "same_as": 10},
+            {"luminaire": BILATERAL_LUMINAIRE, "symmetry": Symmetry.NONE, "c": 30, "same_as": 150},
+            {"luminaire": BILATERAL_LUMINAIRE, "symmetry": Symmetry.NONE, "c": 300, "same_as": 240},
+        ]
+        for case in cases:
+            with(self.subTest(case=case)):
+                interpolate = IntensityInterpolator(case["luminaire"].intensity_values, case["symmetry"])
+                self.assertAlmostEqual(interpolate(case["c"], 30), interpolate(case["same_as"], 30))
+
+    def test_bicubic(self):
+        interpolate = IntensityInterpolator(
+            ASYMMETRIC_LUMINAIRE.intensity_values,
+            method=InterpolationMethod.BICUBIC
+        )
+        for (c, gamma), value in ASYMMETRIC_LUMINAIRE.intensity_values.items():
+            with(self.subTest(c=c, gamma=gamma)):
+                self.assertAlmostEqual(interpolate(c, gamma), value)
+
+        # Linear distributions are reproduced by the spline away from the ends of the axes
+        self.assertAlmostEqual(interpolate(135, 45), 235 * 0.5)
+
+    def test_batch_evaluation(self):
+        c_angles = [0, 10, 95, 180, 333]
+        gamma_angles = [0, 7.5, 45, 80, 120]
+        for method in InterpolationMethod:
+            with(self.subTest(method=method)):
+                interpolate = IntensityInterpolator(ASYMMETRIC_LUMINAIRE.intensity_values, method=method)
+                grid = interpolate.evaluate_grid(c_angles, gamma_angles)
+                directions = [(c, gamma) for c in c_angles for gamma in gamma_angles]
+
+                self.assertEqual(
+                    [value for row in grid for value in row],
+                    list(interpolate.evaluate(directions))
+                )
+                self.assertEqual(list(interpolate.evaluate(directions)), [interpolate(*d) for d in directions])
+
+
+class TestAxis(unittest.TestCase):
+    def test_bracket(self):
+        for values in [(0, 10, 20, 30), (0, 5, 20, 30)]:
+            axis = _Axis(values)
+            cases = [
+                {"value": -5, "expected": (0, 0)},
+                {"value": 0, "expected": (0, 0)},
+                {"value": 25, "expected": (2, 0.5)},
+                {"value": 20, "expected": (2, 0)},
+                {"value": 30, "expected": (3, 0)},
+                {"value": 40, "expected": (3, 0)},
+            ]
+            for case in cases:
+                with(self.subTest(values=values, case=case)):
+                    self.assertEqual(axis.bracket(case["value"]), case["expected"])
+
+    def test_equidistant_axis(self):
+        self.assertEqual(_Axis((0, 2.5, 5, 7.5)).step, 2.5)
+        self.assertIsNone(_Axis((0, 5, 20, 30)).step)
+        self.assertIsNone(_Axis((0,)).step)
@@ -1,7 +1,7 @@
 import io as python_io
 import unittest
 
-from photometric_viewer.utils.ioutil import first_non_empty_line
+from photometric_viewer.utils.ioutil import first_non_empty_line, read_floats_till_end
 
 WINDOWS_NEWLINE = "\r\n"
 UNIX_NEWLINE = "\n"
@@ -61,4 +61,31 @@ class TestReadNonEmptyLine(unittest.TestCase):
             with(self.subTest(case=case[0])):
                 f = python_io.StringIO(case[1])
                 for expected_line in lines_expected:
-                    self.assertEqual(first_non_empty_line(f), expected_line)
\ No newline at end of file
+                    self.assertEqual(first_non_empty_line(f), expected_line)
+
+
+class TestReadFloatsTillEnd(unittest.TestCase):
+    def test_separators(self):
+        cases = [
+            ("Spaces", "1 2.5 3\n4 5"),
+            ("Windows encoding", "1 2.5 3\r\n4 5"),
+            ("Blank lines", "\n1 2.5\n\n\n3 4\n5\n\n"),
+            ("Multiple spaces", "  1    2.5 3 \n 4  5  "),
+            ("Tabs", "1\t2.5\t3\n\t4\t5"),
+        ]
+        for case in cases:
+            with(self.subTest(case=case[0])):
+                f = python_io.StringIO(case[1])
+                self.assertEqual(read_floats_till_end(f), [1, 2.5, 3, 4, 5])
+
+    def test_malformed_values(self):
+        f = python_io.StringIO("1 x 3\n- 5")
+        self.assertEqual(read_floats_till_end(f), [1, None, 3, None, 5])
+
+    def test_reads_from_current_position(self):
+        f = python_io.StringIO("header\n1 2\n3")
+        f.readline()
+        self.assertEqual(read_floats_till_end(f), [1, 2, 3])
+
+    def test_empty(self):
+        self.assertEqual(read_floats_till_end(python_io.StringIO("\n\n")), [])
@@ -0,0 +1,90 @@
+import unittest
+
+from photometric_viewer.model.luminaire import Symmetry
+from photometric_viewer.utils.calc import zonal_flux, relative_zonal_flux
+from photometric_viewer.utils.resampling import angle_steps, resample, resample_to_steps, decimated, \
+    MAX_PLOTTED_GAMMA_ANGLES, CATALOG_GRID
+from tests.fixtures.photometry import *
+
+QUADRANT_SOURCE = copy.deepcopy(ABSOLUTE_PHOTOMETRY_LUMINAIRE)
+QUADRANT_SOURCE.c_planes = [0, 45, 90]
+QUADRANT_SOURCE.intensity_values = {
+    (c, gamma): (c + 100) * (90 - gamma) / 90
+    for c in QUADRANT_SOURCE.c_planes
+    for gamma in QUADRANT_SOURCE.gamma_angles
+}
+
+DENSE_SOURCE = copy.deepcopy(ABSOLUTE_PHOTOMETRY_LUMINAIRE)
+DENSE_SOURCE.gamma_angles = angle_steps(0, 90, 0.1)
+DENSE_SOURCE.intensity_values = {
+    (c, gamma): 1000 * math.cos(math.radians(gamma))
+    for c in DENSE_SOURCE.c_planes
+    for gamma in DENSE_SOURCE.gamma_angles
+}
+
+
+class TestAngleSteps(unittest.TestCase):
+    def test_angle_steps(self):
+        cases = [
+            (0, 90, 30, [0, 30, 60, 90]),
+            (0, 100, 30, [0, 30, 60, 90]),
+            (0, 1, 0.1, [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1]),
+        ]
+        for start, stop, step, expected in cases:
+            with(self.subTest(step=step)):
+                self.assertEqual(angle_steps(start, stop, step), expected)
+
+    def test_invalid_step(self):
+        with self.assertRaises(ValueError):
+            angle_steps(0, 90, 0)
+
+
+class TestResample(unittest.TestCase):
+    def test_measured_angles_are_kept(self):
+        luminaire = resample(QUADRANT_SOURCE, [0, 45, 90], [0, 45, 90])
+        for key, value in QUADRANT_SOURCE.intensity_values.items():
+            with(self.subTest(key=key)):
+                self.assertAlmostEqual(luminaire.intensity_values[key], value)
+
+    def test_symmetry_is_applied(self):
+        luminaire = resample_to_steps(QUADRANT_SOURCE, (45, 45))
+
+        self.assertEqual(luminaire.c_planes, [0, 45, 90, 135, 180, 225, 270, 315])
+        self.assertAlmostEqual(luminaire.intensity_values[135, 0], QUADRANT_SOURCE.intensity_values[45, 0])
+        self.assertAlmostEqual(luminaire.intensity_values[315, 45], QUADRANT_SOURCE.intensity_values[45, 45])
+        self.assertEqual(luminaire.metadata.symmetry, Symmetry.TO_C0_C180_C90_C270)
+        self.assertTrue(luminaire.intensity_values.is_compact)
+
+    def test_original_is_unchanged(self):
+        luminaire = copy.deepcopy(QUADRANT_SOURCE)
+        resample_to_steps(luminaire, CATALOG_GRID)
+
+        self.assertEqual(luminaire, QUADRANT_SOURCE)
+
+    def test_preserve_flux(self):
+        expected = sum(zonal_flux(DENSE_SOURCE))
+        luminaire = resample_to_steps(DENSE_SOURCE, CATALOG_GRID, preserve_flux=True)
+
+        self.assertEqual(len(luminaire.gamma_angles), 19)
+        self.assertAlmostEqual(sum(zonal_flux(luminaire)), expected)
+        self.assertNotAlmostEqual(sum(zonal_flux(resample_to_steps(DENSE_SOURCE, CATALOG_GRID))), expected)
+
+    def test_preserve_flux_without_lamp_flux(self):
+        luminaire = resample_to_steps(LUMINAIRE_WITHOUT_LAMP_FLUX, (90, 10), preserve_flux=True)
+
+        self.assertAlmostEqual(
+            sum(relative_zonal_flux(luminaire)),
+            sum(relative_zonal_flux(LUMINAIRE_WITHOUT_LAMP_FLUX))
+        )
+
+
+class TestDecimated(unittest.TestCase):
+    def test_dense_grid_is_decimated(self):
+        luminaire = decimated(DENSE_SOURCE)
+
+        self.assertEqual(len(luminaire.gamma_angles), MAX_PLOTTED_GAMMA_ANGLES)
+        self.assertEqual(luminaire.gamma_angles[-1], 90)
+        self.assertAlmostEqual(luminaire.get_values_for_c_angle(180)[45], 1000 * math.cos(math.radians(45)))
+
+    def test_coarse_grid_is_kept(self):
+        self.assertIs(decimated(QUADRANT_SOURCE), QUADRANT_SOURCE)
@@ -0,0 +1,115 @@
+import io
+import unittest
+from pathlib import Path
+
+from photometric_viewer.formats import ldt
+from photometric_viewer.formats.common import import_from_string
+from photometric_viewer.model.intensities import IntensityGrid
+from photometric_viewer.model.luminaire import Symmetry
+from photometric_viewer.utils.symmetry import detect_symmetry, compact_grid, apply_symmetry
+from tests.fixtures.photometry import *
+
+C_ANGLES = [0, 45, 90, 135, 180, 225, 270, 315]
+GAMMA_ANGLES = [0, 45, 90]
+
+
+def _grid(intensity) -> IntensityGrid:
+    return IntensityGrid.from_mapping({
+        (c, gamma): intensity(c, gamma)
+        for c in C_ANGLES
+        for gamma in GAMMA_ANGLES
+    })
+
+
+class TestDetectSymmetry(unittest.TestCase):
+    def test_detect_symmetry(self):
+        cases = [
+            ("rotational", lambda c, gamma: 100 - gamma, Symmetry.TO_VERTICAL_AXIS),
+            ("quadrant", lambda c, gamma: 100 + abs(math.cos(math.radians(c))) * 10 - gamma, Symmetry.TO_C0_C180_C90_C270),
+            ("c0-c180", lambda c, gamma: 100 + math.cos(math.radians(c)) * 10 - gamma, Symmetry.TO_C0_C180),
+            ("c90-c270", lambda c, gamma: 100 + math.sin(math.radians(c)) * 10 - gamma, Symmetry.TO_C90_C270),
+            ("none", lambda c, gamma: 100 + c / 10 - gamma, Symmetry.NONE),
+        ]
+        for name, intensity, expected in cases:
+            with(self.subTest(name=name)):
+                self.assertEqual(detect_symmetry(_grid(intensity)), expected)
+
+    def test_tolerance(self):
+        grid = _grid(lambda c, gamma: 100 - gamma + (0.5 if c == 90 else 0))
+
+        self.assertEqual(detect_symmetry(grid), Symmetry.TO_C90_C270)
+        self.assertEqual(detect_symmetry(grid, tolerance=0.01), Symmetry.TO_VERTICAL_AXIS)
+
+    def test_partial_circle(self):
+        grid = IntensityGrid.from_mapping({(c, 0): 100 for c in [0, 45, 90]})
+        self.assertEqual(detect_symmetry(grid), Symmetry.NONE)
+
+
+class TestCompactGrid(unittest.TestCase):
+    FILES_PATH = Path(__file__).parent / ".." / "data" / "photometrics"
+
+    def test_compact_grid(self):
+        cases = [
+            (Symmetry.NONE, 8),
+            (Symmetry.TO_VERTICAL_AXIS, 1),
+            (Symmetry.TO_C0_C180, 5),
+            (Symmetry.TO_C90_C270, 5),
+            (Symmetry.TO_C0_C180_C90_C270, 3),
+        ]
+        grid = _grid(lambda c, gamma: 100 - gamma)
+        for symmetry, expected_rows in cases:
+            with(self.subTest(symmetry=symmetry)):
+                compact = compact_grid(grid, symmetry)
+                self.assertEqual(len(compact.values), expected_rows * len(GAMMA_ANGLES))
+                self.assertEqual(compact, grid)
+
+    def test_apply_symmetry(self):
+        luminaire = copy.deepcopy(ABSOLUTE_PHOTOMETRY_LUMINAIRE)
+        apply_symmetry(luminaire)
+
+        self.assertEqual(luminaire.metadata.symmetry, Symmetry.TO_VERTICAL_AXIS)
+        self.assertEqual(len(luminaire.intensity_values.values), 3)
+        self.assertEqual(luminaire.intensity_values, ABSOLUTE_PHOTOMETRY_LUMINAIRE.intensity_values)
+
+    def test_ldt_export_is_compact(self):
+        source = (self.FILES_PATH / "ldt" / "symmetry_to_c0c90c180c270.ldt").read_text()
+        luminaire = import_from_string(source)
+        luminaire.metadata.symmetry = Symmetry.NONE
+
+        with io.StringIO() as f:
+            ldt.export_to_file(f, luminaire)
+            full = f.getvalue()
+
+        apply_symmetry(luminaire)
+        with io.StringIO() as f:
+            ldt.export_to_file(f, luminaire)
+            compact = f.getvalue()
+
+        self.assertEqual(luminaire.metadata.symmetry, Symmetry.TO_C0_C180_C90_C270)
+        self.assertLess(len(compact), len(full))
+        self.assertEqual(import_from_string(compact).intensity_values, import_from_string(full).intensity_values)
+
+    def test_ldt_export_of_full_circle_with_closing_plane(self):
+        c_angles = list(range(0, 361, 15))
+        luminaire = copy.deepcopy(ABSOLUTE_PHOTOMETRY_LUMINAIRE)
+        luminaire.c_planes = c_angles
+        luminaire.intensity_values = {
+            (c, gamma): 100 + math.sin(math.radians(c)) * 50 - gamma
+            for c in c_angles
+            for gamma in ABSOLUTE_PHOTOMETRY_LUMINAIRE.gamma_angles
+        }
+        apply_symmetry(luminaire)
+
+        with io.StringIO() as f:
+            ldt.export_to_file(f, luminaire)
+            exported = import_from_string(f.getvalue())
+
+        self.assertEqual(luminaire.metadata.symmetry, Symmetry.TO_C90_C270)
+        for c in exported.intensity_values.c_angles:
+            for gamma in exported.gamma_angles:
+                with(self.subTest(c=c, gamma=gamma)):
+                    self.assertAlmostEqual(
+                        exported.intensity_values[(c, gamma)],
+                        luminaire.intensity_values[(c, gamma)],
+                        places=2
+                    )